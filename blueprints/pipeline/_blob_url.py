@@ -11,6 +11,8 @@ from urllib.parse import urlparse
 from treesight.constants import MAX_KML_FILE_SIZE_BYTES
 from treesight.errors import ContractError
 
+_KML_SUFFIXES = frozenset({".kml", ".kmz"})
+
 
 def _expected_blob_host() -> str:
     """Derive the expected Azure Blob hostname from the connection string
@@ -55,41 +57,62 @@ def _is_trusted_blob_host(host: str) -> bool:
     return host in ("127.0.0.1", "localhost", "azurite")
 
 
-def _extract_container(blob_url: str) -> str:
+def _split_blob_url(blob_url: str) -> tuple[str, str]:
+    """Return ``(container, blob_name)`` from one parse of *blob_url*.
+
+    Both parts are empty when the host is not our storage account.
+    """
     parsed = urlparse(blob_url)
     host = (parsed.hostname or "").lower()
     if not _is_trusted_blob_host(host):
-        return ""
-    if host.endswith(".blob.core.windows.net"):
-        # https://<account>.blob.core.windows.net/<container>/<blob>
-        parts = parsed.path.lstrip("/").split("/")
-        return parts[0] if parts else ""
-    # Azurite with IP: http://127.0.0.1:10000/devstoreaccount1/container/blob
+        return "", ""
     parts = parsed.path.lstrip("/").split("/")
-    if len(parts) >= 2 and parts[0] == "devstoreaccount1":
-        return parts[1]
-    return ""
+    if not host.endswith(".blob.core.windows.net"):
+        # Azurite with IP: http://127.0.0.1:10000/devstoreaccount1/container/blob
+        if parts[0] != "devstoreaccount1":
+            return "", ""
+        parts = parts[1:]
+    # https://<account>.blob.core.windows.net/<container>/<blob>
+    container = parts[0] if parts else ""
+    return container, "/".join(parts[1:])
+
+
+def _extract_container(blob_url: str) -> str:
+    return _split_blob_url(blob_url)[0]
 
 
 def _extract_blob_name(blob_url: str) -> str:
-    parsed = urlparse(blob_url)
-    host = (parsed.hostname or "").lower()
-    if not _is_trusted_blob_host(host):
-        return ""
-    if host.endswith(".blob.core.windows.net"):
-        parts = parsed.path.lstrip("/").split("/")
-        return "/".join(parts[1:]) if len(parts) > 1 else ""
-    # Azurite with IP: http://127.0.0.1:10000/devstoreaccount1/container/blob
-    parts = parsed.path.lstrip("/").split("/")
-    if len(parts) >= 3 and parts[0] == "devstoreaccount1":
-        return "/".join(parts[2:])
-    return ""
+    return _split_blob_url(blob_url)[1]
+
+
+def _has_kml_suffix(blob_name: str) -> bool:
+    """Case-insensitive ``.kml``/``.kmz`` check without lowering the whole name."""
+    return blob_name[-4:].lower() in _KML_SUFFIXES
+
+
+def _precheck_subject(subject: object) -> None:
+    """Reject from the Event Grid subject alone, before the payload is parsed.
+
+    Blob subjects look like
+    ``/blobServices/default/containers/<container>/blobs/<blob>``. Missing or
+    unrecognised subjects pass through to the full :func:`_validate_blob_event`.
+    """
+    if not isinstance(subject, str) or not subject:
+        return
+    _, sep, rest = subject.partition("/containers/")
+    container, sep_blobs, blob_name = rest.partition("/blobs/")
+    if not (sep and sep_blobs):
+        return
+    if not _has_kml_suffix(blob_name):
+        raise ContractError("Not a .kml or .kmz file", code="INVALID_FILE_TYPE")
+    if not container.endswith("-input"):
+        raise ContractError("Container must end with -input", code="INVALID_CONTAINER")
 
 
 def _validate_blob_event(blob_name: str, container_name: str, data: dict[str, Any]) -> None:
     if not blob_name:
         raise ContractError("Blob name is empty", code="EMPTY_BLOB_NAME")
-    if not (blob_name.lower().endswith(".kml") or blob_name.lower().endswith(".kmz")):
+    if not _has_kml_suffix(blob_name):
         raise ContractError("Not a .kml or .kmz file", code="INVALID_FILE_TYPE")
     if not container_name:
         raise ContractError("Container name is empty", code="EMPTY_CONTAINER_NAME")
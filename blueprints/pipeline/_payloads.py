@@ -9,6 +9,63 @@ from typing import Any
 from treesight.constants import DEFAULT_PROVIDER
 
 
+def _prepare_aoi_batch_payloads(
+    features: list[dict[str, Any]],
+    buffer_m: Any,
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Chunk features into ``prepare_aoi_batch`` activity payloads."""
+    size = max(1, batch_size)
+    return [
+        {"features": features[i : i + size], "buffer_m": buffer_m}
+        for i in range(0, len(features), size)
+    ]
+
+
+def _prepare_aoi_shard_payloads(shard_refs: list[str], buffer_m: Any) -> list[dict[str, Any]]:
+    """Build ``prepare_aoi_batch`` payloads that read features from offloaded shards."""
+    return [{"features_ref": ref, "buffer_m": buffer_m} for ref in shard_refs]
+
+
+def _write_metadata_batch_payloads(
+    aoi_refs: list[dict[str, Any]],
+    base: dict[str, Any],
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Chunk claim refs into ``write_metadata_batch`` activity payloads."""
+    size = max(1, batch_size)
+    return [
+        {**base, "aoi_refs": [ref["ref"] for ref in aoi_refs[i : i + size]]}
+        for i in range(0, len(aoi_refs), size)
+    ]
+
+
+def _download_batch_payloads(
+    downloads: list[dict[str, Any]],
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Chunk ``download_imagery`` payloads into ``download_imagery_batch`` payloads."""
+    size = max(1, batch_size)
+    return [{"downloads": downloads[i : i + size]} for i in range(0, len(downloads), size)]
+
+
+def _composite_batch_payloads(
+    aoi_refs: list[dict[str, Any]],
+    inp: dict[str, Any],
+    batch_size: int,
+) -> list[dict[str, Any]]:
+    """Chunk claim refs into ``acquire_composite_batch`` activity payloads."""
+    if not aoi_refs:
+        return []
+    base = _acq_payload(aoi_refs[0], inp, True)
+    del base["aoi_ref"]
+    size = max(1, batch_size)
+    return [
+        {**base, "aoi_refs": [ref["ref"] for ref in aoi_refs[i : i + size]]}
+        for i in range(0, len(aoi_refs), size)
+    ]
+
+
 def _collect_enrichment_coords(aois: list[dict[str, Any]]) -> list[list[float]]:
     """Extract representative coordinates from AOIs for enrichment."""
     all_coords: list[list[float]] = []
@@ -150,9 +207,10 @@ def _acq_payload(
 
 
 def _poll_payload(order: dict[str, Any], inp: dict[str, Any]) -> dict[str, Any]:
-    """Build a single poll_order activity payload."""
+    """Build a single-check poll_order activity payload (see ``_await_orders``)."""
     return {
         "order_id": order.get("order_id", ""),
+        "once": True,
         "scene_id": order.get("scene_id", ""),
         "aoi_feature_name": order.get("aoi_feature_name", ""),
         "provider_name": inp.get("provider_name", DEFAULT_PROVIDER),
@@ -186,6 +244,25 @@ def _download_payload(
     }
 
 
+def _poll_and_download_payload(
+    order: dict[str, Any],
+    inp: dict[str, Any],
+    ctx: dict[str, str],
+    aoi_ref: dict[str, str],
+    output_container: str,
+) -> dict[str, Any]:
+    """Build a single poll_and_download activity payload.
+
+    The download half is a ``download_imagery`` payload minus ``outcome``,
+    which the activity fills in from its own poll result.
+    """
+    asset_urls, order_meta = _build_order_lookups([order])
+    download = _download_payload(order, inp, ctx, asset_urls, order_meta, {}, output_container)
+    del download["outcome"]
+    download["aoi_ref"] = aoi_ref["ref"]
+    return {"poll": _poll_payload(order, inp), "download": download}
+
+
 def _post_process_payload(
     dl: dict[str, Any],
     inp: dict[str, Any],
@@ -23,8 +23,10 @@ _PHASE_RANK = {
 }
 _HISTORY_PHASE_HINTS = {
     "parse_kml": ("ingestion", "parsing_kml"),
+    "parse_and_prepare_kml": ("ingestion", "parsing_kml"),
     "load_offloaded_features": ("ingestion", "parsing_kml"),
     "prepare_aoi": ("ingestion", "preparing_aois"),
+    "prepare_aoi_batch": ("ingestion", "preparing_aois"),
     "store_aoi_claims": ("ingestion", "storing_claims"),
     "write_metadata": ("ingestion", "writing_metadata"),
     "acquire_composite": ("acquisition", "searching"),
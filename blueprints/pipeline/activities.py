@@ -9,6 +9,9 @@ instead of ``dict[str, Any]`` — the runtime cannot resolve parameterised
 generics on binding arguments.
 """
 
+import asyncio
+import contextvars
+import functools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -20,6 +23,8 @@ from . import bp
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
     _Payload = dict[str, Any]
 else:
     _Payload = dict
@@ -30,57 +35,144 @@ else:
 # ---------------------------------------------------------------------------
 
 
+def _aoi_from_dump(data: dict[str, Any]) -> Any:
+    """Rebuild an AOI from an inline dict the pipeline itself dumped.
+
+    Only for AOIs that reached this activity inside the orchestration
+    payload, straight from ``AOI.model_dump`` upstream. That dump already
+    holds validated floats and JSON keeps them floats, so re-validating
+    every coordinate pair is pure overhead; ``model_construct`` skips it
+    and does no coercion at all.  Anything read back from blob storage goes
+    through :func:`_aoi_from_claim` instead.
+    """
+    from treesight.models.aoi import AOI
+
+    return AOI.model_construct(**data)
+
+
+def _aoi_from_claim(data: dict[str, Any]) -> Any:
+    """Rebuild an AOI from a claim-check blob, validating it.
+
+    Claims live outside the orchestration history and can be rewritten
+    independently of it, so they are validated; the cost is small next to
+    the blob read that fetched them.
+    """
+    from treesight.models.aoi import AOI
+
+    return AOI.model_validate(data)
+
+
 def _load_aoi(payload: dict[str, Any], storage: Any = None) -> Any:
     """Resolve AOI from claim-check ref or inline ``aoi`` dict."""
-    from treesight.models.aoi import AOI
     from treesight.storage.client import BlobStorageClient
     from treesight.storage.offload import PayloadOffloader
 
     if payload.get("aoi_ref"):
         s = storage or BlobStorageClient()
-        data = PayloadOffloader(s).load_claim(payload["aoi_ref"])
-        return AOI.model_validate(data)
-    return AOI.model_validate(payload["aoi"])
+        return _aoi_from_claim(PayloadOffloader(s).load_claim(payload["aoi_ref"]))
+    return _aoi_from_dump(payload["aoi"])
 
 
 @bp.activity_trigger(input_name="payload")
-def parse_kml(payload: _Payload) -> list[dict[str, Any]] | dict[str, Any]:
-    if not isinstance(payload, dict):
-        raise TypeError(f"parse_kml expects dict payload, got {type(payload).__name__}")
+async def parse_kml(payload: _Payload) -> list[dict[str, Any]] | dict[str, Any]:
+    """Parse the KML blob and return its features (inline, or offloaded when large).
 
-    from treesight.models.blob_event import BlobEvent
-    from treesight.pipeline.ingestion import parse_kml_from_blob
-    from treesight.storage.client import BlobStorageClient
-    from treesight.storage.offload import PayloadOffloader
+    Async so the worker's sync thread pool is not held for the blob
+    download; the blocking download and parse run via ``to_thread``.
+    """
+    features, _ = await asyncio.to_thread(
+        _parse_kml, payload, activity="parse_kml", prepare_first=0
+    )
+    return features
 
-    logger.info(
-        "parse_kml: started correlation_id=%s",
-        payload.get("correlation_id", "unknown"),
+
+@bp.activity_trigger(input_name="payload")
+async def parse_and_prepare_kml(payload: _Payload) -> dict[str, Any]:
+    """Parse the KML and prepare the first AOI batch in the same invocation.
+
+    The first ``prepare_aoi_batch_size`` features never leave this worker,
+    saving a queue hop and a feature round-trip; small KMLs finish AOI
+    preparation here. Only the remaining features are returned (inline or
+    offloaded) for the orchestrator to fan out. Like :func:`parse_kml`, the
+    blocking download and parse run via ``to_thread``.
+    """
+    from treesight.config import config_get_int
+    from treesight.constants import DEFAULT_PREPARE_AOI_BATCH_SIZE
+    from treesight.pipeline.codec import pack_result
+
+    prepare_first = config_get_int(
+        payload, "prepare_aoi_batch_size", DEFAULT_PREPARE_AOI_BATCH_SIZE
     )
-    blob_event = BlobEvent.model_validate(payload)
-    storage = BlobStorageClient()
-    logger.info(
-        "parse_kml: parsing container=%s blob=%s",
-        blob_event.container_name,
-        blob_event.blob_name,
+    features, aois = await asyncio.to_thread(
+        _parse_kml, payload, activity="parse_and_prepare_kml", prepare_first=prepare_first
     )
-    features = parse_kml_from_blob(blob_event, storage)
-    logger.info("parse_kml: got features=%d", len(features))
+    return {"features": features, "aois": pack_result(aois)}
+
+
+def _parse_kml(
+    payload: _Payload, *, activity: str, prepare_first: int
+) -> tuple[list[dict[str, Any]] | dict[str, Any], list[dict[str, Any]]]:
+    """Parse the KML blob, prepare up to *prepare_first* AOIs, and return the rest.
+
+    Returns ``(features, aois)`` where *features* holds the unprepared
+    features — inline, or an offload ref when large.
+    """
+    if not isinstance(payload, dict):
+        raise TypeError(f"{activity} expects dict payload, got {type(payload).__name__}")
 
     from treesight.constants import MAX_FEATURES_PER_KML
+    from treesight.log import log_context
+    from treesight.models.aoi import AOI_LIST_ADAPTER
+    from treesight.models.blob_event import BlobEvent
+    from treesight.models.feature import FEATURE_LIST_ADAPTER
+    from treesight.pipeline.ingestion import parse_kml_from_blob, prepare_aois
+    from treesight.storage.client import BlobStorageClient
+    from treesight.storage.offload import PayloadOffloader
 
-    if len(features) > MAX_FEATURES_PER_KML:
-        raise ValueError(
-            f"KML contains {len(features)} features, exceeding the limit of {MAX_FEATURES_PER_KML}"
+    blob_event = BlobEvent.model_validate(payload)
+    with log_context(
+        correlation=blob_event.correlation_id,
+        activity=activity,
+        container=blob_event.container_name,
+        blob=blob_event.blob_name,
+    ):
+        logger.debug("%s: started", activity)
+        logger.info(
+            "%s: parsing container=%s blob=%s",
+            activity,
+            blob_event.container_name,
+            blob_event.blob_name,
         )
+        storage = BlobStorageClient()
+        features = parse_kml_from_blob(blob_event, storage)
+        logger.info("%s: got features=%d", activity, len(features))
+
+        if len(features) > MAX_FEATURES_PER_KML:
+            raise ValueError(
+                f"KML contains {len(features)} features, "
+                f"exceeding the limit of {MAX_FEATURES_PER_KML}"
+            )
 
-    feature_dicts = [f.model_dump() for f in features]
+        aois: list[dict[str, Any]] = []
+        if prepare_first > 0:
+            prepared = prepare_aois(features[:prepare_first], buffer_m=payload.get("buffer_m"))
+            aois = AOI_LIST_ADAPTER.dump_python(prepared)
+            features = features[prepare_first:]
 
-    offloader = PayloadOffloader(storage)
-    if offloader.should_offload(feature_dicts):
-        return offloader.offload(blob_event.correlation_id, feature_dicts)
+        feature_dicts = FEATURE_LIST_ADAPTER.dump_python(features)
+
+        offloader = PayloadOffloader(storage)
+        if offloader.should_offload(feature_dicts):
+            if prepare_first > 0:
+                # Shard at the prepare batch size: each prepare_aoi_batch
+                # reads its own slice and the orchestrator never loads the list.
+                shards = offloader.offload_shards(
+                    blob_event.correlation_id, feature_dicts, prepare_first
+                )
+                return shards, aois
+            return offloader.offload(blob_event.correlation_id, feature_dicts), aois
 
-    return feature_dicts
+        return feature_dicts, aois
 
 
 @bp.activity_trigger(input_name="payload")
@@ -99,11 +191,59 @@ def prepare_aoi(payload: _Payload) -> dict[str, Any]:
     from treesight.geo import prepare_aoi as _prepare
     from treesight.models.feature import Feature
 
-    feature = Feature.model_validate(payload["feature"])
+    # Inline features come straight from parse_kml's dump (validated floats),
+    # so skip re-validating their coordinates.
+    feature = Feature.model_construct(**payload["feature"])
     aoi = _prepare(feature, buffer_m=payload.get("buffer_m"))
     return aoi.model_dump()
 
 
+@bp.activity_trigger(input_name="payload")
+def prepare_aoi_batch(payload: _Payload) -> list[dict[str, Any]] | dict[str, str]:
+    """Prepare several AOIs in one invocation to amortise activity overhead.
+
+    Features arrive inline or, for large KMLs, as a ``features_ref`` shard
+    written by the parse activity. The AOI list is coordinate-heavy, so it is
+    returned through the ``pack_result`` envelope to keep orchestration
+    history small.
+    """
+    from treesight.models.aoi import AOI_LIST_ADAPTER
+    from treesight.models.feature import FEATURE_LIST_ADAPTER, Feature
+    from treesight.pipeline.codec import pack_result
+    from treesight.pipeline.ingestion import prepare_aois
+    from treesight.storage.client import BlobStorageClient
+    from treesight.storage.offload import PayloadOffloader
+
+    if payload.get("features_ref"):
+        # Shards are read back from blob storage: validate, as for claims.
+        raw = PayloadOffloader(BlobStorageClient()).load_all(payload["features_ref"])
+        features = FEATURE_LIST_ADAPTER.validate_python(raw)
+    else:
+        # Inline features come straight from parse_kml's dump (validated
+        # floats), so skip re-validating their coordinates.
+        features = [Feature.model_construct(**f) for f in payload["features"]]
+    aois = prepare_aois(features, buffer_m=payload.get("buffer_m"))
+    return pack_result(AOI_LIST_ADAPTER.dump_python(aois))
+
+
+def _download_source_kml(payload: dict[str, Any], storage: Any) -> bytes | None:
+    """Fetch the source KML for archiving; ``None`` when absent or unreadable."""
+    input_container = payload.get("input_container", "")
+    source_file = payload["source_file"]
+    if not (input_container and source_file):
+        return None
+    try:
+        return storage.download_bytes(input_container, source_file)
+    except Exception:
+        logger.warning(
+            "Failed to download source KML %s/%s for metadata",
+            input_container,
+            source_file,
+            exc_info=True,
+        )
+        return None
+
+
 @bp.activity_trigger(input_name="payload")
 def write_metadata(payload: _Payload) -> dict[str, Any]:
     from treesight.pipeline.ingestion import write_metadata as _write
@@ -112,32 +252,60 @@ def write_metadata(payload: _Payload) -> dict[str, Any]:
     storage = BlobStorageClient()
     aoi = _load_aoi(payload, storage)
 
-    kml_bytes: bytes | None = None
-    input_container = payload.get("input_container", "")
-    source_file = payload["source_file"]
-    if input_container and source_file:
-        try:
-            kml_bytes = storage.download_bytes(input_container, source_file)
-        except Exception:
-            logger.warning(
-                "Failed to download source KML %s/%s for metadata",
-                input_container,
-                source_file,
-                exc_info=True,
-            )
-
     return _write(
         aoi=aoi,
         processing_id=payload["processing_id"],
         timestamp=payload["timestamp"],
         tenant_id=payload.get("tenant_id", ""),
-        source_file=source_file,
+        source_file=payload["source_file"],
         output_container=payload["output_container"],
         storage=storage,
-        kml_bytes=kml_bytes,
+        kml_bytes=_download_source_kml(payload, storage),
     )
 
 
+@bp.activity_trigger(input_name="payload")
+async def write_metadata_batch(payload: _Payload) -> list[dict[str, Any]] | dict[str, Any]:
+    """Write metadata for a batch of claim-checked AOIs in one invocation.
+
+    The source KML is downloaded once per batch and archived with the first
+    AOI; every AOI in a run shares the same archive path.  Per-AOI claim
+    reads and uploads overlap on worker threads, up to
+    ``BLOB_UPLOAD_CONCURRENCY`` at a time.
+    """
+    from treesight.constants import BLOB_UPLOAD_CONCURRENCY
+    from treesight.log import log_phase
+    from treesight.pipeline.codec import pack_result
+    from treesight.pipeline.ingestion import write_metadata as _write
+    from treesight.storage.client import BlobStorageClient
+    from treesight.storage.offload import PayloadOffloader
+
+    storage = BlobStorageClient()
+    offloader = PayloadOffloader(storage)
+    kml_bytes = await asyncio.to_thread(_download_source_kml, payload, storage)
+    limit = asyncio.Semaphore(BLOB_UPLOAD_CONCURRENCY)
+
+    def _write_one(index: int, ref: str) -> dict[str, Any]:
+        return _write(
+            aoi=_aoi_from_claim(offloader.load_claim(ref)),
+            processing_id=payload["processing_id"],
+            timestamp=payload["timestamp"],
+            tenant_id=payload.get("tenant_id", ""),
+            source_file=payload["source_file"],
+            output_container=payload["output_container"],
+            storage=storage,
+            kml_bytes=kml_bytes if index == 0 else None,
+        )
+
+    async def _bounded(index: int, ref: str) -> dict[str, Any]:
+        async with limit:
+            return await asyncio.to_thread(_write_one, index, ref)
+
+    results = await asyncio.gather(*(_bounded(i, ref) for i, ref in enumerate(payload["aoi_refs"])))
+    log_phase("ingestion", "write_metadata_batch", aoi_count=len(results))
+    return pack_result(list(results))
+
+
 @bp.activity_trigger(input_name="payload")
 def store_aoi_claims(payload: _Payload) -> list[dict[str, str]]:
     """Claim-check: store AOIs in blob storage, return lightweight refs."""
@@ -167,41 +335,39 @@ def load_aoi_claim(payload: _Payload) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
-@bp.activity_trigger(input_name="payload")
-def acquire_imagery(payload: _Payload) -> dict[str, Any]:
-    from treesight.models.imagery import ImageryFilters
-    from treesight.pipeline.acquisition import acquire_imagery as _acquire
+def _payload_provider(payload: dict[str, Any]) -> Any:
+    """Return the (cached) imagery provider named by an activity payload."""
     from treesight.providers.registry import get_provider
 
-    aoi = _load_aoi(payload)
-    provider = get_provider(
+    return get_provider(
         payload.get("provider_name", DEFAULT_PROVIDER),
         payload.get("provider_config"),
     )
-    filters = (
-        ImageryFilters.model_validate(payload["imagery_filters"])
-        if payload.get("imagery_filters")
-        else ImageryFilters()
-    )
+
+
+def _search_inputs(payload: dict[str, Any]) -> tuple[Any, Any]:
+    """Resolve the provider and validated ``ImageryFilters`` for a search payload."""
+    from treesight.models.imagery import ImageryFilters
+
+    filters = ImageryFilters.model_validate(payload.get("imagery_filters") or {})
+    return _payload_provider(payload), filters
+
+
+@bp.activity_trigger(input_name="payload")
+def acquire_imagery(payload: _Payload) -> dict[str, Any]:
+    from treesight.pipeline.acquisition import acquire_imagery as _acquire
+
+    aoi = _load_aoi(payload)
+    provider, filters = _search_inputs(payload)
     return _acquire(aoi, provider, filters)
 
 
 @bp.activity_trigger(input_name="payload")
 def acquire_composite(payload: _Payload) -> list[dict[str, Any]]:
-    from treesight.models.imagery import ImageryFilters
     from treesight.pipeline.acquisition import acquire_composite as _composite
-    from treesight.providers.registry import get_provider
 
     aoi = _load_aoi(payload)
-    provider = get_provider(
-        payload.get("provider_name", DEFAULT_PROVIDER),
-        payload.get("provider_config"),
-    )
-    filters = (
-        ImageryFilters.model_validate(payload["imagery_filters"])
-        if payload.get("imagery_filters")
-        else ImageryFilters()
-    )
+    provider, filters = _search_inputs(payload)
     return _composite(
         aoi,
         provider,
@@ -210,23 +376,57 @@ def acquire_composite(payload: _Payload) -> list[dict[str, Any]]:
     )
 
 
+@bp.activity_trigger(input_name="payload")
+def acquire_composite_batch(payload: _Payload) -> list[list[dict[str, Any]]] | dict[str, Any]:
+    """Search and order composites for a batch of claim-checked AOIs.
+
+    The provider answers the whole batch with one catalogue query per
+    collection where it can; the result holds one order list per
+    ``aoi_refs`` entry, in order.
+    """
+    from treesight.pipeline.acquisition import acquire_composite_batch as _batch
+    from treesight.pipeline.codec import pack_result
+    from treesight.storage.client import BlobStorageClient
+    from treesight.storage.offload import PayloadOffloader
+
+    offloader = PayloadOffloader(BlobStorageClient())
+    aois = [_aoi_from_claim(offloader.load_claim(ref)) for ref in payload["aoi_refs"]]
+    provider, filters = _search_inputs(payload)
+    orders = _batch(aois, provider, filters, temporal_count=int(payload.get("temporal_count", 6)))
+    return pack_result(orders)
+
+
 @bp.activity_trigger(input_name="payload")
 def poll_order(payload: _Payload) -> dict[str, Any]:
+    return _poll_order(payload)
+
+
+def _poll_order(payload: dict[str, Any]) -> dict[str, Any]:
+    from treesight.log import log_context
+    from treesight.pipeline.acquisition import check_order
     from treesight.pipeline.acquisition import poll_order as _poll
-    from treesight.providers.registry import get_provider
 
-    provider = get_provider(
-        payload.get("provider_name", DEFAULT_PROVIDER),
-        payload.get("provider_config"),
-    )
-    outcome = _poll(
-        payload["order_id"],
-        provider,
-        poll_interval=config_get_int(payload.get("overrides", {}), "poll_interval_seconds", 30),
-        poll_timeout=config_get_int(payload.get("overrides", {}), "poll_timeout_seconds", 1800),
-        max_retries=config_get_int(payload.get("overrides", {}), "max_retries", 3),
-        retry_base=config_get_int(payload.get("overrides", {}), "retry_base_seconds", 5),
-    )
+    provider = _payload_provider(payload)
+    overrides = payload.get("overrides", {})
+    with log_context(
+        activity="poll_order",
+        order_id=payload["order_id"],
+        scene_id=payload.get("scene_id", ""),
+        aoi=payload.get("aoi_feature_name", ""),
+        provider=provider.name,
+    ):
+        if payload.get("once"):
+            # Orchestrator owns the wait via Durable timers (_await_orders).
+            outcome = check_order(payload["order_id"], provider)
+        else:
+            outcome = _poll(
+                payload["order_id"],
+                provider,
+                poll_interval=config_get_int(overrides, "poll_interval_seconds", 30),
+                poll_timeout=config_get_int(overrides, "poll_timeout_seconds", 1800),
+                max_retries=config_get_int(overrides, "max_retries", 3),
+                retry_base=config_get_int(overrides, "retry_base_seconds", 5),
+            )
     outcome.scene_id = payload.get("scene_id", "")
     outcome.aoi_feature_name = payload.get("aoi_feature_name", "")
     return outcome.model_dump()
@@ -237,38 +437,109 @@ def poll_order(payload: _Payload) -> dict[str, Any]:
 # ---------------------------------------------------------------------------
 
 
+@bp.activity_trigger(input_name="payload")
+def poll_and_download(payload: _Payload) -> dict[str, Any]:
+    """Poll one order and download it in the same invocation once ready.
+
+    Saves the orchestrator a ``download_imagery`` round-trip per order, and
+    each order's download starts as soon as that order is ready instead of
+    waiting for the slowest poll in the AOI.
+    """
+    outcome = _poll_order(payload["poll"])
+    if outcome.get("state") != "ready":
+        return {"outcome": outcome, "download": None}
+    download = (
+        _download_pool()
+        .submit(
+            contextvars.copy_context().run,
+            _download_imagery,
+            {**payload["download"], "outcome": outcome},
+        )
+        .result()
+    )
+    return {"outcome": outcome, "download": download}
+
+
 @bp.activity_trigger(input_name="payload")
 def download_imagery(payload: _Payload) -> dict[str, Any]:
-    from treesight.pipeline.fulfilment import download_imagery as _download
-    from treesight.providers.registry import get_provider
-    from treesight.storage.client import BlobStorageClient
+    return _download_imagery(payload)
 
-    provider = get_provider(
-        payload.get("provider_name", DEFAULT_PROVIDER),
-        payload.get("provider_config"),
+
+@bp.activity_trigger(input_name="payload")
+async def download_imagery_batch(payload: _Payload) -> list[dict[str, Any]]:
+    """Run several ``download_imagery`` payloads concurrently in one invocation.
+
+    Downloads overlap on the worker's shared download pool (see
+    :func:`_download_pool`); results keep the order of ``downloads``.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _download_pool()
+    return list(
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool, contextvars.copy_context().run, _download_imagery, download
+                )
+                for download in payload["downloads"]
+            )
+        )
     )
-    storage = BlobStorageClient()
 
-    # Resolve aoi_bbox from claim check or inline payload
-    aoi_bbox = payload.get("aoi_bbox")
-    if not aoi_bbox and payload.get("aoi_ref"):
-        aoi = _load_aoi(payload, storage)
-        aoi_bbox = aoi.buffered_bbox
 
-    return _download(
-        outcome=payload["outcome"],
-        provider=provider,
-        project_name=payload["project_name"],
-        timestamp=payload["timestamp"],
-        output_container=payload["output_container"],
-        storage=storage,
-        asset_url=payload.get("asset_url", ""),
-        aoi_bbox=aoi_bbox,
-        role=payload.get("role", ""),
-        collection=payload.get("collection", ""),
+@functools.cache
+def _download_pool() -> "ThreadPoolExecutor":
+    """Process-wide pool that every download activity on this worker shares.
+
+    Bounds concurrent downloads per worker to ``DOWNLOAD_WORKER_CONCURRENCY``
+    however many download activities the host runs at once.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from treesight.constants import DOWNLOAD_WORKER_CONCURRENCY
+
+    return ThreadPoolExecutor(
+        max_workers=DOWNLOAD_WORKER_CONCURRENCY, thread_name_prefix="download"
     )
 
 
+def _download_imagery(payload: dict[str, Any]) -> dict[str, Any]:
+    from treesight.log import log_context
+    from treesight.pipeline.fulfilment import download_imagery as _download
+    from treesight.storage.client import BlobStorageClient
+
+    provider = _payload_provider(payload)
+    storage = BlobStorageClient()
+    outcome = payload["outcome"]
+
+    # Bind the order once so every record from the transfer (COG reads,
+    # retries, completion) carries it without repeating the fields.
+    with log_context(
+        activity="download_imagery",
+        order_id=outcome.get("order_id", ""),
+        scene_id=outcome.get("scene_id", ""),
+        aoi=outcome.get("aoi_feature_name", ""),
+        provider=provider.name,
+    ):
+        # Resolve aoi_bbox from claim check or inline payload
+        aoi_bbox = payload.get("aoi_bbox")
+        if not aoi_bbox and payload.get("aoi_ref"):
+            aoi = _load_aoi(payload, storage)
+            aoi_bbox = aoi.buffered_bbox
+
+        return _download(
+            outcome=outcome,
+            provider=provider,
+            project_name=payload["project_name"],
+            timestamp=payload["timestamp"],
+            output_container=payload["output_container"],
+            storage=storage,
+            asset_url=payload.get("asset_url", ""),
+            aoi_bbox=aoi_bbox,
+            role=payload.get("role", ""),
+            collection=payload.get("collection", ""),
+        )
+
+
 @bp.activity_trigger(input_name="payload")
 def post_process_imagery(payload: _Payload) -> dict[str, Any]:
     from treesight.pipeline.fulfilment import post_process_imagery as _post_process
@@ -23,10 +23,11 @@ from . import bp
 from ._payloads import (
     _acq_payload,
     _build_order_lookups,
+    _poll_and_download_payload,
     _poll_payload,
     _split_batch_routing,
 )
-from .orchestrator import _fulfil_batch, _fulfil_download, _fulfil_post_process
+from .orchestrator import _await_orders, _fulfil_batch, _fulfil_download, _fulfil_post_process
 
 _PhaseGen = Generator[Any, Any, dict[str, Any]]
 
@@ -36,12 +37,12 @@ _PhaseGen = Generator[Any, Any, dict[str, Any]]
 # ---------------------------------------------------------------------------
 
 
-def _aoi_acquire(
+def _aoi_search(
     context: df.DurableOrchestrationContext,
     pipeline_inp: dict[str, Any],
     aoi_ref: dict[str, str],
-) -> _PhaseGen:
-    """Search for imagery and poll orders for a single AOI."""
+) -> Generator[Any, Any, list[dict[str, Any]]]:
+    """Search for imagery and place orders for a single AOI."""
     composite = bool(pipeline_inp.get("composite_search", True))
     activity = "acquire_composite" if composite else "acquire_imagery"
 
@@ -60,21 +61,25 @@ def _aoi_acquire(
     )
 
     # Normalize: composite returns list of orders, non-composite returns one
-    orders: list[dict[str, Any]] = acq_result if composite else [acq_result]
+    return acq_result if composite else [acq_result]
 
-    # Poll orders — use DF-level retry for resilience against transient failures.
-    poll_retry = df.RetryOptions(
-        first_retry_interval_in_milliseconds=ACTIVITY_RETRY_FIRST_INTERVAL_MS,
-        max_number_of_attempts=ACTIVITY_RETRY_MAX_ATTEMPTS,
-    )
-    poll_tasks = [
-        context.call_activity_with_retry("poll_order", poll_retry, _poll_payload(o, pipeline_inp))
-        for o in orders
-        if o.get("order_id")
-    ]
-    poll_results = cast(
-        "list[dict[str, Any]]",
-        (yield context.task_all(poll_tasks)) if poll_tasks else [],
+
+def _aoi_acquire(
+    context: df.DurableOrchestrationContext,
+    pipeline_inp: dict[str, Any],
+    aoi_ref: dict[str, str],
+    orders: list[dict[str, Any]] | None = None,
+) -> _PhaseGen:
+    """Search for imagery (unless *orders* were pre-searched) and poll orders for one AOI."""
+    if orders is None:
+        orders = yield from _aoi_search(context, pipeline_inp, aoi_ref)
+
+    poll_results = yield from _await_orders(
+        context,
+        "poll_order",
+        [_poll_payload(o, pipeline_inp) for o in orders if o.get("order_id")],
+        pipeline_inp,
+        {"aoi": aoi_ref["key"]},
     )
 
     ready = [r for r in poll_results if r.get("state") == "ready"]
@@ -84,11 +89,17 @@ def _aoi_acquire(
         "ready": ready,
         "asset_urls": asset_urls,
         "order_meta": order_meta,
-        "acquisition": {
-            "imagery_outcomes": poll_results,
-            "ready_count": len(ready),
-            "failed_count": len(poll_results) - len(ready),
-        },
+        "acquisition": _acquisition_summary(poll_results),
+    }
+
+
+def _acquisition_summary(poll_results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Summarise poll outcomes for aggregation."""
+    ready_count = sum(1 for r in poll_results if r.get("state") == "ready")
+    return {
+        "imagery_outcomes": poll_results,
+        "ready_count": ready_count,
+        "failed_count": len(poll_results) - ready_count,
     }
 
 
@@ -136,32 +147,86 @@ def _aoi_fulfil(
     )
     download_results = dl_result["download_results"]
     successful = [d for d in download_results if d.get("state") != "failed"]
-    failed_dl = [d for d in download_results if d.get("state") == "failed"]
 
     # Post-process
     pp_result = yield from _fulfil_post_process(
         context, successful, pipeline_inp, ctx, aoi_ref_lookup, output_container
     )
-    pp_results = pp_result["pp_results"]
+    return {"fulfilment": _fulfilment_summary(download_results, batch_tracking, pp_result)}
+
+
+def _aoi_acquire_and_fulfil(
+    context: df.DurableOrchestrationContext,
+    pipeline_inp: dict[str, Any],
+    ctx: dict[str, str],
+    aoi_ref: dict[str, str],
+    output_container: str,
+    orders: list[dict[str, Any]] | None = None,
+) -> Generator[Any, Any, tuple[dict[str, Any], dict[str, Any]]]:
+    """Serverless path: poll and download each order in one activity.
+
+    Replaces the separate ``poll_order`` and ``download_imagery`` fan-outs,
+    halving activity round-trips (and history rows) per order. Oversized
+    AOIs keep the split path because their downloads go to Azure Batch.
+    """
+    if orders is None:
+        orders = yield from _aoi_search(context, pipeline_inp, aoi_ref)
+
+    context.set_custom_status({"aoi": aoi_ref["key"], "step": "downloading"})
+    results = yield from _await_orders(
+        context,
+        "poll_and_download",
+        [
+            _poll_and_download_payload(o, pipeline_inp, ctx, aoi_ref, output_container)
+            for o in orders
+            if o.get("order_id")
+        ],
+        pipeline_inp,
+        {"aoi": aoi_ref["key"]},
+    )
+    poll_results = [r["outcome"] for r in results]
+    download_results = [r["download"] for r in results if r.get("download")]
+    successful = [d for d in download_results if d.get("state") != "failed"]
+
+    pp_result = yield from _fulfil_post_process(
+        context,
+        successful,
+        pipeline_inp,
+        ctx,
+        {aoi_ref["key"]: aoi_ref["ref"]},
+        output_container,
+    )
+    return (
+        _acquisition_summary(poll_results),
+        _fulfilment_summary(download_results, [], pp_result),
+    )
+
 
+def _fulfilment_summary(
+    download_results: list[dict[str, Any]],
+    batch_tracking: list[dict[str, Any]],
+    pp_result: dict[str, Any],
+) -> dict[str, Any]:
+    """Summarise download, Batch and post-process results for aggregation."""
+    pp_results: list[dict[str, Any]] = pp_result["pp_results"]
+    successful = [d for d in download_results if d.get("state") != "failed"]
+    failed_dl = [d for d in download_results if d.get("state") == "failed"]
     batch_ok = [t for t in batch_tracking if t.get("state") == "completed"]
     batch_bad = [t for t in batch_tracking if t.get("state") == "failed"]
 
     return {
-        "fulfilment": {
-            "download_results": download_results,
-            "downloads_completed": len(download_results) + len(batch_tracking),
-            "downloads_succeeded": len(successful) + len(batch_ok),
-            "downloads_failed": len(failed_dl) + len(batch_bad),
-            "batch_submitted": len(batch_tracking),
-            "batch_succeeded": len(batch_ok),
-            "batch_failed": len(batch_bad),
-            "post_process_results": pp_results,
-            "pp_completed": len(pp_results),
-            "pp_clipped": sum(1 for p in pp_results if p.get("clipped")),
-            "pp_reprojected": sum(1 for p in pp_results if p.get("reprojected")),
-            "pp_failed": sum(1 for p in pp_results if p.get("state") == "failed"),
-        },
+        "download_results": download_results,
+        "downloads_completed": len(download_results) + len(batch_tracking),
+        "downloads_succeeded": len(successful) + len(batch_ok),
+        "downloads_failed": len(failed_dl) + len(batch_bad),
+        "batch_submitted": len(batch_tracking),
+        "batch_succeeded": len(batch_ok),
+        "batch_failed": len(batch_bad),
+        "post_process_results": pp_results,
+        "pp_completed": len(pp_results),
+        "pp_clipped": sum(1 for p in pp_results if p.get("clipped")),
+        "pp_reprojected": sum(1 for p in pp_results if p.get("reprojected")),
+        "pp_failed": sum(1 for p in pp_results if p.get("state") == "failed"),
     }
 
 
@@ -184,19 +249,29 @@ def aoi_pipeline(context: df.DurableOrchestrationContext):  # type: ignore[retur
     aoi_area_ha: float = inp.get("aoi_area_ha", 0.0)
     aoi_name: str = aoi_ref["key"]
     output_container: str = pipeline_inp.get("output_container", DEFAULT_OUTPUT_CONTAINER)
+    # Orders pre-searched by the parent's batched composite search, if any.
+    orders: list[dict[str, Any]] | None = inp.get("orders")
+
+    from treesight.pipeline.batch import needs_batch_fallback
 
     context.set_custom_status({"aoi": aoi_name, "step": "acquiring"})
-    acq = yield from _aoi_acquire(context, pipeline_inp, aoi_ref)
+    if needs_batch_fallback(aoi_area_ha):
+        acq = yield from _aoi_acquire(context, pipeline_inp, aoi_ref, orders)
 
-    context.set_custom_status({"aoi": aoi_name, "step": "downloading"})
-    ful = yield from _aoi_fulfil(
-        context, pipeline_inp, ctx, acq, aoi_ref, aoi_area_ha, output_container
-    )
+        context.set_custom_status({"aoi": aoi_name, "step": "downloading"})
+        ful = yield from _aoi_fulfil(
+            context, pipeline_inp, ctx, acq, aoi_ref, aoi_area_ha, output_container
+        )
+        acquisition, fulfilment = acq["acquisition"], ful["fulfilment"]
+    else:
+        acquisition, fulfilment = yield from _aoi_acquire_and_fulfil(
+            context, pipeline_inp, ctx, aoi_ref, output_container, orders
+        )
 
     context.set_custom_status({"aoi": aoi_name, "step": "completed"})
 
     return {
         "aoi_name": aoi_name,
-        "acquisition": acq["acquisition"],
-        "fulfilment": ful["fulfilment"],
+        "acquisition": acquisition,
+        "fulfilment": fulfilment,
     }
@@ -4,21 +4,41 @@ NOTE: Do NOT add ``from __future__ import annotations`` to this module.
 See blueprints/pipeline/__init__.py for details.
 """
 
+import asyncio
 import logging
+import time
 import uuid
+from collections import OrderedDict
 from pathlib import PurePosixPath
 
 import azure.durable_functions as df
 import azure.functions as func
 
+from treesight.constants import BLOB_TRIGGER_DEDUP_MAX_ENTRIES, BLOB_TRIGGER_DEDUP_TTL_SECONDS
 from treesight.models.blob_event import BlobEvent
 from treesight.security.billing import get_effective_subscription, plan_capabilities
 
 from . import bp
-from ._blob_url import _extract_blob_name, _extract_container, _validate_blob_event
+from ._blob_url import _precheck_subject, _split_blob_url, _validate_blob_event
 
 logger = logging.getLogger(__name__)
 
+# (container, blob_name, etag) -> monotonic time the start was claimed.
+# Best-effort and per worker; Durable's instance-ID check remains the real guard.
+_RECENT_STARTS: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+
+
+def _claim_start(key: tuple[str, str, str], now: float) -> bool:
+    """Record *key* and return ``True`` unless it was started within the TTL."""
+    started = _RECENT_STARTS.get(key)
+    if started is not None and now - started < BLOB_TRIGGER_DEDUP_TTL_SECONDS:
+        return False
+    _RECENT_STARTS[key] = now
+    _RECENT_STARTS.move_to_end(key)
+    while len(_RECENT_STARTS) > BLOB_TRIGGER_DEDUP_MAX_ENTRIES:
+        _RECENT_STARTS.popitem(last=False)
+    return True
+
 
 def _read_submission_ticket(container_name: str, blob_name: str) -> dict | None:
     """Read the ticket blob written by SWA API or submission endpoint.
@@ -129,6 +149,15 @@ def _enrich_tier_from_billing(orchestrator_input: dict, user_id: str) -> None:
             orchestrator_input.setdefault("max_history_years", max_hist)
 
 
+def _apply_submission_ticket(orchestrator_input: dict, container_name: str, blob_name: str) -> None:
+    """Read the submission ticket (if any) and enrich the orchestrator input."""
+    # TODO: Add lifecycle policy or post-orchestration cleanup for
+    # .tickets/ blobs to prevent indefinite accumulation.
+    ticket = _read_submission_ticket(container_name, blob_name)
+    if ticket:
+        _enrich_from_ticket(orchestrator_input, ticket)
+
+
 @bp.event_grid_trigger(arg_name="event")
 @bp.durable_client_input(client_name="client")
 async def blob_trigger(
@@ -144,10 +173,12 @@ async def _process_blob_trigger(
     client: df.DurableOrchestrationClient,
 ) -> None:
     """Process a blob-created event after bindings have been resolved."""
+    # Event Grid filtering means this rarely rejects; when it does (a
+    # misconfigured subscription), fail on the subject string first.
+    _precheck_subject(event.subject)
     data = event.get_json()
     blob_url = data.get("url", "")
-    container_name = _extract_container(blob_url)
-    blob_name = _extract_blob_name(blob_url)
+    container_name, blob_name = _split_blob_url(blob_url)
 
     _validate_blob_event(blob_name, container_name, data)
 
@@ -161,6 +192,27 @@ async def _process_blob_trigger(
         correlation_id=event.id,
     )
 
+    # Event Grid delivers at least once; a redelivered event for the same
+    # blob write carries the same eTag (fall back to the event ID).
+    dedup_key = (container_name, blob_name, str(data.get("eTag") or event.id))
+    if not _claim_start(dedup_key, time.monotonic()):
+        logger.info("Skipping duplicate blob event blob=%s event=%s", blob_name, event.id)
+        return
+
+    try:
+        instance_id = await _start_orchestration(client, blob_event, data)
+    except BaseException:
+        # Release the claim so Event Grid's retry of this delivery gets through.
+        _RECENT_STARTS.pop(dedup_key, None)
+        raise
+    logger.info("Started orchestration instance=%s blob=%s", instance_id, blob_name)
+
+
+async def _start_orchestration(
+    client: df.DurableOrchestrationClient, blob_event: BlobEvent, data: dict
+) -> str:
+    """Build the orchestrator input for *blob_event*, start it, and return the instance ID."""
+    container_name, blob_name = blob_event.container_name, blob_event.blob_name
     orchestrator_input = blob_event.model_dump()
 
     safe_pipeline_keys = {"provider_name", "target_crs"}
@@ -168,12 +220,9 @@ async def _process_blob_trigger(
         if key in data and isinstance(data[key], str):
             orchestrator_input[key] = data[key]
 
-    # Read submission ticket for user metadata enrichment
-    # TODO: Add lifecycle policy or post-orchestration cleanup for
-    # .tickets/ blobs to prevent indefinite accumulation.
-    ticket = _read_submission_ticket(container_name, blob_name)
-    if ticket:
-        _enrich_from_ticket(orchestrator_input, ticket)
+    # The ticket read and billing lookup use sync SDKs; run them on a worker
+    # thread so they don't stall other async invocations sharing this loop.
+    await asyncio.to_thread(_apply_submission_ticket, orchestrator_input, container_name, blob_name)
 
     instance_id = _derive_instance_id(blob_name, blob_event.correlation_id)
     await client.start_new(
@@ -181,4 +230,4 @@ async def _process_blob_trigger(
         instance_id=instance_id,
         client_input=orchestrator_input,
     )
-    logger.info("Started orchestration instance=%s blob=%s", instance_id, blob_name)
+    return instance_id
@@ -13,6 +13,7 @@ See blueprints/pipeline/__init__.py for details.
 
 import logging
 from collections.abc import Generator
+from datetime import timedelta
 from typing import Any, cast
 
 import azure.durable_functions as df
@@ -22,19 +23,27 @@ from treesight.constants import (
     ACTIVITY_RETRY_FIRST_INTERVAL_MS,
     ACTIVITY_RETRY_MAX_ATTEMPTS,
     BATCH_POLL_INTERVAL_SECONDS,
+    BATCH_POLL_MAX_INTERVAL_SECONDS,
     DEFAULT_ACQUISITION_BATCH_SIZE,
     DEFAULT_DOWNLOAD_BATCH_SIZE,
     DEFAULT_INPUT_CONTAINER,
+    DEFAULT_MAX_RETRIES,
     DEFAULT_OUTPUT_CONTAINER,
+    DEFAULT_POLL_INTERVAL_SECONDS,
+    DEFAULT_POLL_TIMEOUT_SECONDS,
     DEFAULT_POST_PROCESS_BATCH_SIZE,
+    DEFAULT_PREPARE_AOI_BATCH_SIZE,
+    DEFAULT_WRITE_METADATA_BATCH_SIZE,
     LONG_RETRY_FIRST_INTERVAL_MS,
     LONG_RETRY_MAX_ATTEMPTS,
+    MAX_POLL_INTERVAL_SECONDS,
     MAX_POLL_ITERATIONS,
 )
+from treesight.pipeline.codec import unpack_result
 from treesight.pipeline.contracts import (
     ensure_list_of_dicts,
     ensure_nonempty_str_field,
-    ensure_parse_kml_output,
+    ensure_parse_and_prepare_output,
 )
 from treesight.pipeline.orchestrator import build_pipeline_summary, derive_project_context
 
@@ -45,10 +54,15 @@ from ._payloads import (
     _build_order_lookups,
     _collect_enrichment_coords,
     _collect_per_aoi_coords,
+    _composite_batch_payloads,
+    _download_batch_payloads,
     _download_payload,
     _poll_payload,
     _post_process_payload,
+    _prepare_aoi_batch_payloads,
+    _prepare_aoi_shard_payloads,
     _split_batch_routing,
+    _write_metadata_batch_payloads,
 )
 
 logger = logging.getLogger(__name__)
@@ -70,14 +84,25 @@ def _phase_ingestion(
     ctx: dict[str, str],
 ) -> _PhaseGen:
     """Parse KML, fan-out AOI preparation, store claims, write metadata."""
-    blob_name = inp.get("blob_name", "")
-
     context.set_custom_status({"phase": "ingestion", "step": "parsing_kml"})
-    features = ensure_parse_kml_output((yield context.call_activity("parse_kml", inp)))
+    # The parse activity also prepares the first AOI batch in-process and
+    # hands back only the features still to be prepared.
+    parsed = ensure_parse_and_prepare_output(
+        (yield context.call_activity("parse_and_prepare_kml", inp))
+    )
+    aois = ensure_list_of_dicts(unpack_result(parsed["aois"]), name="parse_and_prepare_kml")
+    features = parsed["features"]
 
+    shard_refs: list[str] = []
     if isinstance(features, list):
         feature_list = features
         offloaded = False
+    elif "shards" in features:
+        # Sharded offload: prepare activities read their own slice, so the
+        # feature list never enters orchestration history.
+        feature_list = []
+        shard_refs = features["shards"]
+        offloaded = True
     else:
         loaded = ensure_list_of_dicts(
             (yield context.call_activity("load_offloaded_features", features)),
@@ -89,17 +114,26 @@ def _phase_ingestion(
     # Gate: enforce tier's aoi_limit before expensive fan-out
     from treesight.pipeline.ingestion import enforce_aoi_limit
 
-    enforce_aoi_limit(feature_count=len(feature_list), tier=inp.get("tier"))
+    feature_count = len(aois) + len(feature_list)
+    if shard_refs:
+        feature_count += int(features["count"])
+    enforce_aoi_limit(feature_count=feature_count, tier=inp.get("tier"))
 
-    # Fan-out: prepare AOIs
+    # Fan-out: prepare the remaining AOIs in batches so large KMLs don't
+    # schedule one activity (and two history events) per feature.
     context.set_custom_status(
-        {"phase": "ingestion", "step": "preparing_aois", "features": len(feature_list)}
+        {"phase": "ingestion", "step": "preparing_aois", "features": feature_count}
     )
-    aoi_tasks = [
-        context.call_activity("prepare_aoi", {"feature": f, "buffer_m": inp.get("buffer_m")})
-        for f in feature_list
-    ]
-    aois = ensure_list_of_dicts((yield context.task_all(aoi_tasks)), name="prepare_aoi")
+    if feature_list or shard_refs:
+        prep_batch_size = config_get_int(
+            inp, "prepare_aoi_batch_size", DEFAULT_PREPARE_AOI_BATCH_SIZE
+        )
+        batches = _prepare_aoi_batch_payloads(
+            feature_list, inp.get("buffer_m"), prep_batch_size
+        ) + _prepare_aoi_shard_payloads(shard_refs, inp.get("buffer_m"))
+        aoi_tasks = [context.call_activity("prepare_aoi_batch", batch) for batch in batches]
+        for batch in (yield context.task_all(aoi_tasks)):
+            aois.extend(ensure_list_of_dicts(unpack_result(batch), name="prepare_aoi_batch"))
 
     # Claim-check: extract enrichment coords before offloading AOIs
     all_coords = _collect_enrichment_coords(aois)
@@ -120,6 +154,41 @@ def _phase_ingestion(
         if a.get("centroid") and len(a["centroid"]) == 2 and a["centroid"] != [0.0, 0.0]
     ]
 
+    # Empty KMLs skip the claim-check and metadata round-trips entirely.
+    aoi_refs: list[dict[str, Any]] = []
+    metadata_results: list[dict[str, Any]] = []
+    if aois:
+        aoi_refs, metadata_results = yield from _claim_and_describe(
+            context, inp, instance_id, ctx, aois
+        )
+
+    return {
+        "ingestion": {
+            "feature_count": feature_count,
+            "offloaded": offloaded,
+            "aoi_refs": aoi_refs,
+            "aoi_count": len(aoi_refs),
+            "metadata_results": metadata_results,
+            "metadata_count": len(metadata_results),
+        },
+        "aoi_refs": aoi_refs,
+        "all_coords": all_coords,
+        "per_aoi_coords": per_aoi_coords,
+        "aoi_area_by_name": aoi_area_by_name,
+        "aoi_centroids": aoi_centroids,
+    }
+
+
+def _claim_and_describe(
+    context: df.DurableOrchestrationContext,
+    inp: dict[str, Any],
+    instance_id: str,
+    ctx: dict[str, str],
+    aois: list[dict[str, Any]],
+) -> Generator[Any, Any, tuple[list[dict[str, Any]], list[dict[str, Any]]]]:
+    """Claim-check the AOIs and fan out metadata writes; return ``(refs, metadata)``."""
+    blob_name = inp.get("blob_name", "")
+
     # Claim-check: store full AOI dicts in blob storage, get lightweight refs
     context.set_custom_status({"phase": "ingestion", "step": "storing_claims", "aois": len(aois)})
     aoi_refs = ensure_list_of_dicts(
@@ -135,12 +204,16 @@ def _phase_ingestion(
     for index, ref in enumerate(aoi_refs):
         ensure_nonempty_str_field(ref["ref"], name="store_aoi_claims", field="ref", index=index)
         ensure_nonempty_str_field(ref["key"], name="store_aoi_claims", field="key", index=index)
-    # Fan-out: write metadata (activities retrieve AOI from claim check)
+    # Fan-out: write metadata in batches (activities retrieve AOIs from the
+    # claim check) so each AOI doesn't cost its own activity round-trip.
+    meta_batch_size = config_get_int(
+        inp, "write_metadata_batch_size", DEFAULT_WRITE_METADATA_BATCH_SIZE
+    )
     meta_tasks = [
-        context.call_activity(
-            "write_metadata",
+        context.call_activity("write_metadata_batch", batch)
+        for batch in _write_metadata_batch_payloads(
+            aoi_refs,
             {
-                "aoi_ref": ref["ref"],
                 "processing_id": instance_id,
                 "timestamp": ctx["timestamp"],
                 "tenant_id": inp.get("tenant_id", ""),
@@ -148,29 +221,15 @@ def _phase_ingestion(
                 "output_container": inp.get("output_container", DEFAULT_OUTPUT_CONTAINER),
                 "input_container": inp.get("container_name", DEFAULT_INPUT_CONTAINER),
             },
+            meta_batch_size,
         )
-        for ref in aoi_refs
     ]
-    metadata_results = ensure_list_of_dicts(
-        (yield context.task_all(meta_tasks)),
-        name="write_metadata",
-    )
-
-    return {
-        "ingestion": {
-            "feature_count": len(feature_list),
-            "offloaded": offloaded,
-            "aoi_refs": aoi_refs,
-            "aoi_count": len(aoi_refs),
-            "metadata_results": metadata_results,
-            "metadata_count": len(metadata_results),
-        },
-        "aoi_refs": aoi_refs,
-        "all_coords": all_coords,
-        "per_aoi_coords": per_aoi_coords,
-        "aoi_area_by_name": aoi_area_by_name,
-        "aoi_centroids": aoi_centroids,
-    }
+    metadata_results: list[dict[str, Any]] = []
+    for batch in (yield context.task_all(meta_tasks)):
+        metadata_results.extend(
+            ensure_list_of_dicts(unpack_result(batch), name="write_metadata_batch")
+        )
+    return aoi_refs, metadata_results
 
 
 # ---------------------------------------------------------------------------
@@ -178,6 +237,72 @@ def _phase_ingestion(
 # ---------------------------------------------------------------------------
 
 
+def _await_orders(
+    context: df.DurableOrchestrationContext,
+    activity: str,
+    payloads: list[dict[str, Any]],
+    inp: dict[str, Any],
+    status: dict[str, Any],
+) -> Generator[Any, Any, list[dict[str, Any]]]:
+    """Re-run single-check poll *activity* on a Durable timer until orders settle.
+
+    Each payload is checked once; only orders still ``pending`` are
+    re-checked, after a deterministic exponential back-off timer, so no
+    activity slot sleeps while a provider prepares an order.  Results keep
+    the order of *payloads*.  A pending check that reported a provider
+    error counts against that order's ``max_retries``; past it the order is
+    marked ``failed`` and the others carry on.  Orders still pending at
+    ``poll_timeout_seconds`` are marked ``acquisition_timeout``.
+
+    *activity* is ``poll_order`` (result is the outcome) or
+    ``poll_and_download`` (outcome under ``"outcome"``).  *status* is the
+    caller's custom status, extended with the wait step while timers run.
+    """
+    base = config_get_int(inp, "poll_interval_seconds", DEFAULT_POLL_INTERVAL_SECONDS)
+    timeout = config_get_int(inp, "poll_timeout_seconds", DEFAULT_POLL_TIMEOUT_SECONDS)
+    max_retries = config_get_int(inp, "max_retries", DEFAULT_MAX_RETRIES)
+    retry = df.RetryOptions(
+        first_retry_interval_in_milliseconds=ACTIVITY_RETRY_FIRST_INTERVAL_MS,
+        max_number_of_attempts=ACTIVITY_RETRY_MAX_ATTEMPTS,
+    )
+    start = context.current_utc_datetime
+    results: list[dict[str, Any]] = [{} for _ in payloads]
+    errors = [0] * len(payloads)
+    pending = list(range(len(payloads)))
+    attempt = 0
+    while pending:
+        tasks = [context.call_activity_with_retry(activity, retry, payloads[i]) for i in pending]
+        checked = cast("list[dict[str, Any]]", (yield context.task_all(tasks)))
+        attempt += 1
+        elapsed = (context.current_utc_datetime - start).total_seconds()
+        for i, result in zip(pending, checked, strict=True):
+            outcome = result.get("outcome", result)
+            outcome["poll_count"] = attempt
+            outcome["elapsed_seconds"] = elapsed
+            if outcome.get("state") == "pending" and outcome.get("error"):
+                errors[i] += 1
+                if errors[i] > max_retries:
+                    outcome["state"] = "failed"
+            results[i] = result
+        pending = [
+            i for i in pending if results[i].get("outcome", results[i]).get("state") == "pending"
+        ]
+        if not pending:
+            break
+
+        remaining = timeout - elapsed
+        if remaining <= 0 or attempt >= MAX_POLL_ITERATIONS:
+            for i in pending:
+                outcome = results[i].get("outcome", results[i])
+                outcome["state"] = "acquisition_timeout"
+                outcome["error"] = f"Polling timed out after {elapsed:.0f}s"
+            break
+        delay = min(MAX_POLL_INTERVAL_SECONDS, base * 2 ** (attempt - 1), remaining)
+        context.set_custom_status({**status, "step": "awaiting_orders", "pending": len(pending)})
+        yield context.create_timer(context.current_utc_datetime + timedelta(seconds=delay))
+    return results
+
+
 def _phase_acquisition(
     context: df.DurableOrchestrationContext,
     inp: dict[str, Any],
@@ -215,20 +340,14 @@ def _phase_acquisition(
         else:
             orders.extend(batch_results)
 
-    # Poll orders — use DF-level retry consistently (use the platform).
+    # Poll orders — single checks, waiting on Durable timers between rounds.
     context.set_custom_status({"phase": "acquisition", "step": "polling", "orders": len(orders)})
-    poll_retry = df.RetryOptions(
-        first_retry_interval_in_milliseconds=ACTIVITY_RETRY_FIRST_INTERVAL_MS,
-        max_number_of_attempts=ACTIVITY_RETRY_MAX_ATTEMPTS,
-    )
-    poll_tasks = [
-        context.call_activity_with_retry("poll_order", poll_retry, _poll_payload(o, inp))
-        for o in orders
-        if o.get("order_id")
-    ]
-    poll_results = cast(
-        "list[dict[str, Any]]",
-        (yield context.task_all(poll_tasks)) if poll_tasks else [],
+    poll_results = yield from _await_orders(
+        context,
+        "poll_order",
+        [_poll_payload(o, inp) for o in orders if o.get("order_id")],
+        inp,
+        {"phase": "acquisition"},
     )
 
     ready = [r for r in poll_results if r.get("state") == "ready"]
@@ -334,11 +453,13 @@ def _fulfil_batch(
 
         pending = [t for t in batch_tracking if t.get("state") not in ("completed", "failed")]
         if pending:
-            import datetime as _dt
-
-            fire_at = context.current_utc_datetime + _dt.timedelta(
-                seconds=BATCH_POLL_INTERVAL_SECONDS
+            # Deterministic exponential back-off (no jitter: orchestrator replay
+            # must compute the same timer every time).
+            delay = min(
+                BATCH_POLL_MAX_INTERVAL_SECONDS,
+                BATCH_POLL_INTERVAL_SECONDS * 2 ** (poll_iteration - 1),
             )
+            fire_at = context.current_utc_datetime + timedelta(seconds=delay)
             yield context.create_timer(fire_at)
 
     return {"batch_tracking": batch_tracking}
@@ -354,34 +475,35 @@ def _fulfil_download(
     aoi_ref_lookup: dict[str, str],
     output_container: str,
 ) -> _PhaseGen:
-    """Download serverless-tier imagery in batches."""
+    """Download serverless-tier imagery, ``download_batch_size`` orders per activity.
+
+    Each ``download_imagery_batch`` activity overlaps its downloads on the
+    worker, so the orchestrator schedules (and checkpoints) one task per
+    batch instead of one per order.
+    """
     batch_size = config_get_int(inp, "download_batch_size", DEFAULT_DOWNLOAD_BATCH_SIZE)
-    download_results: list[dict[str, Any]] = []
+    if not serverless_ready:
+        return {"download_results": []}
 
     dl_retry = df.RetryOptions(
         first_retry_interval_in_milliseconds=ACTIVITY_RETRY_FIRST_INTERVAL_MS,
         max_number_of_attempts=ACTIVITY_RETRY_MAX_ATTEMPTS,
     )
-
-    for i in range(0, len(serverless_ready), batch_size):
-        batch = serverless_ready[i : i + batch_size]
-        dl_tasks = [
-            context.call_activity_with_retry(
-                "download_imagery",
-                dl_retry,
-                _download_payload(
-                    outcome, inp, ctx, asset_urls, order_meta, aoi_ref_lookup, output_container
-                ),
-            )
-            for outcome in batch
-        ]
-        batch_results = cast(
-            "list[dict[str, Any]]",
-            (yield context.task_all(dl_tasks)),
+    downloads = [
+        _download_payload(
+            outcome, inp, ctx, asset_urls, order_meta, aoi_ref_lookup, output_container
         )
-        download_results.extend(batch_results)
-
-    return {"download_results": download_results}
+        for outcome in serverless_ready
+    ]
+    dl_tasks = [
+        context.call_activity_with_retry("download_imagery_batch", dl_retry, batch)
+        for batch in _download_batch_payloads(downloads, batch_size)
+    ]
+    batch_results = cast(
+        "list[list[dict[str, Any]]]",
+        (yield context.task_all(dl_tasks)),
+    )
+    return {"download_results": [r for batch in batch_results for r in batch]}
 
 
 def _fulfil_post_process(
@@ -683,16 +805,21 @@ def _progressive_pipeline(
         }
     )
 
+    presearched = yield from _presearch_composites(context, inp, aoi_refs)
+
     sub_tasks = []
     for i, ref in enumerate(aoi_refs):
+        sub_input: dict[str, Any] = {
+            "aoi_ref": ref,
+            "aoi_area_ha": aoi_area_by_name.get(ref["key"], 0.0),
+            "pipeline_input": inp,
+            "project_context": ctx,
+        }
+        if ref["key"] in presearched:
+            sub_input["orders"] = presearched[ref["key"]]
         task = context.call_sub_orchestrator(
             "aoi_pipeline",
-            input_={
-                "aoi_ref": ref,
-                "aoi_area_ha": aoi_area_by_name.get(ref["key"], 0.0),
-                "pipeline_input": inp,
-                "project_context": ctx,
-            },
+            input_=sub_input,
             instance_id=f"{instance_id}:aoi-{i}",
         )
         sub_tasks.append(task)
@@ -715,6 +842,40 @@ def _progressive_pipeline(
     return {"aoi_results": all_results}
 
 
+def _presearch_composites(
+    context: df.DurableOrchestrationContext,
+    inp: dict[str, Any],
+    aoi_refs: list[dict[str, str]],
+) -> Generator[Any, Any, dict[str, list[dict[str, Any]]]]:
+    """Search composites for every AOI in batches before the per-AOI fan-out.
+
+    Each ``acquire_composite_batch`` activity covers up to
+    ``acquisition_batch_size`` AOIs with one catalogue query per collection,
+    rather than one query per AOI inside each sub-orchestrator.  Returns
+    ``{aoi key: orders}``; on failure returns ``{}`` and the sub-orchestrators
+    search for themselves.
+    """
+    if not inp.get("composite_search", True):
+        return {}
+    batch_size = config_get_int(inp, "acquisition_batch_size", DEFAULT_ACQUISITION_BATCH_SIZE)
+    retry = df.RetryOptions(
+        first_retry_interval_in_milliseconds=ACTIVITY_RETRY_FIRST_INTERVAL_MS,
+        max_number_of_attempts=ACTIVITY_RETRY_MAX_ATTEMPTS,
+    )
+    tasks = [
+        context.call_activity_with_retry("acquire_composite_batch", retry, payload)
+        for payload in _composite_batch_payloads(aoi_refs, inp, batch_size)
+    ]
+    try:
+        batches = cast("list[Any]", (yield context.task_all(tasks)))
+    except Exception:
+        if not context.is_replaying:
+            logger.warning("Batched composite search failed; falling back to per-AOI search")
+        return {}
+    order_lists = [orders for batch in batches for orders in unpack_result(batch)]
+    return {ref["key"]: orders for ref, orders in zip(aoi_refs, order_lists, strict=True)}
+
+
 def _dispatch_acq_ful(
     context: df.DurableOrchestrationContext,
     inp: dict[str, Any],
@@ -723,6 +884,9 @@ def _dispatch_acq_ful(
     instance_id: str,
 ) -> Generator[Any, Any, tuple[dict[str, Any], dict[str, Any]]]:
     """Route acquisition + fulfilment: sub-orchestrators for multi-AOI, direct for single."""
+    if not ing["aoi_refs"]:
+        # Empty KML: no AOIs means nothing to search, download or process.
+        return {}, {}
     if len(ing["aoi_refs"]) > 1:
         prog = yield from _progressive_pipeline(context, inp, ctx, ing, instance_id)
         return _aggregate_aoi_results(prog["aoi_results"])
@@ -250,6 +250,81 @@ class TestPollOrder:
         assert "poll iterations" in outcome.error.lower()
 
 
+class TestPollBackoff:
+    """Pending polls back off exponentially with jitter."""
+
+    def test_poll_delay_doubles_within_jitter_band_and_caps(self) -> None:
+        from treesight.pipeline.acquisition import poll_delay
+
+        for attempt, nominal in [(0, 30), (1, 60), (2, 120), (3, 240), (4, 300), (40, 300)]:
+            delay = poll_delay(attempt, 30, cap=300)
+            assert nominal <= delay <= min(300, nominal * 1.5)
+
+    def test_sleeps_grow_between_pending_polls(self) -> None:
+        from unittest.mock import patch
+
+        from treesight.pipeline.acquisition import poll_order
+
+        provider = _StubProvider(
+            poll_sequence=[
+                OrderStatus(state="pending", is_terminal=False),
+                OrderStatus(state="pending", is_terminal=False),
+                OrderStatus(state="pending", is_terminal=False),
+                OrderStatus(state="ready", is_terminal=True),
+            ],
+        )
+        with (
+            patch("treesight.pipeline.acquisition.random.uniform", side_effect=lambda lo, hi: lo),
+            patch("treesight.pipeline.acquisition.time.sleep") as sleep,
+        ):
+            outcome = poll_order("order-bo", provider, poll_interval=10, poll_timeout=9999)
+
+        assert outcome.state == "ready"
+        assert [c.args[0] for c in sleep.call_args_list] == [10, 20, 40]
+
+
+class TestCheckOrder:
+    """``check_order`` polls once and never sleeps."""
+
+    def test_pending_order_is_reported_without_waiting(self) -> None:
+        from unittest.mock import patch
+
+        from treesight.pipeline.acquisition import check_order
+
+        provider = _StubProvider(
+            poll_sequence=[OrderStatus(state="processing", is_terminal=False)],
+        )
+        with patch("treesight.pipeline.acquisition.time.sleep") as sleep:
+            outcome = check_order("order-c", provider)
+
+        assert outcome.state == "pending"
+        assert outcome.poll_count == 1
+        sleep.assert_not_called()
+
+    def test_unknown_terminal_state_is_normalized_to_failed(self) -> None:
+        from treesight.pipeline.acquisition import check_order
+
+        provider = _StubProvider(
+            poll_sequence=[OrderStatus(state="success", is_terminal=True)],
+        )
+        outcome = check_order("order-c", provider)
+
+        assert outcome.state == "failed"
+        assert "Unsupported terminal state" in outcome.error
+
+    def test_provider_error_is_reported_as_pending_with_error(self) -> None:
+        from unittest.mock import patch
+
+        from treesight.pipeline.acquisition import check_order
+
+        provider = _StubProvider()
+        with patch.object(provider, "poll", side_effect=ConnectionError("reset")):
+            outcome = check_order("order-c", provider)
+
+        assert outcome.state == "pending"
+        assert outcome.error == "reset"
+
+
 class TestImageryOutcomeStateGuard:
     def test_is_imagery_outcome_state(self) -> None:
         """Guard accepts known literals and rejects unknown provider states."""
@@ -371,3 +446,34 @@ class TestAcquireComposite:
 
         assert len(orders) == 1
         assert orders[0]["state"] == "failed"
+
+
+class TestAcquireCompositeBatch:
+    """Tests for ``acquire_composite_batch``."""
+
+    def test_uses_batched_provider_search(self, aoi: AOI) -> None:
+        from unittest.mock import patch
+
+        from tests.stub_provider import StubPlanetaryComputerProvider
+        from treesight.pipeline.acquisition import acquire_composite_batch
+
+        provider = StubPlanetaryComputerProvider()
+        other = aoi.model_copy(update={"feature_name": "Other"})
+        with patch.object(
+            provider, "composite_search_many", wraps=provider.composite_search_many
+        ) as many:
+            batches = acquire_composite_batch([aoi, other], provider, ImageryFilters())
+
+        many.assert_called_once()
+        assert len(batches) == 2
+        assert {o["aoi_feature_name"] for o in batches[1]} == {"Other"}
+        assert all(o.get("order_id") for b in batches for o in b)
+
+    def test_falls_back_per_aoi(self, aoi: AOI) -> None:
+        """Providers without a batched search are searched AOI by AOI."""
+        from treesight.pipeline.acquisition import acquire_composite_batch
+
+        provider = _StubProvider(search_results=[])
+        batches = acquire_composite_batch([aoi, aoi], provider, ImageryFilters())
+
+        assert [b[0]["state"] for b in batches] == ["failed", "failed"]
@@ -934,6 +934,11 @@ class TestAnalysisSubmissionRoutes:
 
 
 class TestBlobTriggerIngress:
+    def setup_method(self) -> None:
+        from blueprints.pipeline.blob_trigger import _RECENT_STARTS
+
+        _RECENT_STARTS.clear()
+
     def _make_blob_event(self, blob_name: str, event_id: str) -> MagicMock:
         event = MagicMock()
         event.id = event_id
@@ -1089,6 +1094,122 @@ class TestBlobTriggerIngress:
         assert len(client.calls) == 1
         assert client.calls[0]["client_input"]["blob_name"] == f"analysis/{sub_id}.kmz"
 
+    def test_blob_trigger_reads_ticket_off_the_event_loop_thread(self):
+        """Sync ticket/billing I/O runs in a worker thread, not on the event loop."""
+        import threading
+
+        from blueprints.pipeline.blob_trigger import _process_blob_trigger
+
+        client = _FakeDurableClient()
+        event = self._make_blob_event("uploads/thread-check.kml", "evt-thread")
+        seen: dict[str, int] = {}
+
+        def _fake_read(_container: str, _blob: str) -> None:
+            seen["reader"] = threading.get_ident()
+
+        async def _run() -> None:
+            seen["loop"] = threading.get_ident()
+            await _process_blob_trigger(event, client)
+
+        with patch("blueprints.pipeline.blob_trigger._read_submission_ticket", _fake_read):
+            asyncio.run(_run())
+
+        assert seen["reader"] != seen["loop"]
+        assert len(client.calls) == 1
+
+    def test_redelivered_event_for_same_blob_write_starts_once(self):
+        from blueprints.pipeline.blob_trigger import _process_blob_trigger
+
+        client = _FakeDurableClient()
+        first = self._make_blob_event("uploads/dup.kml", "evt-a")
+        second = self._make_blob_event("uploads/dup.kml", "evt-b")
+        for event in (first, second):
+            event.get_json.return_value["eTag"] = "0x8DC0FFEE"
+
+        with patch("blueprints.pipeline.blob_trigger._read_submission_ticket", return_value=None):
+            asyncio.run(_process_blob_trigger(first, client))
+            asyncio.run(_process_blob_trigger(second, client))
+
+        assert [c["instance_id"] for c in client.calls] == ["evt-a"]
+
+    def test_new_etag_for_same_blob_starts_again(self):
+        from blueprints.pipeline.blob_trigger import _process_blob_trigger
+
+        client = _FakeDurableClient()
+        first = self._make_blob_event("uploads/rewrite.kml", "evt-1")
+        second = self._make_blob_event("uploads/rewrite.kml", "evt-2")
+        first.get_json.return_value["eTag"] = "0x1"
+        second.get_json.return_value["eTag"] = "0x2"
+
+        with patch("blueprints.pipeline.blob_trigger._read_submission_ticket", return_value=None):
+            asyncio.run(_process_blob_trigger(first, client))
+            asyncio.run(_process_blob_trigger(second, client))
+
+        assert len(client.calls) == 2
+
+    def test_failed_start_releases_claim_for_retry(self):
+        import pytest
+
+        from blueprints.pipeline.blob_trigger import _process_blob_trigger
+
+        class _FlakyClient(_FakeDurableClient):
+            async def start_new(self, name, instance_id, client_input):
+                if not self.calls and not getattr(self, "failed", False):
+                    self.failed = True
+                    raise RuntimeError("task hub unavailable")
+                return await super().start_new(name, instance_id, client_input)
+
+        client = _FlakyClient()
+        event = self._make_blob_event("uploads/retry.kml", "evt-retry")
+
+        with patch("blueprints.pipeline.blob_trigger._read_submission_ticket", return_value=None):
+            with pytest.raises(RuntimeError):
+                asyncio.run(_process_blob_trigger(event, client))
+            asyncio.run(_process_blob_trigger(event, client))
+
+        assert len(client.calls) == 1
+
+    def test_claim_window_evicts_oldest_and_expires(self):
+        from blueprints.pipeline import blob_trigger
+
+        with patch.object(blob_trigger, "BLOB_TRIGGER_DEDUP_MAX_ENTRIES", 2):
+            assert blob_trigger._claim_start(("c", "a", "1"), 0.0)
+            assert blob_trigger._claim_start(("c", "b", "1"), 1.0)
+            assert blob_trigger._claim_start(("c", "c", "1"), 2.0)
+        assert ("c", "a", "1") not in blob_trigger._RECENT_STARTS
+
+        ttl = blob_trigger.BLOB_TRIGGER_DEDUP_TTL_SECONDS
+        assert not blob_trigger._claim_start(("c", "b", "1"), 1.0 + ttl - 1)
+        assert blob_trigger._claim_start(("c", "b", "1"), 1.0 + ttl)
+
+    def test_non_kml_subject_rejected_before_payload_parse(self):
+        import pytest
+
+        from blueprints.pipeline.blob_trigger import _process_blob_trigger
+        from treesight.errors import ContractError
+
+        client = _FakeDurableClient()
+        event = self._make_blob_event("uploads/photo.png", "evt-png")
+        event.subject = "/blobServices/default/containers/kml-input/blobs/uploads/photo.png"
+
+        with pytest.raises(ContractError, match=r"Not a \.kml"):
+            asyncio.run(_process_blob_trigger(event, client))
+
+        event.get_json.assert_not_called()
+        assert client.calls == []
+
+    def test_subject_precheck_defers_on_unrecognised_subjects(self):
+        import pytest
+
+        from blueprints.pipeline._blob_url import _precheck_subject
+        from treesight.errors import ContractError
+
+        _precheck_subject(None)
+        _precheck_subject("custom-subject")
+        _precheck_subject("/blobServices/default/containers/kml-input/blobs/a/Farm.KMZ")
+        with pytest.raises(ContractError, match="-input"):
+            _precheck_subject("/blobServices/default/containers/kml-output/blobs/a.kml")
+
 
 class TestDeriveInstanceId:
     """Unit tests for _derive_instance_id (pure function)."""
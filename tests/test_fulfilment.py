@@ -182,21 +182,138 @@ class TestFetchFunctionsLiveHostStubGating:
         with pytest.raises(RuntimeError, match="real cog path executed"):
             cog_windowed_read(self._BOGUS_URL, self._BBOX)
 
+    def test_cog_windowed_read_fetches_tiles_on_gdal_thread_pool(self, monkeypatch):
+        from treesight.constants import RASTER_READ_NUM_THREADS
+        from treesight.pipeline.fulfilment import cog_windowed_read
+
+        monkeypatch.delenv("CANOPEX_TEST_MODE", raising=False)
+
+        import rasterio
+
+        seen: dict[str, object] = {}
+
+        class _CaptureOpen:
+            def __enter__(self):
+                seen.update(rasterio.env.getenv())
+                raise RuntimeError("captured")
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+        monkeypatch.setattr(rasterio, "open", lambda *args, **kwargs: _CaptureOpen())
+        with pytest.raises(RuntimeError, match="captured"):
+            cog_windowed_read(self._BOGUS_URL, self._BBOX)
+
+        assert seen["GDAL_NUM_THREADS"] == RASTER_READ_NUM_THREADS
+        assert seen["GDAL_HTTP_MULTIPLEX"] == "YES"
+
+
+class TestIterAssetChunks:
+    """Full-asset fallback: parallel ranged GETs when the server supports them."""
+
+    _URL = "https://assets.example.com/scene.tif"
+    _BODY = bytes(range(256)) * 40  # 10 240 bytes
+
+    @staticmethod
+    def _patch_client(monkeypatch, handler) -> None:
+        import httpx
+
+        real_client = httpx.Client
+        monkeypatch.setattr(
+            httpx,
+            "Client",
+            lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+        )
+
+    def _ranged(self, request):
+        import httpx
+
+        start, end = map(int, request.headers["range"].removeprefix("bytes=").split("-"))
+        end = min(end, len(self._BODY) - 1)
+        return httpx.Response(
+            206,
+            content=self._BODY[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(self._BODY)}"},
+        )
+
+    def test_fetches_remaining_ranges_in_order(self, monkeypatch):
+        from treesight.pipeline.fulfilment import iter_asset_chunks
+
+        monkeypatch.delenv("CANOPEX_TEST_MODE", raising=False)
+        ranges: list[str] = []
+
+        def handler(request):
+            ranges.append(request.headers["range"])
+            return self._ranged(request)
+
+        self._patch_client(monkeypatch, handler)
+        chunks = list(iter_asset_chunks(self._URL, chunk_size=1024))
+
+        assert b"".join(chunks) == self._BODY
+        assert len(chunks) == 10
+        assert sorted(ranges) == sorted(f"bytes={o}-{o + 1023}" for o in range(0, 10240, 1024))
+
+    def test_streams_whole_body_when_ranges_ignored(self, monkeypatch):
+        import httpx
+
+        from treesight.pipeline.fulfilment import iter_asset_chunks
+
+        monkeypatch.delenv("CANOPEX_TEST_MODE", raising=False)
+        calls: list[httpx.Request] = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, content=self._BODY)
+
+        self._patch_client(monkeypatch, handler)
+
+        assert b"".join(iter_asset_chunks(self._URL, chunk_size=1024)) == self._BODY
+        assert len(calls) == 1
+
+    def test_rejects_range_not_honoured_mid_transfer(self, monkeypatch):
+        import httpx
+
+        from treesight.pipeline.fulfilment import iter_asset_chunks
+
+        monkeypatch.delenv("CANOPEX_TEST_MODE", raising=False)
+
+        def handler(request):
+            if request.headers["range"].startswith("bytes=0-"):
+                return self._ranged(request)
+            return httpx.Response(200, content=self._BODY)
+
+        self._patch_client(monkeypatch, handler)
+
+        with pytest.raises(ValueError, match="not honoured"):
+            list(iter_asset_chunks(self._URL, chunk_size=1024))
+
 
 class TestDownloadImagery:
     """Tests for ``download_imagery``."""
 
+    @staticmethod
+    def _streaming_storage() -> MagicMock:
+        """Return a MagicMock storage whose ``upload_chunks`` drains the iterator."""
+        storage = MagicMock()
+
+        def _drain(container, blob_path, chunks, content_type="application/octet-stream", **kwargs):
+            size = sum(len(c) for c in chunks)
+            return f"https://blob.example/{container}/{blob_path}", size
+
+        storage.upload_chunks.side_effect = _drain
+        return storage
+
     def test_uploads_blob_to_expected_path(self) -> None:
         """Downloaded imagery is uploaded with the correct path pattern."""
         from treesight.pipeline.fulfilment import download_imagery
 
-        storage = MagicMock()
+        storage = self._streaming_storage()
         provider = _StubProvider()
         outcome = _ready_outcome()
 
         with patch(
-            "treesight.pipeline.fulfilment.fetch_asset_bytes",
-            return_value=_make_geotiff_bytes(),
+            "treesight.pipeline.fulfilment.iter_asset_chunks",
+            return_value=iter([_make_geotiff_bytes()]),
         ):
             download_imagery(
                 outcome=outcome,
@@ -208,22 +325,46 @@ class TestDownloadImagery:
                 asset_url="https://stub.example.com/test.tif",
             )
 
-        storage.upload_bytes.assert_called_once()
-        call_args = storage.upload_bytes.call_args[0]
+        storage.upload_chunks.assert_called_once()
+        storage.upload_bytes.assert_not_called()
+        call_args = storage.upload_chunks.call_args[0]
         assert call_args[0] == "kml-output"  # container
         assert "imagery/raw/my-farm/" in call_args[1]  # path includes project
         assert call_args[1].endswith(".tif")
 
+    def test_piped_download_splits_read_ahead_between_stages(self) -> None:
+        from treesight.constants import ASSET_PIPE_READ_AHEAD
+        from treesight.pipeline.fulfilment import download_imagery
+
+        storage = self._streaming_storage()
+        with patch(
+            "treesight.pipeline.fulfilment.iter_asset_chunks",
+            return_value=iter([_make_geotiff_bytes()]),
+        ) as chunks:
+            download_imagery(
+                outcome=_ready_outcome(),
+                provider=_StubProvider(),
+                project_name="farm",
+                timestamp="ts",
+                output_container="kml-output",
+                storage=storage,
+                asset_url="https://stub.example.com/test.tif",
+            )
+
+        assert chunks.call_args.kwargs["concurrency"] == ASSET_PIPE_READ_AHEAD
+        assert storage.upload_chunks.call_args.kwargs["max_in_flight"] == ASSET_PIPE_READ_AHEAD
+
     def test_result_contains_download_fields(self) -> None:
         """The result dict includes order_id, blob_path, size_bytes."""
         from treesight.pipeline.fulfilment import download_imagery
 
-        storage = MagicMock()
+        storage = self._streaming_storage()
         provider = _StubProvider()
+        payload = _make_geotiff_bytes()
 
         with patch(
-            "treesight.pipeline.fulfilment.fetch_asset_bytes",
-            return_value=_make_geotiff_bytes(),
+            "treesight.pipeline.fulfilment.iter_asset_chunks",
+            return_value=iter([payload[:100], payload[100:]]),
         ):
             result = download_imagery(
                 outcome=_ready_outcome(),
@@ -239,7 +380,7 @@ class TestDownloadImagery:
         assert result["scene_id"] == "SCENE-001"
         assert result["blob_path"].endswith(".tif")
         assert result["container"] == "kml-output"
-        assert result["size_bytes"] > 0  # valid stub GeoTIFF bytes
+        assert result["size_bytes"] == len(payload)
 
     def test_provider_error_returns_failed(self) -> None:
         """A provider download failure is captured gracefully."""
@@ -261,6 +402,185 @@ class TestDownloadImagery:
         assert "Network timeout" in result["error"]
         storage.upload_bytes.assert_not_called()
 
+    def test_transient_transfer_error_is_retried_with_backoff(self) -> None:
+        import httpx
+
+        from treesight.pipeline.fulfilment import download_imagery
+
+        storage = MagicMock()
+        storage.upload_bytes.side_effect = [httpx.ConnectError("reset"), None]
+
+        with (
+            patch("treesight.pipeline.fulfilment.cog_windowed_read", return_value=b"tif"),
+            patch("treesight.pipeline.fulfilment.random.uniform", side_effect=lambda lo, hi: hi),
+            patch("treesight.pipeline.fulfilment.time.sleep") as sleep,
+        ):
+            result = download_imagery(
+                outcome=_ready_outcome(),
+                provider=_StubProvider(),
+                project_name="farm",
+                timestamp="ts",
+                output_container="kml-output",
+                storage=storage,
+                asset_url="https://stub.example.com/test.tif",
+                aoi_bbox=[0.0, 0.0, 1.0, 1.0],
+                retry_base=2,
+            )
+
+        assert result["state"] != "failed"
+        assert result["retry_count"] == 1
+        sleep.assert_called_once_with(2)
+
+    @pytest.mark.parametrize("retryable", [True, False])
+    def test_provider_error_retry_follows_retryable_flag(self, retryable: bool) -> None:
+        from treesight.errors import ProviderDownloadError
+        from treesight.pipeline.fulfilment import _transfer_with_retry
+
+        transfer = MagicMock(side_effect=[ProviderDownloadError("busy", retryable=retryable), 7])
+
+        with patch("treesight.pipeline.fulfilment.time.sleep"):
+            if retryable:
+                assert _transfer_with_retry(transfer, "o1", max_retries=2, retry_base=1) == (7, 1)
+            else:
+                with pytest.raises(ProviderDownloadError):
+                    _transfer_with_retry(transfer, "o1", max_retries=2, retry_base=1)
+
+    @pytest.mark.parametrize(
+        ("status", "expected"), [(408, True), (429, True), (503, True), (404, False), (501, False)]
+    )
+    def test_http_status_classification(self, status: int, expected: bool) -> None:
+        import httpx
+
+        from treesight.pipeline.fulfilment import _is_transient
+
+        request = httpx.Request("GET", "https://stub.example.com/test.tif")
+        exc = httpx.HTTPStatusError(
+            "err", request=request, response=httpx.Response(status, request=request)
+        )
+
+        assert _is_transient(exc) is expected
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("HTTP response code: 404", False),
+            ("HTTP response code: 403", False),
+            (
+                "'/vsicurl/https://x/a.tif' not recognized as being in a supported file format.",
+                False,
+            ),
+            ("HTTP response code: 503", True),
+            ("CURL error: Could not resolve host: x", True),
+            ("Operation timed out after 30000 milliseconds", True),
+        ],
+    )
+    def test_gdal_error_classification(self, message: str, expected: bool) -> None:
+        from rasterio.errors import RasterioIOError
+
+        from treesight.pipeline.fulfilment import _is_transient
+
+        assert _is_transient(RasterioIOError(message)) is expected
+
+    def test_missing_cog_is_not_retried(self) -> None:
+        from rasterio.errors import RasterioIOError
+
+        from treesight.pipeline.fulfilment import _transfer_with_retry
+
+        transfer = MagicMock(side_effect=RasterioIOError("HTTP response code: 404"))
+
+        with (
+            patch("treesight.pipeline.fulfilment.time.sleep") as sleep,
+            pytest.raises(RasterioIOError),
+        ):
+            _transfer_with_retry(transfer, "o1", max_retries=3, retry_base=5)
+
+        transfer.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_unflagged_provider_error_with_transient_cause_is_retried(self) -> None:
+        import httpx
+
+        from treesight.errors import ProviderAuthError, ProviderDownloadError
+        from treesight.pipeline.fulfilment import _is_transient
+
+        try:
+            raise ProviderDownloadError("fetch failed") from httpx.ConnectError("reset")
+        except ProviderDownloadError as exc:
+            assert _is_transient(exc)
+        try:
+            raise ProviderAuthError("denied") from ValueError("bad token")
+        except ProviderAuthError as exc:
+            assert not _is_transient(exc)
+        assert _is_transient(TimeoutError("read timed out"))
+
+    def test_retry_wait_is_capped(self) -> None:
+        import httpx
+
+        from treesight.constants import MAX_RETRY_BACKOFF_SECONDS
+        from treesight.pipeline.fulfilment import _transfer_with_retry
+
+        transfer = MagicMock(side_effect=[httpx.ConnectError("reset")] * 3 + [1])
+
+        with (
+            patch("treesight.pipeline.fulfilment.random.uniform", side_effect=lambda lo, hi: hi),
+            patch("treesight.pipeline.fulfilment.time.sleep") as sleep,
+        ):
+            _transfer_with_retry(transfer, "o1", max_retries=3, retry_base=20)
+
+        assert [c.args[0] for c in sleep.call_args_list] == [
+            20,
+            MAX_RETRY_BACKOFF_SECONDS,
+            MAX_RETRY_BACKOFF_SECONDS,
+        ]
+
+    def test_permanent_transfer_error_is_not_retried(self) -> None:
+        from treesight.pipeline.fulfilment import download_imagery
+
+        storage = MagicMock()
+        storage.upload_bytes.side_effect = ValueError("bad raster")
+
+        with (
+            patch("treesight.pipeline.fulfilment.cog_windowed_read", return_value=b"tif"),
+            patch("treesight.pipeline.fulfilment.time.sleep") as sleep,
+        ):
+            result = download_imagery(
+                outcome=_ready_outcome(),
+                provider=_StubProvider(),
+                project_name="farm",
+                timestamp="ts",
+                output_container="kml-output",
+                storage=storage,
+                asset_url="https://stub.example.com/test.tif",
+                aoi_bbox=[0.0, 0.0, 1.0, 1.0],
+            )
+
+        assert result["state"] == "failed"
+        storage.upload_bytes.assert_called_once()
+        sleep.assert_not_called()
+
+    def test_duration_is_reported_to_the_millisecond(self) -> None:
+        from treesight.pipeline.fulfilment import download_imagery
+
+        with (
+            patch("treesight.pipeline.fulfilment.cog_windowed_read", return_value=b"tif"),
+            patch(
+                "treesight.pipeline.fulfilment.time.perf_counter_ns",
+                side_effect=[0, 1_234_567_891],
+            ),
+        ):
+            result = download_imagery(
+                outcome=_ready_outcome(),
+                provider=_StubProvider(),
+                project_name="farm",
+                timestamp="ts",
+                output_container="kml-output",
+                storage=MagicMock(),
+                asset_url="https://stub.example.com/test.tif",
+                aoi_bbox=[0.0, 0.0, 1.0, 1.0],
+            )
+
+        assert result["download_duration_seconds"] == 1.234
+
 
 # ---------------------------------------------------------------------------
 # post_process_imagery
@@ -287,6 +607,7 @@ class TestPostProcessImagery:
         """Return a MagicMock storage whose ``download_bytes`` returns a valid GeoTIFF."""
         storage = MagicMock()
         storage.download_bytes.return_value = _make_geotiff_bytes()
+        storage.copy_blob.return_value = 4096
         return storage
 
     def test_clipping_uploads_clipped_blob(self, aoi: AOI) -> None:
@@ -311,7 +632,7 @@ class TestPostProcessImagery:
         storage.upload_bytes.assert_called_once()
 
     def test_no_clipping_no_upload(self, aoi: AOI) -> None:
-        """With clipping disabled, the raw bytes are still uploaded (passthrough)."""
+        """With nothing to transform, the raw blob is copied server-side (passthrough)."""
         from treesight.pipeline.fulfilment import post_process_imagery
 
         storage = self._mock_storage()
@@ -328,8 +649,38 @@ class TestPostProcessImagery:
         )
 
         assert result["clipped"] is False
-        # Passthrough still writes the output
-        storage.upload_bytes.assert_called_once()
+        # Passthrough still writes the output, without moving the bytes
+        storage.copy_blob.assert_called_once_with(
+            "kml-output",
+            self._download_result()["blob_path"],
+            "kml-output",
+            result["clipped_blob_path"],
+        )
+        storage.download_bytes.assert_not_called()
+        storage.upload_bytes.assert_not_called()
+
+    def test_passthrough_does_not_decode_raster(self, aoi: AOI) -> None:
+        """With nothing to clip or reproject, the GeoTIFF is never opened."""
+        from unittest.mock import patch
+
+        from treesight.pipeline.fulfilment import post_process_imagery
+
+        storage = self._mock_storage()
+        with patch("rasterio.io.MemoryFile", side_effect=AssertionError("decoded raster")):
+            result = post_process_imagery(
+                download_result=self._download_result(),
+                aoi=aoi,
+                project_name="farm",
+                timestamp="ts",
+                target_crs="EPSG:32637",
+                enable_clipping=False,
+                enable_reprojection=False,
+                output_container="kml-output",
+                storage=storage,
+            )
+
+        assert result["state"] != "failed"
+        assert result["output_size_bytes"] == result["source_size_bytes"]
 
     def test_reprojection_flag(self, aoi: AOI) -> None:
         """Reprojection is flagged when source and target CRS differ."""
@@ -350,6 +701,33 @@ class TestPostProcessImagery:
 
         assert result["reprojected"] is True
 
+    def test_reprojected_output_is_tiled_lzw(self, aoi: AOI) -> None:
+        """Warped output is written as a tiled, LZW-compressed GeoTIFF in the target CRS."""
+        import rasterio
+        from rasterio.io import MemoryFile
+
+        from treesight.pipeline.fulfilment import post_process_imagery
+
+        storage = self._mock_storage()
+        post_process_imagery(
+            download_result=self._download_result(),
+            aoi=aoi,
+            project_name="farm",
+            timestamp="ts",
+            target_crs="EPSG:4326",
+            enable_clipping=False,
+            enable_reprojection=True,
+            output_container="kml-output",
+            storage=storage,
+        )
+
+        written = storage.upload_bytes.call_args[0][2]
+        with MemoryFile(written) as memfile, memfile.open() as dst:
+            assert dst.crs == rasterio.crs.CRS.from_epsg(4326)
+            assert dst.profile["tiled"] is True
+            assert dst.compression == rasterio.enums.Compression.lzw
+            assert dst.read().any()
+
     def test_same_crs_skips_reprojection(self, aoi: AOI) -> None:
         """No reprojection when source and target CRS match."""
         from treesight.pipeline.fulfilment import post_process_imagery
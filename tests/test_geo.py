@@ -11,6 +11,7 @@ from treesight.geo import (
     _geodesic_area_and_perimeter,
     cluster_aois,
     prepare_aoi,
+    prepare_aois,
 )
 from treesight.models.aoi import AOI
 from treesight.models.feature import Feature
@@ -84,6 +85,17 @@ class TestCentroid:
         assert c[1] == pytest.approx(5.0, abs=0.5)
 
 
+class TestPrepareAOIs:
+    def test_batch_matches_per_feature(self, sample_feature: Feature):
+        features = [
+            sample_feature,
+            Feature(name="Empty"),
+            Feature(name="Line", exterior_coords=[[1.0, 1.0], [2.0, 2.0]]),
+        ]
+        batch = prepare_aois(features, buffer_m=150)
+        assert batch == [prepare_aoi(f, buffer_m=150) for f in features]
+
+
 class TestPrepareAOI:
     def test_returns_aoi(self, sample_feature: Feature):
         aoi = prepare_aoi(sample_feature)
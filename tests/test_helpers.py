@@ -325,6 +325,132 @@ class TestSafeBlobPath:
         assert _safe_blob_path("demo-submissions/abc123.json") == "demo-submissions/abc123.json"
 
 
+class TestBlobServiceClientSingleton:
+    """The shared BlobServiceClient is built once per worker with tuned transfers."""
+
+    def test_builds_client_once_with_transfer_options(self, monkeypatch: pytest.MonkeyPatch):
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        factory = MagicMock()
+        monkeypatch.setattr(storage_client, "_client", None)
+        monkeypatch.setattr(
+            storage_client, "STORAGE_CONNECTION_STRING", "UseDevelopmentStorage=true"
+        )
+        monkeypatch.setattr(storage_client.BlobServiceClient, "from_connection_string", factory)
+
+        first = storage_client.get_blob_service_client()
+        second = storage_client.get_blob_service_client()
+
+        assert first is second
+        factory.assert_called_once()
+        kwargs = factory.call_args.kwargs
+        assert kwargs["max_chunk_get_size"] == storage_client.BLOB_MAX_CHUNK_GET_SIZE_BYTES
+        assert kwargs["connection_timeout"] == storage_client.BLOB_CONNECTION_TIMEOUT_SECONDS
+
+    def test_explicit_connection_string_clients_are_shared(self):
+        from treesight.storage import client as storage_client
+
+        storage_client._blob_service_client_for.cache_clear()
+        try:
+            a = storage_client.BlobStorageClient("UseDevelopmentStorage=true")
+            b = storage_client.BlobStorageClient("UseDevelopmentStorage=true")
+            assert a._client is b._client
+        finally:
+            storage_client._blob_service_client_for.cache_clear()
+
+    def test_transport_pool_is_sized_for_fan_out(self):
+        from azure.core.pipeline.transport import RequestsTransport
+
+        from treesight.storage import client as storage_client
+
+        transport = storage_client._pooled_transport()
+
+        assert isinstance(transport, RequestsTransport)
+        adapter = transport.session.get_adapter("https://acct.blob.core.windows.net/")
+        assert adapter._pool_maxsize == storage_client.BLOB_HTTP_POOL_MAXSIZE
+
+
+class TestUploadChunks:
+    """``upload_chunks`` stages one block per chunk and commits them in order."""
+
+    def test_stages_blocks_and_commits_list(self, monkeypatch: pytest.MonkeyPatch):
+        import base64
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        service = MagicMock()
+        blob = service.get_blob_client.return_value
+        blob.url = "https://acct.blob/kml-output/raw/a.tif"
+        monkeypatch.setattr(storage_client, "get_blob_service_client", lambda: service)
+        monkeypatch.setattr(storage_client.BlobStorageClient, "_known_containers", {"kml-output"})
+
+        storage = storage_client.BlobStorageClient()
+        url, size = storage.upload_chunks(
+            "kml-output", "raw/a.tif", iter([b"abc", b"", b"defg"]), content_type="image/tiff"
+        )
+
+        assert url == blob.url
+        assert size == 7
+        # Blocks stage concurrently; the committed id order is what matters.
+        staged = sorted(c.args for c in blob.stage_block.call_args_list)
+        assert [data for _, data in staged] == [b"abc", b"defg"]
+        ids = [block_id for block_id, _ in staged]
+        assert [base64.b64decode(i) for i in ids] == [b"00000000", b"00000001"]
+        committed = blob.commit_block_list.call_args
+        assert committed.args[0] == ids
+        assert committed.kwargs["content_settings"].content_type == "image/tiff"
+
+    def test_staging_overlaps_reading_next_chunk(self, monkeypatch: pytest.MonkeyPatch):
+        import threading
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        service = MagicMock()
+        blob = service.get_blob_client.return_value
+        monkeypatch.setattr(storage_client, "get_blob_service_client", lambda: service)
+        monkeypatch.setattr(storage_client.BlobStorageClient, "_known_containers", {"c"})
+
+        first_staged = threading.Event()
+        second_read = threading.Event()
+
+        def _stage(block_id: str, data: bytes) -> None:
+            if data == b"a":
+                # Serial staging would never reach the second chunk.
+                assert second_read.wait(timeout=5)
+            first_staged.set()
+
+        def _chunks():
+            yield b"a"
+            second_read.set()
+            yield b"b"
+
+        blob.stage_block.side_effect = _stage
+        _, size = storage_client.BlobStorageClient().upload_chunks("c", "x.tif", _chunks())
+
+        assert size == 2
+        assert first_staged.is_set()
+        assert len(blob.commit_block_list.call_args.args[0]) == 2
+
+    def test_stage_failure_propagates(self, monkeypatch: pytest.MonkeyPatch):
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        service = MagicMock()
+        blob = service.get_blob_client.return_value
+        blob.stage_block.side_effect = OSError("reset")
+        monkeypatch.setattr(storage_client, "get_blob_service_client", lambda: service)
+        monkeypatch.setattr(storage_client.BlobStorageClient, "_known_containers", {"c"})
+
+        with pytest.raises(OSError, match="reset"):
+            storage_client.BlobStorageClient().upload_chunks("c", "x.tif", iter([b"a"]))
+        blob.commit_block_list.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # fetch_enrichment_manifest — ownership check (#636)
 # ---------------------------------------------------------------------------
@@ -432,3 +558,93 @@ class TestFetchEnrichmentManifest:
 
         assert err is None
         assert manifest == {"frames": []}
+
+
+class TestDownloadBytes:
+    """``download_bytes`` asks the SDK for parallel ranged GETs on large blobs."""
+
+    def test_downloads_with_bounded_concurrency(self, monkeypatch: pytest.MonkeyPatch):
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        service = MagicMock()
+        blob = service.get_blob_client.return_value
+        blob.download_blob.return_value.readall.return_value = b"<kml/>"
+        monkeypatch.setattr(storage_client, "get_blob_service_client", lambda: service)
+
+        storage = storage_client.BlobStorageClient()
+
+        assert storage.download_bytes("kml-input", "uploads/a.kml") == b"<kml/>"
+        blob.download_blob.assert_called_once_with(
+            max_concurrency=storage_client.BLOB_DOWNLOAD_MAX_CONCURRENCY
+        )
+
+
+class TestCopyBlob:
+    """``copy_blob`` copies server-side and waits for pending copies."""
+
+    @staticmethod
+    def _client(monkeypatch: pytest.MonkeyPatch, statuses: list[str]):
+        from types import SimpleNamespace
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        service = MagicMock()
+        src, dest = MagicMock(), MagicMock()
+        src.url = "https://acct.blob/kml-output/raw/a.tif"
+        service.get_blob_client.side_effect = lambda container, path: (
+            src if path == "raw/a.tif" else dest
+        )
+        dest.get_blob_properties.side_effect = [
+            SimpleNamespace(
+                size=42, copy=SimpleNamespace(status=s, id="cp-1", status_description="")
+            )
+            for s in statuses
+        ]
+        monkeypatch.setattr(storage_client, "get_blob_service_client", lambda: service)
+        monkeypatch.setattr(storage_client.BlobStorageClient, "_known_containers", {"out"})
+        monkeypatch.setattr(storage_client.time, "sleep", lambda _s: None)
+        return storage_client.BlobStorageClient(), dest
+
+    def test_copies_from_source_url(self, monkeypatch: pytest.MonkeyPatch):
+        storage, dest = self._client(monkeypatch, ["success"])
+
+        assert storage.copy_blob("kml-output", "raw/a.tif", "out", "clipped/a.tif") == 42
+        dest.start_copy_from_url.assert_called_once_with("https://acct.blob/kml-output/raw/a.tif")
+
+    def test_waits_for_pending_copy(self, monkeypatch: pytest.MonkeyPatch):
+        storage, dest = self._client(monkeypatch, ["pending", "pending", "success"])
+
+        assert storage.copy_blob("kml-output", "raw/a.tif", "out", "clipped/a.tif") == 42
+        assert dest.get_blob_properties.call_count == 3
+
+    def test_failed_copy_raises(self, monkeypatch: pytest.MonkeyPatch):
+        storage, _ = self._client(monkeypatch, ["failed"])
+
+        with pytest.raises(RuntimeError, match="failed"):
+            storage.copy_blob("kml-output", "raw/a.tif", "out", "clipped/a.tif")
+
+
+class TestUploadJson:
+    """``upload_json`` serialises with orjson, keeping the indented layout."""
+
+    def test_uploads_indented_json_with_str_fallback(self, monkeypatch: pytest.MonkeyPatch):
+        import json
+        from decimal import Decimal
+        from unittest.mock import MagicMock
+
+        from treesight.storage import client as storage_client
+
+        service = MagicMock()
+        monkeypatch.setattr(storage_client, "get_blob_service_client", lambda: service)
+        monkeypatch.setattr(storage_client.BlobStorageClient, "_known_containers", {"out"})
+
+        storage = storage_client.BlobStorageClient()
+        storage.upload_json("out", "metadata/a.json", {"area_ha": Decimal("1.5"), "ids": [1]})
+
+        blob = service.get_blob_client.return_value
+        payload = blob.upload_blob.call_args.args[0]
+        assert payload.startswith(b'{\n  "area_ha"')
+        assert json.loads(payload) == {"area_ha": "1.5", "ids": [1]}
@@ -6,9 +6,11 @@ using a mock ``BlobStorageClient``.
 
 from __future__ import annotations
 
+import asyncio
+import json
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from treesight.models.aoi import AOI
 from treesight.models.blob_event import BlobEvent
@@ -126,6 +128,31 @@ class TestParseKmlFromBlob:
         with pytest.raises(ValueError, match="blob_name"):
             parse_kml_from_blob(event, _mock_storage(b"<kml/>"))
 
+    def test_lxml_path_parses_once(self) -> None:
+        """Without Fiona, validation rides on the lxml parse instead of a second parse."""
+        from treesight.pipeline.ingestion import parse_kml_from_blob
+
+        kml_bytes = (FIXTURES_DIR / "sample.kml").read_bytes()
+        with (
+            patch("treesight.parsers.fiona_parser.kml_driver_available", return_value=False),
+            patch("treesight.parsers.validate_kml_bytes") as validate,
+        ):
+            features = parse_kml_from_blob(_make_blob_event(), _mock_storage(kml_bytes))
+
+        validate.assert_not_called()
+        assert len(features) >= 1
+
+    def test_lxml_path_still_rejects_non_kml(self) -> None:
+        import pytest
+
+        from treesight.pipeline.ingestion import parse_kml_from_blob
+
+        with (
+            patch("treesight.parsers.fiona_parser.kml_driver_available", return_value=False),
+            pytest.raises(ValueError, match="namespace"),
+        ):
+            parse_kml_from_blob(_make_blob_event(), _mock_storage(b"<root><child/></root>"))
+
 
 # ---------------------------------------------------------------------------
 # parse_kml activity input validation
@@ -141,7 +168,7 @@ class TestParseKmlActivityValidation:
         from blueprints.pipeline.activities import parse_kml
 
         with pytest.raises(TypeError, match="expects dict"):
-            parse_kml(None)
+            asyncio.run(parse_kml(None))
 
     def test_rejects_string_payload(self) -> None:
         import pytest
@@ -149,7 +176,149 @@ class TestParseKmlActivityValidation:
         from blueprints.pipeline.activities import parse_kml
 
         with pytest.raises(TypeError, match="expects dict"):
-            parse_kml("not-a-dict")
+            asyncio.run(parse_kml("not-a-dict"))
+
+
+class TestParseAndPrepareKmlActivity:
+    """The fused activity prepares the first batch and returns only the rest."""
+
+    def test_prepares_first_batch_and_returns_remainder(self, sample_feature: Feature) -> None:
+        from unittest.mock import patch
+
+        from blueprints.pipeline.activities import parse_and_prepare_kml
+        from treesight.pipeline.codec import unpack_result
+
+        features = [
+            sample_feature.model_copy(update={"name": f"f{i}", "feature_index": i})
+            for i in range(3)
+        ]
+        payload = {
+            "blob_url": "https://acct.blob.core.windows.net/kml-input/farm.kml",
+            "container_name": "kml-input",
+            "blob_name": "farm.kml",
+            "content_length": 100,
+            "content_type": "application/vnd.google-earth.kml+xml",
+            "event_time": "2026-01-01T00:00:00Z",
+            "correlation_id": "corr-1",
+            "prepare_aoi_batch_size": 2,
+        }
+        with (
+            patch("treesight.storage.client.BlobStorageClient"),
+            patch("treesight.pipeline.ingestion.parse_kml_from_blob", return_value=features),
+        ):
+            out = asyncio.run(parse_and_prepare_kml(payload))
+
+        assert [a["feature_name"] for a in unpack_result(out["aois"])] == ["f0", "f1"]
+        assert [f["name"] for f in out["features"]] == ["f2"]
+
+
+class TestWriteMetadataBatchActivity:
+    """The batched activity downloads the source KML once and archives it once."""
+
+    def test_downloads_and_archives_source_once(self, sample_aoi: AOI) -> None:
+        from unittest.mock import patch
+
+        from blueprints.pipeline.activities import write_metadata_batch
+
+        storage = MagicMock()
+        storage.download_bytes.return_value = b"<kml/>"
+        claims = {
+            "r0": sample_aoi.model_copy(update={"feature_name": "a"}).model_dump(),
+            "r1": sample_aoi.model_copy(update={"feature_name": "b"}).model_dump(),
+        }
+        payload = {
+            "aoi_refs": ["r0", "r1"],
+            "processing_id": "proc-1",
+            "timestamp": "2026-03-18T12:00:00Z",
+            "source_file": "farm.kml",
+            "output_container": "kml-output",
+            "input_container": "kml-input",
+        }
+        with (
+            patch("treesight.storage.client.BlobStorageClient", return_value=storage),
+            patch(
+                "treesight.storage.offload.PayloadOffloader.load_claim",
+                side_effect=lambda ref: claims[ref],
+            ),
+        ):
+            results = asyncio.run(write_metadata_batch(payload))
+
+        assert [r["metadata"]["feature"]["name"] for r in results] == ["a", "b"]
+        storage.download_bytes.assert_called_once_with("kml-input", "farm.kml")
+        storage.upload_bytes.assert_called_once()
+        assert storage.upload_json.call_count == 2
+
+    def test_uploads_overlap_across_aois(self, sample_aoi: AOI) -> None:
+        import threading
+        from unittest.mock import patch
+
+        from blueprints.pipeline.activities import write_metadata_batch
+
+        # Serial uploads would time out the barrier; overlapping ones pass it.
+        barrier = threading.Barrier(2, timeout=5)
+        storage = MagicMock()
+        storage.download_bytes.return_value = None
+        storage.upload_json.side_effect = lambda *_a, **_k: barrier.wait()
+        payload = {
+            "aoi_refs": ["r0", "r1"],
+            "processing_id": "proc-1",
+            "timestamp": "2026-03-18T12:00:00Z",
+            "source_file": "farm.kml",
+            "output_container": "kml-output",
+            "input_container": "kml-input",
+        }
+        with (
+            patch("treesight.storage.client.BlobStorageClient", return_value=storage),
+            patch(
+                "treesight.storage.offload.PayloadOffloader.load_claim",
+                return_value=sample_aoi.model_dump(),
+            ),
+        ):
+            results = asyncio.run(write_metadata_batch(payload))
+
+        assert len(results) == 2
+        assert storage.upload_json.call_count == 2
+
+
+class TestActivityModelRebuild:
+    """Activities rebuild pipeline-dumped AOIs/features without re-validation."""
+
+    def test_inline_aoi_skips_validation(self, sample_aoi: AOI, monkeypatch) -> None:
+        from blueprints.pipeline.activities import _load_aoi
+
+        def _no_validate(*_args, **_kwargs):
+            raise AssertionError("pipeline-dumped AOIs must not be re-validated")
+
+        monkeypatch.setattr(AOI, "model_validate", _no_validate)
+
+        aoi = _load_aoi({"aoi": sample_aoi.model_dump()})
+
+        assert aoi == sample_aoi
+
+    def test_prepare_batch_reads_offloaded_shard(self, sample_feature: Feature) -> None:
+        from unittest.mock import patch
+
+        from blueprints.pipeline.activities import prepare_aoi_batch
+
+        with (
+            patch("treesight.storage.client.BlobStorageClient"),
+            patch(
+                "treesight.storage.offload.PayloadOffloader.load_all",
+                return_value=[sample_feature.model_dump()],
+            ) as load_all,
+        ):
+            out = prepare_aoi_batch({"features_ref": "payloads/c/a.json.gz", "buffer_m": 100})
+
+        load_all.assert_called_once_with("payloads/c/a.json.gz")
+        assert [a["feature_name"] for a in out] == [sample_feature.name]
+
+    def test_prepare_batch_matches_validated_features(self, sample_feature: Feature) -> None:
+        from blueprints.pipeline.activities import prepare_aoi_batch
+        from treesight.pipeline.ingestion import prepare_aois
+
+        out = prepare_aoi_batch({"features": [sample_feature.model_dump()], "buffer_m": 100})
+
+        assert out == [a.model_dump() for a in prepare_aois([sample_feature], buffer_m=100)]
 
 
 # ---------------------------------------------------------------------------
@@ -559,3 +728,58 @@ class TestEmptyFeatureNames:
 
         # key should be the fallback, not "None"
         assert refs[0]["key"] != refs[1]["key"] or refs[0]["claim_id"] != refs[1]["claim_id"]
+
+
+class TestPayloadCodec:
+    """Offloaded payloads round-trip through the compact orjson encoding."""
+
+    def test_offload_round_trip(self) -> None:
+        from datetime import UTC, datetime
+
+        from treesight.storage.offload import PayloadOffloader
+
+        blobs: dict[str, bytes] = {}
+        storage = MagicMock()
+        storage.upload_bytes.side_effect = lambda _c, path, data, **_kw: blobs.__setitem__(
+            path, data
+        )
+        storage.download_bytes.side_effect = lambda _c, path: blobs[path]
+        offloader = PayloadOffloader(storage)
+        items = [{"feature_name": "A", "when": datetime(2026, 1, 2, tzinfo=UTC), 1: "x"}]
+
+        ref = offloader.offload("inst-codec", items)
+
+        loaded = offloader.load_all(ref["ref"])
+        assert loaded == [{"feature_name": "A", "when": "2026-01-02T00:00:00+00:00", "1": "x"}]
+
+    def test_offload_is_gzipped_with_codec_in_ref(self) -> None:
+        import gzip
+
+        from treesight.storage.offload import PayloadOffloader
+
+        storage = MagicMock()
+        offloader = PayloadOffloader(storage)
+        items = [{"feature_name": f"AOI {i}", "coords": [[0.0, 0.0]] * 50} for i in range(20)]
+
+        ref = offloader.offload("inst-gz", items)
+
+        uploaded = storage.upload_bytes.call_args[0][2]
+        assert ref["codec"] == "gzip"
+        assert ref["ref"].endswith(".json.gz")
+        assert ref["size"] == len(uploaded) < ref["uncompressed_size"]
+        assert json.loads(gzip.decompress(uploaded)) == items
+
+    def test_load_all_reads_legacy_uncompressed_blob(self) -> None:
+        from treesight.storage.offload import PayloadOffloader
+
+        storage = MagicMock()
+        storage.download_bytes.return_value = b'[{"feature_name": "old"}]'
+
+        loaded = PayloadOffloader(storage).load_all("payloads/inst/abc.json")
+
+        assert loaded == [{"feature_name": "old"}]
+
+    def test_encoding_is_compact(self) -> None:
+        from treesight.storage.offload import encode_payload
+
+        assert encode_payload([{"a": 1, "b": [1, 2]}]) == b'[{"a":1,"b":[1,2]}]'
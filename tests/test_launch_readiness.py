@@ -417,6 +417,39 @@ class TestHostLoggingCostControls:
         )
 
 
+class TestDurableConcurrencyLimits:
+    """Per-worker Durable concurrency is capped for CPU-heavy activities."""
+
+    @pytest.fixture()
+    def durable_config(self):
+        return json.loads(HOST_JSON.read_text())["extensions"]["durableTask"]
+
+    def test_activity_concurrency_is_capped(self, durable_config):
+        assert 0 < durable_config["maxConcurrentActivityFunctions"] <= 16
+
+    def test_orchestrator_concurrency_is_capped(self, durable_config):
+        assert 0 < durable_config["maxConcurrentOrchestratorFunctions"] <= 16
+
+    def test_extended_sessions_not_enabled(self, durable_config):
+        assert not durable_config.get("extendedSessionsEnabled", False), (
+            "Extended sessions are .NET-only; enabling them on the Python worker "
+            "can silently stall orchestrations"
+        )
+
+    def test_queue_polling_backoff_is_bounded(self, durable_config):
+        interval = durable_config["storageProvider"]["maxQueuePollingInterval"]
+        hours, minutes, seconds = (int(part) for part in interval.split(":"))
+        assert hours == 0 and minutes == 0 and 0 < seconds <= 10, (
+            "Idle control queues back off to 30s by default, which stalls "
+            "fan-in wake-ups after each activity burst"
+        )
+
+    def test_storage_provider_type_left_to_app_settings(self, durable_config):
+        assert "type" not in durable_config.get("storageProvider", {}), (
+            "The provider type is pinned per app in infra/tofu/main.tf"
+        )
+
+
 # ---------------------------------------------------------------------------
 # 6. detect-secrets in CI
 # ---------------------------------------------------------------------------
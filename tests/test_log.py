@@ -15,6 +15,7 @@ from treesight.log import (
     JsonFormatter,
     configure_logging,
     correlation_id,
+    log_context,
     log_duration,
     log_error,
     log_phase,
@@ -67,6 +68,31 @@ class TestLogPhase:
         msg = log_phase("ingestion", "parse", blob_name="test.kml")
         assert "blob=test.kml" in msg
 
+    def test_level_controls_emission(self, caplog):
+        with caplog.at_level(logging.INFO, logger="treesight"):
+            msg = log_phase("storage", "upload", level=logging.DEBUG, size=3)
+        assert "step=upload" in msg
+        assert not caplog.records
+
+        with caplog.at_level(logging.DEBUG, logger="treesight"):
+            log_phase("storage", "upload", level=logging.DEBUG, size=3)
+        assert caplog.records[-1].levelno == logging.DEBUG
+        assert caplog.records[-1].custom_properties["size"] == 3
+
+    def test_disabled_level_skips_emission(self):
+        from unittest.mock import patch
+
+        tree_logger = logging.getLogger("treesight")
+        original = tree_logger.level
+        with patch.object(tree_logger, "log") as emit:
+            tree_logger.setLevel(logging.WARNING)
+            try:
+                msg = log_phase("storage", "upload", size=3)
+            finally:
+                tree_logger.setLevel(original)
+        assert msg == "phase=storage step=upload"
+        emit.assert_not_called()
+
 
 class TestLogError:
     def test_logs_at_error_level(self, caplog):
@@ -109,6 +135,21 @@ class TestJsonFormatter:
         assert result["properties"]["phase"] == "ingestion"
         assert result["properties"]["step"] == "parse"
 
+    def test_non_str_property_keys_are_stringified(self):
+        formatter = JsonFormatter()
+        record = logging.LogRecord(
+            name="treesight",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="test",
+            args=(),
+            exc_info=None,
+        )
+        record.custom_properties = {"counts": {1: "a"}}  # type: ignore[attr-defined]
+        result = json.loads(formatter.format(record))
+        assert result["properties"]["counts"] == {"1": "a"}
+
     def test_includes_correlation_id(self):
         formatter = JsonFormatter()
         token = correlation_id.set("req-abc-123")
@@ -152,6 +193,54 @@ class TestCorrelationId:
             correlation_id.reset(token)
 
 
+class TestLogContext:
+    @staticmethod
+    def _format(formatter: JsonFormatter, **props: object) -> dict[str, object]:
+        record = logging.LogRecord(
+            name="treesight",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="test",
+            args=(),
+            exc_info=None,
+        )
+        if props:
+            record.custom_properties = props  # type: ignore[attr-defined]
+        return json.loads(formatter.format(record))
+
+    def test_bound_fields_merge_into_every_record(self):
+        formatter = JsonFormatter()
+        with log_context(correlation="corr-1", activity="parse_kml", blob="a.kml"):
+            plain = self._format(formatter)
+            phased = self._format(formatter, phase="ingestion", blob="override.kml")
+
+        assert plain["correlation_id"] == "corr-1"
+        assert plain["properties"] == {"activity": "parse_kml", "blob": "a.kml"}
+        assert phased["properties"]["phase"] == "ingestion"
+        assert phased["properties"]["blob"] == "override.kml"
+
+    def test_nested_contexts_layer_and_restore(self):
+        formatter = JsonFormatter()
+        with log_context(activity="outer"):
+            with log_context(correlation="corr-2", step="inner"):
+                inner = self._format(formatter)
+            outer = self._format(formatter)
+        after = self._format(formatter)
+
+        assert inner["properties"] == {"activity": "outer", "step": "inner"}
+        assert inner["correlation_id"] == "corr-2"
+        assert outer["properties"] == {"activity": "outer"}
+        assert "correlation_id" not in outer
+        assert "properties" not in after
+
+    def test_bound_values_are_sanitised(self):
+        formatter = JsonFormatter()
+        with log_context(blob="evil\nname.kml"):
+            result = self._format(formatter)
+        assert result["properties"]["blob"] == "evilname.kml"
+
+
 class TestLogDuration:
     def test_includes_duration_ms(self, caplog):
         started = time.monotonic() - 0.150  # simulate 150ms ago
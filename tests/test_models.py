@@ -69,6 +69,19 @@ class TestFeature:
         f = Feature(name="Block A")
         assert f.dedup_key == "<unspecified>:0"
 
+    def test_list_adapter_matches_per_item_validation(self, sample_feature: Feature):
+        from treesight.models.feature import FEATURE_LIST_ADAPTER
+
+        dumped = FEATURE_LIST_ADAPTER.dump_python([sample_feature, Feature(name="B")])
+        assert dumped == [sample_feature.model_dump(), Feature(name="B").model_dump()]
+        assert FEATURE_LIST_ADAPTER.validate_python(dumped)[0] == sample_feature
+
+    def test_list_adapter_rejects_bad_item(self):
+        from treesight.models.feature import FEATURE_LIST_ADAPTER
+
+        with pytest.raises(ValidationError):
+            FEATURE_LIST_ADAPTER.validate_python([{"name": "ok"}, {"exterior_coords": "x"}])
+
 
 # ---------------------------------------------------------------------------
 # AOI
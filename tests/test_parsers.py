@@ -11,7 +11,7 @@ from io import BytesIO
 import pytest
 
 from treesight.parsers import maybe_unzip
-from treesight.parsers.lxml_parser import parse_kml_lxml
+from treesight.parsers.lxml_parser import iter_kml_lxml, parse_kml_lxml
 
 
 class TestLxmlParser:
@@ -90,6 +90,83 @@ class TestLxmlParser:
         features = parse_kml_lxml(kml)
         assert len(features) == 0
 
+    def test_iter_streams_from_file_object(self, sample_kml_bytes: bytes):
+        stream = iter_kml_lxml(BytesIO(sample_kml_bytes), source_file="sample.kml")
+        first = next(stream)
+        assert first.name == "Block A - Fuji Apple"
+        assert [f.feature_index for f in stream] == [1]
+
+    def test_iter_handles_placemarks_in_nested_folders(self):
+        placemark = (
+            "<Placemark><name>{name}</name><Polygon><outerBoundaryIs><LinearRing>"
+            "<coordinates>0,0 1,0 1,1 0,0</coordinates>"
+            "</LinearRing></outerBoundaryIs></Polygon></Placemark>"
+        )
+        kml = (
+            '<kml xmlns="http://www.opengis.net/kml/2.2"><Document>'
+            f"<Folder>{placemark.format(name='a')}{placemark.format(name='b')}</Folder>"
+            f"<Folder><Folder>{placemark.format(name='c')}</Folder></Folder>"
+            "</Document></kml>"
+        ).encode()
+        names = [f.name for f in iter_kml_lxml(BytesIO(kml))]
+        assert names == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("1,2 3,4", [[1.0, 2.0], [3.0, 4.0]]),
+        ("\n\t 1,2,100\n  3,4,0 \n", [[1.0, 2.0], [3.0, 4.0]]),
+        ("1,2,3,4 5,6", [[1.0, 2.0], [5.0, 6.0]]),
+        ("1,2 junk 3 x,4 5,6", [[1.0, 2.0], [5.0, 6.0]]),
+        ("", []),
+    ],
+)
+def test_parse_coordinates(text: str, expected: list[list[float]]):
+    from treesight.parsers.lxml_parser import _parse_coordinates
+
+    assert _parse_coordinates(text) == expected
+
+
+class TestLxmlParserValidation:
+    """``validate=True`` applies the ``validate_kml_bytes`` checks in the same pass."""
+
+    def test_accepts_valid_kml(self, sample_kml_bytes: bytes):
+        assert len(parse_kml_lxml(sample_kml_bytes, validate=True)) == 2
+
+    def test_rejects_malformed_xml(self):
+        with pytest.raises(ValueError, match="Malformed XML"):
+            parse_kml_lxml(b"<kml><this is not xml", validate=True)
+
+    def test_rejects_truncated_after_placemark(self, sample_kml_bytes: bytes):
+        with pytest.raises(ValueError, match="Malformed XML"):
+            parse_kml_lxml(
+                sample_kml_bytes[: sample_kml_bytes.rindex(b"</Document>")], validate=True
+            )
+
+    def test_rejects_foreign_root_namespace(self):
+        kml = (
+            b'<root xmlns:k="http://www.opengis.net/kml/2.2"><k:Placemark><k:name>a</k:name>'
+            b"</k:Placemark></root>"
+        )
+        with pytest.raises(ValueError, match="namespace"):
+            parse_kml_lxml(kml, validate=True)
+
+    def test_rejects_foreign_root_without_placemarks(self):
+        with pytest.raises(ValueError, match="namespace"):
+            parse_kml_lxml(b"<root><child/></root>", validate=True)
+
+    def test_rejects_dtd_declaration(self):
+        kml = b'<!DOCTYPE kml [<!ENTITY x "y">]><kml xmlns="http://www.opengis.net/kml/2.2"/>'
+        with pytest.raises(ValueError, match="DOCTYPE"):
+            parse_kml_lxml(kml, validate=True)
+
+    def test_unvalidated_parse_keeps_lxml_errors(self):
+        from lxml.etree import XMLSyntaxError
+
+        with pytest.raises(XMLSyntaxError):
+            parse_kml_lxml(b"<kml><this is not xml")
+
 
 def _make_kmz(kml_bytes: bytes, entry_name: str = "doc.kml") -> bytes:
     """Create an in-memory KMZ (ZIP) containing *kml_bytes* at *entry_name*."""
@@ -265,6 +342,23 @@ class TestKmlInputValidation:
         </kml>"""
         validate_kml_bytes(kml)
 
+    def test_rejects_truncation_after_placemarks(self, sample_kml_bytes: bytes):
+        from treesight.parsers import validate_kml_bytes
+
+        truncated = sample_kml_bytes[: sample_kml_bytes.rindex(b"</Document>")]
+        with pytest.raises(ValueError, match="Malformed XML"):
+            validate_kml_bytes(truncated)
+
+    def test_accepts_legacy_google_namespace_placemarks(self):
+        from treesight.parsers import validate_kml_bytes
+
+        kml = (
+            b'<kml xmlns="http://earth.google.com/kml/2.1"><Document><Folder>'
+            + b"<Placemark><name>a</name></Placemark>" * 3
+            + b"</Folder></Document></kml>"
+        )
+        validate_kml_bytes(kml)
+
     def test_accepts_kml_22_namespace(self):
         from treesight.parsers import validate_kml_bytes
 
@@ -275,6 +369,67 @@ class TestKmlInputValidation:
         validate_kml_bytes(kml)
 
 
+class TestFionaParserInMemory:
+    """Fiona reads KML bytes from GDAL's /vsimem rather than a temp file."""
+
+    def test_parses_without_writing_temp_file(self, sample_kml_bytes: bytes, monkeypatch):
+        import tempfile
+
+        fiona = pytest.importorskip("fiona")
+        monkeypatch.setitem(fiona.supported_drivers, "KML", "r")
+
+        def _no_temp_files(*_args, **_kwargs):
+            raise AssertionError("fiona parser must not write temp files")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", _no_temp_files)
+
+        from treesight.parsers.fiona_parser import parse_kml_fiona
+
+        features = parse_kml_fiona(sample_kml_bytes, source_file="sample.kml")
+        assert [f.name for f in features] == ["Block A - Fuji Apple", "Block B - Macadamia"]
+
+
+class TestFionaDriverCheck:
+    """Ingestion only dispatches to Fiona when its GDAL build can read KML."""
+
+    def test_skips_fiona_when_kml_driver_missing(self, sample_kml_bytes: bytes, monkeypatch):
+        from unittest.mock import MagicMock
+
+        import treesight.parsers.fiona_parser as fp_module
+        from treesight.models.blob_event import BlobEvent
+        from treesight.pipeline.ingestion import parse_kml_from_blob
+
+        def _must_not_run(*_args, **_kwargs):
+            raise AssertionError("Fiona must not be tried without a KML driver")
+
+        monkeypatch.setattr(fp_module, "kml_driver_available", lambda: False)
+        monkeypatch.setattr(fp_module, "parse_kml_fiona", _must_not_run)
+
+        storage = MagicMock()
+        storage.download_bytes.return_value = sample_kml_bytes
+        blob_event = BlobEvent(
+            blob_url="https://teststorage.blob.core.windows.net/kml-input/analysis/test.kml",
+            container_name="kml-input",
+            blob_name="analysis/test.kml",
+            content_length=len(sample_kml_bytes),
+            content_type="application/vnd.google-earth.kml+xml",
+            event_time="2025-01-15T10:30:00Z",
+            correlation_id="test-123",
+        )
+
+        features = parse_kml_from_blob(blob_event, storage)
+        assert [f.name for f in features] == ["Block A - Fuji Apple", "Block B - Macadamia"]
+
+    def test_driver_check_follows_fiona_registry(self, monkeypatch):
+        fiona = pytest.importorskip("fiona")
+        from treesight.parsers.fiona_parser import kml_driver_available
+
+        monkeypatch.setitem(fiona.supported_drivers, "KML", "r")
+        assert kml_driver_available()
+        monkeypatch.delitem(fiona.supported_drivers, "KML", raising=False)
+        assert not kml_driver_available()
+
+
 class TestFionaParserTimeout:
     """Fiona parser timeout and fallback behavior (\u00a77.1)."""
 
@@ -309,6 +464,7 @@ class TestFionaParserTimeout:
             time.sleep(0.5)
             return []
 
+        monkeypatch.setattr(fp_module, "kml_driver_available", lambda: True)
         monkeypatch.setattr(fp_module, "_fiona_open_and_collect", _slow_open)
         monkeypatch.setattr(fp_module, "_FIONA_TIMEOUT_SECONDS", 0.1)
 
@@ -22,6 +22,11 @@ from treesight.pipeline.orchestrator import (
 from treesight.storage.offload import PayloadOffloader
 
 
+def _parsed(features, aois=None):
+    """Shape a ``parse_and_prepare_kml`` result for driving ``_phase_ingestion``."""
+    return {"features": features, "aois": aois or []}
+
+
 class TestDeriveProjectContext:
     def test_extracts_stem(self):
         ctx = derive_project_context("uploads/my-farm.kml")
@@ -200,6 +205,26 @@ class TestPayloadOffloaderClaimCheck:
         assert "id_0_" in refs[0]["claim_id"]
 
 
+class TestPayloadOffloaderShards:
+    """``offload_shards`` writes one gzip blob per fan-out slice."""
+
+    def test_shards_round_trip_in_order(self):
+        storage = MagicMock()
+        blobs: dict[str, bytes] = {}
+        storage.upload_bytes.side_effect = lambda _c, path, data, **_kw: blobs.__setitem__(
+            path, data
+        )
+        storage.download_bytes.side_effect = lambda _c, path: blobs[path]
+        offloader = PayloadOffloader(storage)
+        items = [{"name": f"f{i}"} for i in range(5)]
+
+        out = offloader.offload_shards("inst-s", items, 2)
+
+        assert out["count"] == 5
+        assert [len(offloader.load_all(ref)) for ref in out["shards"]] == [2, 2, 1]
+        assert [f for ref in out["shards"] for f in offloader.load_all(ref)] == items
+
+
 class TestClaimCheckBulkRoundtrip:
     """Integration-style test verifying bulk claim store → load cycle."""
 
@@ -280,6 +305,30 @@ class TestPostProcessPayload:
         assert p["square_frame"] is True
 
 
+class TestPrepareAoiBatchPayloads:
+    def test_chunks_features_by_batch_size(self):
+        from blueprints.pipeline._payloads import _prepare_aoi_batch_payloads
+
+        features = [{"name": f"f{i}"} for i in range(5)]
+        batches = _prepare_aoi_batch_payloads(features, 50.0, 2)
+        assert [len(b["features"]) for b in batches] == [2, 2, 1]
+        assert all(b["buffer_m"] == 50.0 for b in batches)
+
+    def test_non_positive_batch_size_falls_back_to_one(self):
+        from blueprints.pipeline._payloads import _prepare_aoi_batch_payloads
+
+        batches = _prepare_aoi_batch_payloads([{"name": "a"}, {"name": "b"}], None, 0)
+        assert len(batches) == 2
+
+    def test_activity_prepares_every_feature(self, sample_feature):
+        from blueprints.pipeline.activities import prepare_aoi_batch
+
+        feature = sample_feature.model_dump()
+        result = prepare_aoi_batch({"features": [feature, feature], "buffer_m": 10.0})
+        assert len(result) == 2
+        assert all(r["feature_name"] == sample_feature.name for r in result)
+
+
 # ---------------------------------------------------------------------------
 # §3.3 — Activity AOI Loading
 # ---------------------------------------------------------------------------
@@ -302,6 +351,18 @@ class TestLoadAoi:
         assert result.feature_name == "farm"
         assert result.bbox == [1.0, 2.0, 3.0, 4.0]
 
+    def test_claim_coordinates_are_coerced_to_float(self):
+        from blueprints.pipeline.activities import _load_aoi
+
+        mock_storage = MagicMock()
+        mock_storage.download_bytes.return_value = json.dumps(
+            {"feature_name": "farm", "exterior_coords": [[1, 2], [3, 4]], "bbox": [1, 2, 3, 4]}
+        ).encode()
+
+        result = _load_aoi({"aoi_ref": "claims/inst/farm.json"}, mock_storage)
+        assert all(isinstance(v, float) for pair in result.exterior_coords for v in pair)
+        assert all(isinstance(v, float) for v in result.bbox)
+
     def test_loads_from_inline_aoi(self):
         from blueprints.pipeline.activities import _load_aoi
 
@@ -499,18 +560,18 @@ class TestPhaseIngestionAoiLimitGate:
         from blueprints.pipeline.orchestrator import _phase_ingestion
 
         ctx = MagicMock()
-        # parse_kml returns a list of features (inline, not offloaded)
+        # parse_and_prepare_kml returns unprepared features (inline, not offloaded)
         six_features = [{"geometry": {"type": "Point", "coordinates": [0, 0]}}] * 6
         ctx.call_activity.return_value = "parse_kml_sentinel"
 
         inp = {"blob_name": "test.kml", "tier": "free"}  # free allows 5
         gen = _phase_ingestion(ctx, inp, "inst-1", {"tid": "t1"})
 
-        # First yield: call_activity("parse_kml", ...)
+        # First yield: call_activity("parse_and_prepare_kml", ...)
         gen.send(None)
         # Send back 6 features (exceeds free tier limit of 5)
         with pytest.raises(ValueError, match=r"6 AOIs.*Free.*allows 5"):
-            gen.send(six_features)
+            gen.send(_parsed(six_features))
 
     def test_within_limit_proceeds_to_fan_out(self):
         """Within-limit input reaches the prepare_aoi fan-out step."""
@@ -529,13 +590,37 @@ class TestPhaseIngestionAoiLimitGate:
         # First yield: parse_kml
         gen.send(None)
         # Send back 3 features (within limit) — should proceed, not raise
-        gen.send(three_features)
+        gen.send(_parsed(three_features))
         # If we got here, enforce_aoi_limit passed and the generator continued
         # to the prepare_aoi fan-out step (task_all yield)
         ctx.set_custom_status.assert_any_call(
             {"phase": "ingestion", "step": "preparing_aois", "features": 3}
         )
 
+    def test_prepare_aoi_fans_out_in_batches_and_flattens(self):
+        """Features are grouped per prepare_aoi_batch call and results flattened."""
+        from unittest.mock import MagicMock
+
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+
+        ctx = MagicMock()
+        features = [{"name": f"f{i}"} for i in range(5)]
+        inp = {"blob_name": "test.kml", "tier": "pro", "prepare_aoi_batch_size": 2}
+        gen = _phase_ingestion(ctx, inp, "inst-1", {"tid": "t1"})
+
+        gen.send(None)
+        gen.send(_parsed(features))
+        batch_calls = [
+            c for c in ctx.call_activity.call_args_list if c.args[0] == "prepare_aoi_batch"
+        ]
+        assert [len(c.args[1]["features"]) for c in batch_calls] == [2, 2, 1]
+
+        aoi = {"feature_name": "f", "area_ha": 1.0, "exterior_coords": [[0.0, 0.0]]}
+        gen.send([[aoi, aoi], [aoi, aoi], [aoi]])
+        store_call = ctx.call_activity.call_args_list[-1]
+        assert store_call.args[0] == "store_aoi_claims"
+        assert len(store_call.args[1]["aois"]) == 5
+
 
 class TestAcquisitionActivityRetry:
     """Verify _phase_acquisition uses call_activity_with_retry for search activities."""
@@ -644,7 +729,7 @@ class TestFulfilmentRetry:
 
         ctx = MagicMock()
         ctx.call_activity_with_retry.return_value = "dl_sentinel"
-        ctx.task_all.return_value = [{"state": "ok", "blob_path": "path"}]
+        ctx.task_all.return_value = [[{"state": "ok", "blob_path": "path"}]]
 
         gen = _fulfil_download(
             ctx,
@@ -660,7 +745,7 @@ class TestFulfilmentRetry:
 
         ctx.call_activity_with_retry.assert_called()
         call_args = ctx.call_activity_with_retry.call_args
-        assert call_args[0][0] == "download_imagery"
+        assert call_args[0][0] == "download_imagery_batch"
         retry_opts = call_args[0][1]
         assert retry_opts.first_retry_interval_in_milliseconds == ACTIVITY_RETRY_FIRST_INTERVAL_MS
         assert retry_opts.max_number_of_attempts == ACTIVITY_RETRY_MAX_ATTEMPTS
@@ -1079,7 +1164,8 @@ class TestProgressivePipeline:
         }
 
         gen = _progressive_pipeline(ctx, inp, project_ctx, ing, "test-inst")
-        gen.send(None)  # First yield: task_any
+        gen.send(None)  # First yield: batched composite search
+        gen.send([[[], []]])  # Second yield: task_any
 
         assert ctx.call_sub_orchestrator.call_count == 2
 
@@ -1108,6 +1194,7 @@ class TestProgressivePipeline:
             "parent-id",
         )
         gen.send(None)
+        gen.send([[[], []]])
 
         calls = ctx.call_sub_orchestrator.call_args_list
         ids = [c[1]["instance_id"] for c in calls]
@@ -1136,7 +1223,8 @@ class TestProgressivePipeline:
             "parent-id",
         )
         with contextlib.suppress(StopIteration):
-            gen.send(None)  # first yield: task_any
+            gen.send(None)  # first yield: batched composite search
+            gen.send([[[]]])  # second yield: task_any
             gen.send(task_a)  # winner is task_a, loop ends
 
         status_calls = ctx.set_custom_status.call_args_list
@@ -1162,10 +1250,66 @@ class TestProgressivePipeline:
 
         gen = _progressive_pipeline(ctx, {}, {"project_name": "t", "timestamp": "ts"}, ing, "p")
         gen.send(None)
+        gen.send([[[]]])
 
         payload = ctx.call_sub_orchestrator.call_args[1]["input_"]
         assert "aoi_entry" not in payload
 
+    def test_progressive_pipeline_passes_presearched_orders(self):
+        from blueprints.pipeline.orchestrator import _progressive_pipeline
+
+        ctx = MagicMock()
+        ctx.task_any.return_value = "any_sentinel"
+        refs = [{"ref": f"blob://{i}", "key": f"A{i}"} for i in range(3)]
+        ing = {"aoi_refs": refs, "aoi_area_by_name": {}}
+
+        gen = _progressive_pipeline(
+            ctx, {"acquisition_batch_size": 2}, {"project_name": "t"}, ing, "p"
+        )
+        gen.send(None)
+
+        batch_calls = ctx.call_activity_with_retry.call_args_list
+        assert [c[0][0] for c in batch_calls] == ["acquire_composite_batch"] * 2
+        assert batch_calls[0][0][2]["aoi_refs"] == ["blob://0", "blob://1"]
+        assert batch_calls[1][0][2]["aoi_refs"] == ["blob://2"]
+
+        gen.send([[[{"order_id": "o0"}], []], [[{"order_id": "o2"}]]])
+        inputs = [c[1]["input_"] for c in ctx.call_sub_orchestrator.call_args_list]
+        assert [i["orders"] for i in inputs] == [[{"order_id": "o0"}], [], [{"order_id": "o2"}]]
+
+    def test_progressive_pipeline_presearch_failure_falls_back(self):
+        from blueprints.pipeline.orchestrator import _progressive_pipeline
+
+        ctx = MagicMock()
+        ctx.is_replaying = False
+        ctx.task_any.return_value = "any_sentinel"
+        refs = [{"ref": "blob://1", "key": "A"}, {"ref": "blob://2", "key": "B"}]
+        ing = {"aoi_refs": refs, "aoi_area_by_name": {}}
+
+        gen = _progressive_pipeline(ctx, {}, {"project_name": "t"}, ing, "p")
+        gen.send(None)
+        gen.throw(RuntimeError("STAC down"))
+
+        inputs = [c[1]["input_"] for c in ctx.call_sub_orchestrator.call_args_list]
+        assert len(inputs) == 2
+        assert all("orders" not in i for i in inputs)
+
+    def test_progressive_pipeline_skips_presearch_without_composite(self):
+        from blueprints.pipeline.orchestrator import _progressive_pipeline
+
+        ctx = MagicMock()
+        ctx.task_any.return_value = "any_sentinel"
+        ing = {
+            "aoi_refs": [{"ref": "blob://1", "key": "A"}, {"ref": "blob://2", "key": "B"}],
+            "aoi_area_by_name": {},
+        }
+
+        gen = _progressive_pipeline(ctx, {"composite_search": False}, {}, ing, "p")
+        gen.send(None)
+
+        ctx.call_activity_with_retry.assert_not_called()
+        assert ctx.call_sub_orchestrator.call_count == 2
+
 
 class TestAoiPollOrderRetry:
     """Verify poll_order uses call_activity_with_retry (DF-level retry)."""
@@ -1189,6 +1333,18 @@ class TestAoiPollOrderRetry:
         ]
         assert len(retry_calls) >= 1
 
+    def test_presearched_orders_skip_search(self):
+        from blueprints.pipeline.aoi_orchestrator import _aoi_acquire
+
+        ctx = MagicMock()
+        gen = _aoi_acquire(
+            ctx, {"composite_search": True}, {"ref": "r", "key": "k"}, [{"order_id": "o1"}]
+        )
+        gen.send(None)
+
+        names = [c[0][0] for c in ctx.call_activity_with_retry.call_args_list]
+        assert names == ["poll_order"]
+
 
 # ---------------------------------------------------------------------------
 # §5 — Orchestrator helpers edge cases (second-run flakiness regression)
@@ -1347,10 +1503,10 @@ class TestOffloadedFeaturesPath:
         ctx.task_all.return_value = [{"feature_name": "farm", "bbox": [36.8, -1.3, 36.81, -1.31]}]
 
         gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-1", {})
-        gen.send(None)  # first yield: parse_kml
+        gen.send(None)  # first yield: parse_and_prepare_kml
 
         # Resume with inline list — must NOT call load_offloaded_features
-        gen.send(one_feature)
+        gen.send(_parsed(one_feature))
 
         activity_names = [c[0][0] for c in ctx.call_activity.call_args_list]
         assert "load_offloaded_features" not in activity_names
@@ -1364,14 +1520,34 @@ class TestOffloadedFeaturesPath:
         ctx.task_all.return_value = [{"feature_name": "farm", "bbox": [36.8, -1.3, 36.81, -1.31]}]
 
         gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-2", {})
-        gen.send(None)  # first yield: parse_kml
+        gen.send(None)  # first yield: parse_and_prepare_kml
 
         # Resume with a dict (offload ref) — must call load_offloaded_features
-        gen.send({"ref": "payloads/inst-2/abc.json", "count": 1})
+        gen.send(_parsed({"ref": "payloads/inst-2/abc.json", "count": 1}))
 
         activity_names = [c[0][0] for c in ctx.call_activity.call_args_list]
         assert "load_offloaded_features" in activity_names
 
+    def test_phase_ingestion_sharded_features_skip_load(self):
+        """Sharded offloads go straight to prepare_aoi_batch, one batch per shard."""
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+
+        ctx = MagicMock()
+        gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-s", {})
+        gen.send(None)  # first yield: parse_and_prepare_kml
+
+        gen.send(_parsed({"shards": ["payloads/s/a.json.gz", "payloads/s/b.json.gz"], "count": 20}))
+
+        calls = ctx.call_activity.call_args_list
+        assert "load_offloaded_features" not in [c.args[0] for c in calls]
+        assert [c.args[1]["features_ref"] for c in calls if c.args[0] == "prepare_aoi_batch"] == [
+            "payloads/s/a.json.gz",
+            "payloads/s/b.json.gz",
+        ]
+        ctx.set_custom_status.assert_any_call(
+            {"phase": "ingestion", "step": "preparing_aois", "features": 20}
+        )
+
 
 class TestOrchestratorActivityOutputContracts:
     """Verify ingestion fails fast on malformed activity outputs."""
@@ -1387,13 +1563,29 @@ class TestOrchestratorActivityOutputContracts:
         ctx.call_activity.return_value = "sentinel"
 
         gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-3", {})
-        gen.send(None)  # first yield: parse_kml
+        gen.send(None)  # first yield: parse_and_prepare_kml
 
         with pytest.raises(
             TypeError,
             match=r"parse_kml activity output must be list\[dict\] or dict with required keys: ref",
         ):
-            gen.send("malformed")
+            gen.send(_parsed("malformed"))
+
+    def test_phase_ingestion_rejects_non_dict_parse_and_prepare_output(self):
+        from unittest.mock import MagicMock
+
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+
+        ctx = MagicMock()
+        ctx.call_activity.return_value = "sentinel"
+
+        gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-5", {})
+        gen.send(None)
+
+        with pytest.raises(TypeError, match=r"parse_and_prepare_kml activity output must be dict"):
+            gen.send([{"feature_name": "farm"}])
 
     def test_phase_ingestion_rejects_claim_refs_without_ref_key(self):
         from unittest.mock import MagicMock
@@ -1407,13 +1599,13 @@ class TestOrchestratorActivityOutputContracts:
         ctx.task_all.return_value = "task_all_sentinel"
 
         gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-4", {})
-        gen.send(None)  # yield parse_kml activity call
+        gen.send(None)  # yield parse_and_prepare_kml activity call
         gen.send(
-            [{"feature_name": "farm", "exterior_coords": [[36.8, -1.3]]}]
-        )  # resolve parse_kml; yield prepare_aoi fan-out
+            _parsed([{"feature_name": "farm", "exterior_coords": [[36.8, -1.3]]}])
+        )  # resolve parse_and_prepare_kml; yield prepare_aoi fan-out
         gen.send(
-            [{"feature_name": "farm", "bbox": [36.8, -1.3, 36.81, -1.31]}]
-        )  # resolve prepare_aoi; yield store_aoi_claims
+            [[{"feature_name": "farm", "bbox": [36.8, -1.3, 36.81, -1.31]}]]
+        )  # resolve prepare_aoi_batch; yield store_aoi_claims
 
         with pytest.raises(
             ValueError, match=r"store_aoi_claims activity output item 0 missing required keys: ref"
@@ -1440,27 +1632,31 @@ class TestPhaseIngestionCentroidTelemetry:
         gen = _phase_ingestion(
             ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "inst-6", {"timestamp": "t1"}
         )
-        gen.send(None)  # yield parse_kml
+        gen.send(None)  # yield parse_and_prepare_kml
         gen.send(
-            [
-                {"feature_name": "farm", "exterior_coords": [[36.8, -1.3]]},
-                {"feature_name": "empty", "exterior_coords": []},
-            ]
-        )  # resolve parse_kml; yield prepare_aoi fan-out
+            _parsed(
+                [
+                    {"feature_name": "farm", "exterior_coords": [[36.8, -1.3]]},
+                    {"feature_name": "empty", "exterior_coords": []},
+                ]
+            )
+        )  # resolve parse_and_prepare_kml; yield prepare_aoi fan-out
         gen.send(
             [
-                {"feature_name": "farm", "centroid": [36.8, -1.3]},
-                {"feature_name": "empty", "centroid": [0.0, 0.0]},
+                [
+                    {"feature_name": "farm", "centroid": [36.8, -1.3]},
+                    {"feature_name": "empty", "centroid": [0.0, 0.0]},
+                ]
             ]
-        )  # resolve prepare_aoi; yield store_aoi_claims
+        )  # resolve prepare_aoi_batch; yield store_aoi_claims
         gen.send(
             [
                 {"ref": "r1", "key": "farm"},
                 {"ref": "r2", "key": "empty"},
             ]
-        )  # resolve store_aoi_claims; yield write_metadata fan-out
+        )  # resolve store_aoi_claims; yield write_metadata_batch fan-out
         with pytest.raises(StopIteration) as exc_info:
-            gen.send([{"status": "ok"}, {"status": "ok"}])  # resolve write_metadata
+            gen.send([[{"status": "ok"}, {"status": "ok"}]])  # resolve write_metadata_batch
 
         result = exc_info.value.value
         assert result["aoi_centroids"] == [[36.8, -1.3]]
@@ -1483,7 +1679,7 @@ class TestPhaseCustomStatusReporting:
         ctx.task_all.return_value = []
 
         gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "i1", {})
-        gen.send(None)  # first yield: parse_kml
+        gen.send(None)  # first yield: parse_and_prepare_kml
 
         ctx.set_custom_status.assert_called()
         statuses = [c[0][0] for c in ctx.set_custom_status.call_args_list]
@@ -1503,7 +1699,7 @@ class TestPhaseCustomStatusReporting:
         gen = _phase_ingestion(ctx, {"blob_name": "test.kml", "tier": "enterprise"}, "i2", {})
         gen.send(None)
         with contextlib.suppress(StopIteration):
-            gen.send(features)
+            gen.send(_parsed(features))
 
         statuses = [c[0][0] for c in ctx.set_custom_status.call_args_list]
         assert any(
@@ -1782,3 +1978,508 @@ class TestHelpersModuleSplit:
         mod = inspect.getmodule(_aggregate_aoi_results)
         assert mod is not None
         assert mod.__name__ == "blueprints.pipeline._aggregation"
+
+
+class TestBlobUrlSplit:
+    """Event Grid blob URLs are parsed once into container and blob name."""
+
+    def test_azurite_url_splits_container_and_nested_blob(self):
+        from blueprints.pipeline._blob_url import _split_blob_url
+
+        url = "http://127.0.0.1:10000/devstoreaccount1/kml-input/analysis/a.kml"
+        assert _split_blob_url(url) == ("kml-input", "analysis/a.kml")
+
+    def test_untrusted_host_yields_empty_parts(self):
+        from blueprints.pipeline._blob_url import _split_blob_url
+
+        assert _split_blob_url("https://evil.example.com/kml-input/a.kml") == ("", "")
+
+    def test_container_only_url_has_empty_blob_name(self):
+        from blueprints.pipeline._blob_url import _split_blob_url
+
+        url = "http://127.0.0.1:10000/devstoreaccount1/kml-input"
+        assert _split_blob_url(url) == ("kml-input", "")
+
+    def test_kml_suffix_check_is_case_insensitive(self):
+        from blueprints.pipeline._blob_url import _has_kml_suffix
+
+        assert _has_kml_suffix("farm.kMl")
+        assert _has_kml_suffix("farm.KMZ")
+        assert not _has_kml_suffix("farm.kml.txt")
+        assert not _has_kml_suffix("")
+
+
+class TestActivityResultCodec:
+    """Large activity results travel as a gzip envelope; small ones pass through."""
+
+    def test_small_result_is_unchanged(self):
+        from treesight.pipeline.codec import pack_result
+
+        data = [{"feature_name": "a", "area_ha": 1.0}]
+        assert pack_result(data) is data
+
+    def test_large_result_round_trips_through_envelope(self):
+        from treesight.pipeline.codec import PACKED_KEY, pack_result, unpack_result
+
+        coords = [[36.8 + i * 1e-5, -1.3] for i in range(500)]
+        data = [{"feature_name": "a", "exterior_coords": coords}]
+        packed = pack_result(data)
+
+        assert set(packed) == {PACKED_KEY}
+        assert len(json.dumps(packed)) < len(json.dumps(data))
+        assert unpack_result(packed) == data
+
+    def test_unpack_passes_through_plain_values(self):
+        from treesight.pipeline.codec import unpack_result
+
+        assert unpack_result([{"a": 1}]) == [{"a": 1}]
+        assert unpack_result({"ref": "x"}) == {"ref": "x"}
+
+    def test_ingestion_unpacks_prepare_aoi_batch_envelope(self):
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+        from treesight.pipeline.codec import pack_result
+
+        ctx = MagicMock()
+        coords = [[36.8 + i * 1e-5, -1.3] for i in range(500)]
+        aois = [{"feature_name": "a", "area_ha": 1.0, "exterior_coords": coords}]
+        gen = _phase_ingestion(ctx, {"blob_name": "t.kml", "tier": "pro"}, "inst-p", {})
+
+        gen.send(None)
+        gen.send(_parsed([{"name": "a"}]))
+        gen.send([pack_result(aois)])
+
+        store_call = ctx.call_activity.call_args_list[-1]
+        assert store_call.args[1]["aois"] == aois
+
+
+class TestParseAndPrepareFusion:
+    """The first AOI batch is prepared inside the parse activity."""
+
+    def test_small_kml_skips_prepare_fan_out(self):
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+        from treesight.pipeline.codec import pack_result
+
+        ctx = MagicMock()
+        aois = [{"feature_name": f"f{i}", "centroid": [1.0, 2.0]} for i in range(3)]
+        gen = _phase_ingestion(ctx, {"blob_name": "t.kml", "tier": "pro"}, "inst-f", {})
+
+        gen.send(None)
+        store = gen.send(_parsed([], pack_result(aois)))
+
+        names = [c.args[0] for c in ctx.call_activity.call_args_list]
+        assert names == ["parse_and_prepare_kml", "store_aoi_claims"]
+        assert store is ctx.call_activity.return_value
+        assert ctx.call_activity.call_args.args[1]["aois"] == aois
+        ctx.set_custom_status.assert_any_call(
+            {"phase": "ingestion", "step": "preparing_aois", "features": 3}
+        )
+
+    def test_inline_aois_precede_fanned_out_remainder(self):
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+
+        ctx = MagicMock()
+        inp = {"blob_name": "t.kml", "tier": "pro", "prepare_aoi_batch_size": 2}
+        gen = _phase_ingestion(ctx, inp, "inst-g", {})
+
+        gen.send(None)
+        gen.send(_parsed([{"name": "c"}], [{"feature_name": "a"}, {"feature_name": "b"}]))
+        batch_calls = [
+            c for c in ctx.call_activity.call_args_list if c.args[0] == "prepare_aoi_batch"
+        ]
+        assert [len(c.args[1]["features"]) for c in batch_calls] == [1]
+
+        gen.send([[{"feature_name": "c"}]])
+        store_call = ctx.call_activity.call_args_list[-1]
+        assert [a["feature_name"] for a in store_call.args[1]["aois"]] == ["a", "b", "c"]
+
+    def test_over_limit_counts_inline_and_remaining(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+
+        ctx = MagicMock()
+        gen = _phase_ingestion(ctx, {"blob_name": "t.kml", "tier": "free"}, "inst-h", {})
+
+        gen.send(None)
+        with pytest.raises(ValueError, match=r"6 AOIs"):
+            gen.send(_parsed([{"name": "x"}] * 2, [{"feature_name": "y"}] * 4))
+
+
+class TestEmptyKmlFastPath:
+    """A KML with no features finishes ingestion without further activities."""
+
+    def test_ingestion_skips_claims_and_metadata(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _phase_ingestion
+
+        ctx = MagicMock()
+        gen = _phase_ingestion(ctx, {"blob_name": "t.kml", "tier": "free"}, "inst-e", {})
+
+        gen.send(None)
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send(_parsed([]))
+
+        result = exc_info.value.value
+        assert [c.args[0] for c in ctx.call_activity.call_args_list] == ["parse_and_prepare_kml"]
+        ctx.task_all.assert_not_called()
+        assert result["aoi_refs"] == []
+        assert result["ingestion"]["feature_count"] == 0
+
+    def test_dispatch_schedules_nothing_without_aois(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _dispatch_acq_ful
+
+        ctx = MagicMock()
+        gen = _dispatch_acq_ful(ctx, {}, {}, {"aoi_refs": []}, "inst-e")
+
+        with pytest.raises(StopIteration) as exc_info:
+            next(gen)
+
+        assert exc_info.value.value == ({}, {})
+        ctx.call_activity.assert_not_called()
+        ctx.call_sub_orchestrator.assert_not_called()
+
+
+class TestWriteMetadataBatching:
+    """Metadata writes fan out one activity per batch of claim refs."""
+
+    def test_refs_are_chunked_and_results_flattened(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _claim_and_describe
+
+        ctx = MagicMock()
+        inp = {"blob_name": "t.kml", "write_metadata_batch_size": 2}
+        aois = [{"feature_name": f"f{i}"} for i in range(3)]
+        refs = [{"ref": f"r{i}", "key": f"f{i}"} for i in range(3)]
+        gen = _claim_and_describe(ctx, inp, "inst-m", {"timestamp": "t1"}, aois)
+
+        next(gen)  # store_aoi_claims
+        gen.send(refs)  # yield write_metadata_batch fan-out
+        batches = [
+            c.args[1]
+            for c in ctx.call_activity.call_args_list
+            if c.args[0] == "write_metadata_batch"
+        ]
+        assert [b["aoi_refs"] for b in batches] == [["r0", "r1"], ["r2"]]
+        assert {b["processing_id"] for b in batches} == {"inst-m"}
+
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send([[{"m": 0}, {"m": 1}], [{"m": 2}]])
+
+        assert exc_info.value.value == (refs, [{"m": 0}, {"m": 1}, {"m": 2}])
+
+
+class TestDownloadBatching:
+    """Serverless downloads run several orders per activity, concurrently."""
+
+    def test_orders_are_chunked_into_batch_activities(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _fulfil_download
+
+        ctx = MagicMock()
+        ready = [{"order_id": f"o{i}", "aoi_feature_name": "A"} for i in range(5)]
+        gen = _fulfil_download(
+            ctx,
+            ready,
+            {"download_batch_size": 2},
+            {"project_name": "p", "timestamp": "t"},
+            {},
+            {},
+            {"A": "blob://aoi/a"},
+            "out",
+        )
+        gen.send(None)
+
+        payloads = [c.args[2] for c in ctx.call_activity_with_retry.call_args_list]
+        assert {c.args[0] for c in ctx.call_activity_with_retry.call_args_list} == {
+            "download_imagery_batch"
+        }
+        assert [[d["outcome"]["order_id"] for d in p["downloads"]] for p in payloads] == [
+            ["o0", "o1"],
+            ["o2", "o3"],
+            ["o4"],
+        ]
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send([[{"order_id": "o0"}, {"order_id": "o1"}], [{"order_id": "o2"}], []])
+        flat = exc_info.value.value["download_results"]
+        assert [r["order_id"] for r in flat] == ["o0", "o1", "o2"]
+
+    def test_no_ready_orders_schedules_nothing(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _fulfil_download
+
+        ctx = MagicMock()
+        gen = _fulfil_download(ctx, [], {}, {}, {}, {}, {}, "out")
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send(None)
+        assert exc_info.value.value == {"download_results": []}
+        ctx.call_activity_with_retry.assert_not_called()
+
+    def test_activity_overlaps_downloads_and_keeps_order(self, monkeypatch):
+        import asyncio
+        import threading
+
+        from blueprints.pipeline import activities
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _download(payload):
+            barrier.wait()  # serial execution would time out here
+            return {"order_id": payload["outcome"]["order_id"]}
+
+        monkeypatch.setattr(activities, "_download_imagery", _download)
+        out = asyncio.run(
+            activities.download_imagery_batch(
+                {"downloads": [{"outcome": {"order_id": "a"}}, {"outcome": {"order_id": "b"}}]}
+            )
+        )
+        assert [r["order_id"] for r in out] == ["a", "b"]
+
+    def test_downloads_share_one_per_worker_bound(self, monkeypatch):
+        import asyncio
+        import threading
+        import time
+
+        from blueprints.pipeline import activities
+
+        lock = threading.Lock()
+        running = peak = 0
+
+        def _download(payload):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+            return {"order_id": payload["outcome"]["order_id"]}
+
+        async def _two_batches():
+            batch = {"downloads": [{"outcome": {"order_id": str(i)}} for i in range(3)]}
+            return await asyncio.gather(
+                activities.download_imagery_batch(batch),
+                activities.download_imagery_batch(batch),
+            )
+
+        monkeypatch.setattr(activities, "_download_imagery", _download)
+        monkeypatch.setattr("treesight.constants.DOWNLOAD_WORKER_CONCURRENCY", 2)
+        activities._download_pool.cache_clear()
+        try:
+            out = asyncio.run(_two_batches())
+        finally:
+            activities._download_pool.cache_clear()
+
+        assert [[r["order_id"] for r in b] for b in out] == [["0", "1", "2"]] * 2
+        assert peak == 2
+
+    def test_download_binds_order_log_context(self, monkeypatch):
+        from blueprints.pipeline import activities
+        from treesight import log
+
+        seen: dict = {}
+
+        def _fake_download(**kwargs):
+            seen.update(log._bound_fields.get() or {})
+            return {"state": "completed"}
+
+        provider = MagicMock()
+        provider.name = "planetary_computer"
+        monkeypatch.setattr(activities, "_payload_provider", lambda payload: provider)
+        monkeypatch.setattr("treesight.storage.client.BlobStorageClient", MagicMock)
+        monkeypatch.setattr("treesight.pipeline.fulfilment.download_imagery", _fake_download)
+
+        activities._download_imagery(
+            {
+                "outcome": {"order_id": "o1", "scene_id": "s1", "aoi_feature_name": "Block A"},
+                "project_name": "p",
+                "timestamp": "t",
+                "output_container": "out",
+                "aoi_bbox": [0, 0, 1, 1],
+            }
+        )
+
+        assert seen == {
+            "activity": "download_imagery",
+            "order_id": "o1",
+            "scene_id": "s1",
+            "aoi": "Block A",
+            "provider": "planetary_computer",
+        }
+        assert log._bound_fields.get() is None
+
+
+class TestAwaitOrders:
+    """Order polling waits on Durable timers between single-check rounds."""
+
+    @staticmethod
+    def _ctx():
+        from datetime import UTC, datetime
+
+        ctx = MagicMock()
+        ctx.current_utc_datetime = datetime(2026, 1, 1, tzinfo=UTC)
+        return ctx
+
+    def test_only_pending_orders_are_rechecked_after_timer(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _await_orders
+
+        ctx = self._ctx()
+        payloads = [{"order_id": "o1", "once": True}, {"order_id": "o2", "once": True}]
+        gen = _await_orders(
+            ctx, "poll_order", payloads, {"poll_interval_seconds": 15}, {"phase": "acquisition"}
+        )
+        gen.send(None)  # first check round
+        gen.send([{"order_id": "o1", "state": "ready"}, {"order_id": "o2", "state": "pending"}])
+
+        fire_at = ctx.create_timer.call_args.args[0]
+        assert (fire_at - ctx.current_utc_datetime).total_seconds() == 15
+        gen.send(None)  # timer fired → second round
+        rechecked = [c.args[2]["order_id"] for c in ctx.call_activity_with_retry.call_args_list]
+        assert rechecked == ["o1", "o2", "o2"]
+
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send([{"order_id": "o2", "state": "ready"}])
+        results = exc_info.value.value
+        assert [r["order_id"] for r in results] == ["o1", "o2"]
+        assert results[1]["poll_count"] == 2
+
+    def test_pending_past_timeout_becomes_acquisition_timeout(self):
+
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _await_orders
+
+        ctx = self._ctx()
+        start = ctx.current_utc_datetime
+        gen = _await_orders(
+            ctx,
+            "poll_and_download",
+            [{"poll": {"order_id": "o1"}}],
+            {"poll_interval_seconds": 60, "poll_timeout_seconds": 30},
+            {"aoi": "Block A"},
+        )
+        pending = {"outcome": {"order_id": "o1", "state": "pending"}, "download": None}
+        gen.send(None)
+        gen.send([pending])
+
+        # The last wait is clamped to the time left, not skipped.
+        fire_at = ctx.create_timer.call_args.args[0]
+        assert (fire_at - start).total_seconds() == 30
+        ctx.current_utc_datetime = fire_at
+        gen.send(None)
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send([pending])
+
+        (result,) = exc_info.value.value
+        assert result["outcome"]["state"] == "acquisition_timeout"
+        assert ctx.create_timer.call_count == 1
+
+    def test_order_failing_past_max_retries_fails_alone(self):
+        import pytest
+
+        from blueprints.pipeline.orchestrator import _await_orders
+
+        ctx = self._ctx()
+        payloads = [{"order_id": "o1", "once": True}, {"order_id": "o2", "once": True}]
+        gen = _await_orders(ctx, "poll_order", payloads, {"max_retries": 1}, {"aoi": "Block A"})
+        gen.send(None)
+        erroring = {"order_id": "o1", "state": "pending", "error": "503"}
+        gen.send([erroring, {"order_id": "o2", "state": "pending"}])
+        ctx.set_custom_status.assert_called_with(
+            {"aoi": "Block A", "step": "awaiting_orders", "pending": 2}
+        )
+        gen.send(None)
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send([dict(erroring), {"order_id": "o2", "state": "ready"}])
+
+        results = exc_info.value.value
+        assert [r["state"] for r in results] == ["failed", "ready"]
+        assert results[0]["error"] == "503"
+
+    def test_poll_payload_requests_single_check(self):
+        from blueprints.pipeline._payloads import _poll_payload
+
+        assert _poll_payload({"order_id": "o1"}, {})["once"] is True
+
+
+class TestAoiPollAndDownload:
+    """Serverless AOIs poll and download each order in a single activity."""
+
+    def test_serverless_aoi_fuses_poll_and_download(self):
+        import pytest
+
+        from blueprints.pipeline.aoi_orchestrator import _aoi_acquire_and_fulfil
+
+        ctx = MagicMock()
+        gen = _aoi_acquire_and_fulfil(
+            ctx,
+            {"composite_search": True},
+            {"project_name": "p", "timestamp": "ts"},
+            {"ref": "blob://aoi/1", "key": "Farm A"},
+            "kml-output",
+        )
+        gen.send(None)  # acquire_composite
+        gen.send(
+            [
+                {"order_id": "o1", "asset_url": "https://a/1.tif", "role": "", "collection": ""},
+                {"order_id": "o2", "asset_url": "https://a/2.tif", "role": "", "collection": ""},
+            ]
+        )  # yield poll_and_download fan-out
+
+        fused = [
+            c.args[2]
+            for c in ctx.call_activity_with_retry.call_args_list
+            if c.args[0] == "poll_and_download"
+        ]
+        assert [p["poll"]["order_id"] for p in fused] == ["o1", "o2"]
+        assert fused[0]["download"]["asset_url"] == "https://a/1.tif"
+        assert fused[0]["download"]["aoi_ref"] == "blob://aoi/1"
+        assert "outcome" not in fused[0]["download"]
+
+        gen.send(
+            [
+                {"outcome": {"order_id": "o1", "state": "ready"}, "download": {"order_id": "o1"}},
+                {"outcome": {"order_id": "o2", "state": "failed"}, "download": None},
+            ]
+        )  # yield post_process fan-out
+        with pytest.raises(StopIteration) as exc_info:
+            gen.send([{"state": "completed", "clipped": True}])
+
+        acquisition, fulfilment = exc_info.value.value
+        assert acquisition["ready_count"] == 1
+        assert acquisition["failed_count"] == 1
+        assert fulfilment["downloads_succeeded"] == 1
+        assert fulfilment["pp_clipped"] == 1
+        names = {c.args[0] for c in ctx.call_activity_with_retry.call_args_list}
+        assert "poll_order" not in names
+        assert "download_imagery" not in names
+
+    def test_activity_downloads_only_ready_orders(self, monkeypatch):
+        from blueprints.pipeline import activities
+
+        outcomes = {"o1": {"state": "ready"}, "o2": {"state": "failed"}}
+        downloads: list[dict] = []
+        monkeypatch.setattr(
+            activities,
+            "_poll_order",
+            lambda p: {"order_id": p["order_id"], **outcomes[p["order_id"]]},
+        )
+        monkeypatch.setattr(
+            activities, "_download_imagery", lambda p: downloads.append(p) or {"state": "ok"}
+        )
+
+        ready = activities.poll_and_download(
+            {"poll": {"order_id": "o1"}, "download": {"asset_url": "u"}}
+        )
+        failed = activities.poll_and_download({"poll": {"order_id": "o2"}, "download": {}})
+
+        assert ready["download"] == {"state": "ok"}
+        assert downloads == [{"asset_url": "u", "outcome": {"order_id": "o1", "state": "ready"}}]
+        assert failed == {"outcome": {"order_id": "o2", "state": "failed"}, "download": None}
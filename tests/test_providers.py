@@ -14,15 +14,17 @@ from treesight.providers.geo_router import (
     Region,
     classify_region,
 )
-from treesight.providers.planetary_computer import PlanetaryComputerProvider
+from treesight.providers.planetary_computer import PlanetaryComputerProvider, clear_search_cache
 from treesight.providers.registry import clear_provider_cache, get_provider
 
 
 @pytest.fixture(autouse=True)
 def _clear_cache():
     clear_provider_cache()
+    clear_search_cache()
     yield
     clear_provider_cache()
+    clear_search_cache()
 
 
 class TestPlanetaryComputerProvider:
@@ -50,6 +52,202 @@ class TestPlanetaryComputerProvider:
         assert status.state == "ready"
         assert status.is_terminal is True
 
+    def test_stac_catalog_is_opened_once_per_api_url(self):
+        from unittest.mock import MagicMock, patch
+
+        from treesight.providers.planetary_computer import _open_catalog
+
+        mock_pystac = MagicMock()
+        _open_catalog.cache_clear()
+        try:
+            with patch.dict(
+                "sys.modules", {"planetary_computer": MagicMock(), "pystac_client": mock_pystac}
+            ):
+                first = _open_catalog("https://stac.example/v1")
+                second = _open_catalog("https://stac.example/v1")
+        finally:
+            _open_catalog.cache_clear()
+
+        assert first is second
+        mock_pystac.Client.open.assert_called_once()
+
+    @staticmethod
+    def _stac_item(item_id: str, bbox: list[float]):
+        from types import SimpleNamespace
+
+        return SimpleNamespace(
+            id=item_id,
+            collection_id="sentinel-2-l2a",
+            bbox=bbox,
+            geometry=None,
+            properties={"datetime": "2026-01-01T00:00:00Z", "eo:cloud_cover": 5.0},
+            assets={"visual": SimpleNamespace(href=f"https://x/{item_id}.tif", media_type="")},
+        )
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2023-06-01T16:18:59.024000Z", "2023-06-01T16:18:59.024000+00:00"),
+            ("2023-06-01T16:18:59Z", "2023-06-01T16:18:59+00:00"),
+            ("2023-06-01T16:18:59", "2023-06-01T16:18:59+00:00"),
+            ("2023-06-01T17:18:59+01:00", "2023-06-01T17:18:59+01:00"),
+        ],
+    )
+    def test_parse_datetime(self, value: str, expected: str):
+        assert PlanetaryComputerProvider._parse_datetime(value).isoformat() == expected
+
+    def test_batched_search_assigns_items_by_footprint(self):
+        from unittest.mock import MagicMock
+
+        near, far = _make_aoi([10.0, 10.0], "near"), _make_aoi([12.0, 12.0], "far")
+        catalog = MagicMock()
+        catalog.search.return_value.items.return_value = [
+            self._stac_item("a", [9.99, 9.99, 10.01, 10.01]),
+            self._stac_item("b", [11.99, 11.99, 12.01, 12.01]),
+            self._stac_item("c", [11.0, 11.0, 11.1, 11.1]),
+        ]
+        p = PlanetaryComputerProvider()
+
+        near_r, far_r = p._search_collection_many(
+            catalog, ["sentinel-2-l2a"], [near, far], ImageryFilters(), None
+        )
+
+        catalog.search.assert_called_once()
+        assert catalog.search.call_args.kwargs["bbox"] == pytest.approx([9.98, 9.98, 12.02, 12.02])
+        assert [r.scene_id for r in near_r] == ["a"]
+        assert [r.scene_id for r in far_r] == ["b"]
+
+    def test_items_intersecting_many_uses_footprint_and_keeps_order(self):
+        from treesight.providers.planetary_computer import _items_intersecting_many
+
+        # Footprint is a thin sliver along the bbox's west edge.
+        sliver = self._stac_item("sliver", [0.0, 0.0, 2.0, 2.0])
+        sliver.geometry = {
+            "type": "Polygon",
+            "coordinates": [[[0.0, 0.0], [0.1, 0.0], [0.1, 2.0], [0.0, 2.0], [0.0, 0.0]]],
+        }
+        items = [
+            self._stac_item("b", [1.0, 1.0, 3.0, 3.0]),
+            sliver,
+            self._stac_item("a", [0, 0, 1, 1]),
+        ]
+
+        west, east, nowhere = _items_intersecting_many(
+            items, [[0.0, 0.5, 0.05, 0.6], [1.5, 1.5, 1.6, 1.6], [9.0, 9.0, 9.1, 9.1]]
+        )
+
+        assert [it.id for it in west] == ["sliver", "a"]
+        assert [it.id for it in east] == ["b"]
+        assert nowhere == []
+        assert _items_intersecting_many([], [[0.0, 0.0, 1.0, 1.0]]) == [[]]
+
+    def test_batched_search_falls_back_when_capped(self, monkeypatch):
+        from unittest.mock import MagicMock
+
+        import treesight.providers.planetary_computer as pc
+
+        monkeypatch.setattr(pc, "STAC_BATCH_SEARCH_MAX_ITEMS", 2)
+        aois = [_make_aoi([10.0, 10.0], "a"), _make_aoi([12.0, 12.0], "b")]
+        catalog = MagicMock()
+        catalog.search.return_value.items.return_value = [
+            self._stac_item("x", [9.99, 9.99, 10.01, 10.01]),
+            self._stac_item("y", [11.99, 11.99, 12.01, 12.01]),
+        ]
+        p = PlanetaryComputerProvider()
+
+        p._search_collection_many(catalog, ["sentinel-2-l2a"], aois, ImageryFilters(), None)
+
+        # One batched query, then one per AOI after hitting the cap.
+        assert catalog.search.call_count == 3
+
+    def test_neighbouring_aois_share_cached_search(self):
+        from unittest.mock import MagicMock
+
+        west, east = _make_aoi([10.04, 10.04], "west"), _make_aoi([10.06, 10.04], "east")
+        catalog = MagicMock()
+        catalog.search.return_value.items.return_value = [
+            self._stac_item("both", [10.0, 10.0, 10.1, 10.1]),
+            self._stac_item("east-only", [10.065, 10.0, 10.1, 10.1]),
+        ]
+        p = PlanetaryComputerProvider()
+
+        west_r = p._search_collection(catalog, ["sentinel-2-l2a"], west, ImageryFilters(), None)
+        east_r = p._search_collection(catalog, ["sentinel-2-l2a"], east, ImageryFilters(), None)
+
+        catalog.search.assert_called_once()
+        assert catalog.search.call_args.kwargs["bbox"] == pytest.approx([10.0, 10.0, 10.1, 10.1])
+        assert [r.scene_id for r in west_r] == ["both"]
+        assert sorted(r.scene_id for r in east_r) == ["both", "east-only"]
+
+    def test_cached_search_expires(self, monkeypatch):
+        from unittest.mock import MagicMock
+
+        import treesight.providers.planetary_computer as pc
+
+        aoi = _make_aoi([10.04, 10.04])
+        catalog = MagicMock()
+        catalog.search.return_value.items.return_value = []
+        p = PlanetaryComputerProvider()
+
+        p._search_collection(catalog, ["sentinel-2-l2a"], aoi, ImageryFilters(), None)
+        p._search_collection(catalog, ["sentinel-2-l2a"], aoi, ImageryFilters(), None)
+        assert catalog.search.call_count == 1
+
+        monkeypatch.setattr(pc, "STAC_SEARCH_CACHE_TTL_SECONDS", 0)
+        p._search_collection(catalog, ["sentinel-2-l2a"], aoi, ImageryFilters(), None)
+        assert catalog.search.call_count == 2
+
+    def test_search_cache_is_safe_across_threads(self, monkeypatch):
+        """A shared provider can search from many threads while entries are evicted."""
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest.mock import MagicMock
+
+        import treesight.providers.planetary_computer as pc
+
+        monkeypatch.setattr(pc, "STAC_SEARCH_CACHE_MAX_ENTRIES", 2)
+        aois = [_make_aoi([10.05 + 0.2 * (i % 4), 10.05]) for i in range(200)]
+        catalog = MagicMock()
+        catalog.search.return_value.items.return_value = []
+        p = PlanetaryComputerProvider()
+
+        def _search(aoi):
+            return p._search_collection(catalog, ["sentinel-2-l2a"], aoi, ImageryFilters(), None)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            assert all(r == [] for r in pool.map(_search, aois))
+        assert len(pc._SEARCH_CACHE) <= 2
+
+    def test_truncated_cell_search_falls_back_to_exact_bbox(self):
+        from unittest.mock import MagicMock
+
+        aoi = _make_aoi([10.04, 10.04])
+        far = [self._stac_item(f"far-{i}", [10.09, 10.09, 10.1, 10.1]) for i in range(20)]
+        exact = [self._stac_item("exact", [10.0, 10.0, 10.1, 10.1])]
+        catalog = MagicMock()
+        catalog.search.return_value.items.side_effect = [far, exact]
+        p = PlanetaryComputerProvider()
+
+        results = p._search_collection(catalog, ["sentinel-2-l2a"], aoi, ImageryFilters(), None)
+
+        assert catalog.search.call_count == 2
+        assert catalog.search.call_args.kwargs["bbox"] == aoi.buffered_bbox
+        assert [r.scene_id for r in results] == ["exact"]
+
+    def test_batched_search_falls_back_across_antimeridian(self):
+        from unittest.mock import MagicMock
+
+        crossing = _make_aoi([180.0, 0.0], "dateline").model_copy(
+            update={"buffered_bbox": [179.98, -0.02, -179.98, 0.02]}
+        )
+        aois = [crossing, _make_aoi([10.0, 10.0], "b")]
+        catalog = MagicMock()
+        catalog.search.return_value.items.return_value = []
+        p = PlanetaryComputerProvider()
+
+        p._search_collection_many(catalog, ["sentinel-2-l2a"], aois, ImageryFilters(), None)
+
+        assert catalog.search.call_count == 2
+
     def test_stub_download_returns_blob_ref(self):
         p = StubPlanetaryComputerProvider()
         ref = p.download("ord-123")
@@ -113,6 +311,26 @@ class TestProviderRegistry:
         p2 = get_provider("planetary_computer")
         assert p1 is p2
 
+    def test_cache_key_ignores_config_order(self):
+        p1 = get_provider("planetary_computer", {"max_items": 3, "fallback": False})
+        p2 = get_provider("planetary_computer", {"fallback": False, "max_items": 3})
+        assert p1 is p2
+
+    def test_distinct_configs_get_distinct_instances(self):
+        naip = get_provider("planetary_computer", {"collections": ["naip"]})
+        s2 = get_provider("planetary_computer", {"collections": ["sentinel-2-l2a"]})
+        assert naip is not s2
+        assert s2._collections == ["sentinel-2-l2a"]
+
+    def test_empty_config_skips_serialisation(self):
+        from unittest.mock import patch
+
+        first = get_provider("planetary_computer")
+        with patch("treesight.providers.registry.json.dumps") as dumps:
+            assert get_provider("planetary_computer", {}) is first
+            assert get_provider("planetary_computer", None) is first
+        dumps.assert_not_called()
+
     def test_unknown_provider_raises(self):
         with pytest.raises(ValueError, match="Unknown imagery provider"):
             get_provider("nonexistent_provider")
@@ -323,6 +541,17 @@ class TestGeoRoutingProvider:
         assert detail[0].extra.get("region") == "us_conus"
         assert detail[0].extra.get("routed_by") == "geo_routing"
 
+    def test_composite_search_many_groups_by_region(self):
+        """Batched composite search keeps input order and tags each AOI's region."""
+        p = self._make()
+        results = p.composite_search_many(
+            [US_AOI, UK_AOI, US_AOI], ImageryFilters(), temporal_count=2
+        )
+        assert len(results) == 3
+        regions = [{r.extra.get("region") for r in batch} for batch in results]
+        assert regions == [{"us_conus"}, {"europe"}, {"us_conus"}]
+        assert all(r.extra.get("routed_by") == "geo_routing" for b in results for r in b)
+
     def test_explicit_collections_override_routing(self):
         """Caller-specified collections override geo-routing."""
         p = self._make()
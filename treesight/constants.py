@@ -15,6 +15,7 @@ import os
 MAX_KML_FILE_SIZE_BYTES = 10_485_760  # 10 MiB
 MAX_FEATURES_PER_KML = 500
 PAYLOAD_OFFLOAD_THRESHOLD_BYTES = 49_152  # 48 KiB
+ACTIVITY_RESULT_PACK_THRESHOLD_BYTES = 4_096  # gzip activity results above 4 KiB
 
 # --- KMZ decompression safety ---
 MAX_KMZ_DECOMPRESSED_BYTES = 50_000_000  # 50 MiB — reject zip bombs
@@ -31,6 +32,15 @@ DEFAULT_MAX_OFF_NADIR_DEG = 30.0
 MAX_OFF_NADIR_DEG_LIMIT = 45.0
 MIN_RESOLUTION_M = 0.01
 DEFAULT_PROVIDER = "planetary_computer"
+# Item cap for one multi-AOI STAC search; hitting it falls back to per-AOI searches.
+STAC_BATCH_SEARCH_MAX_ITEMS = 500
+# Per-worker cache of STAC search responses, keyed on the AOI bbox snapped
+# outward to STAC_SEARCH_CACHE_GRID_DEG so neighbouring AOIs share a query.
+# The TTL stays well inside the lifetime of Planetary Computer SAS tokens.
+STAC_SEARCH_CACHE_GRID_DEG = 0.1
+STAC_SEARCH_CACHE_TTL_SECONDS = 600
+STAC_SEARCH_CACHE_MAX_ENTRIES = 512
+STAC_SEARCH_CACHE_OVERFETCH = 4  # cell searches fetch this multiple of max_items
 RGB_DISPLAY_MIN_PIXELS = 12
 COLLECTION_DISPLAY_GSD_M = {
     "naip": 0.6,  # post-2014 NAIP (0.6 m/px)
@@ -40,11 +50,19 @@ COLLECTION_DISPLAY_GSD_M = {
 NAIP_LEGACY_GSD_M = 1.0  # vintages ≤ 2014 were collected at 1 m/px
 NAIP_LEGACY_MAX_YEAR = 2014
 
+# --- Raster output / warp tuning ---
+RASTER_BLOCK_SIZE_PX = 512  # GeoTIFF tile edge for clip/reproject outputs
+RASTER_WARP_MEM_LIMIT_MB = 512  # GDAL warper working-set cap per chunk
+RASTER_READ_NUM_THREADS = 8  # GDAL tile fetch/decode threads per windowed read
+
 # --- Polling / batching ---
-DEFAULT_POLL_INTERVAL_SECONDS = 30
+DEFAULT_POLL_INTERVAL_SECONDS = 30  # base interval; doubles per pending poll
+MAX_POLL_INTERVAL_SECONDS = 300  # ceiling for the exponential poll back-off
 DEFAULT_POLL_TIMEOUT_SECONDS = 1_800
 DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_BASE_SECONDS = 5
+MAX_RETRY_BACKOFF_SECONDS = 30  # ceiling for a single transfer retry wait
+RETRYABLE_HTTP_STATUSES = frozenset({408, 429, 500, 502, 503, 504})  # transfer retries
 ACTIVITY_RETRY_FIRST_INTERVAL_MS = 5_000  # first back-off for DF activity retries
 ACTIVITY_RETRY_MAX_ATTEMPTS = 3
 # Long-running activities: fewer retries, longer intervals
@@ -52,15 +70,32 @@ LONG_RETRY_FIRST_INTERVAL_MS = 30_000
 LONG_RETRY_MAX_ATTEMPTS = 2
 MAX_POLL_ITERATIONS = 120  # hard upper bound on poll loop iterations (safety net)
 DEFAULT_POLL_BATCH_SIZE = 10
-DEFAULT_DOWNLOAD_BATCH_SIZE = 10
+DEFAULT_DOWNLOAD_BATCH_SIZE = 10  # downloads per download_imagery_batch activity
+# Concurrent imagery downloads per worker process, shared by every download
+# activity on the worker.  Each holds a windowed COG in memory and runs up to
+# RASTER_READ_NUM_THREADS GDAL threads, so this matches the per-worker count
+# the one-order-per-activity fan-out had (maxConcurrentActivityFunctions).
+try:
+    DOWNLOAD_WORKER_CONCURRENCY = int(os.environ.get("DOWNLOAD_WORKER_CONCURRENCY", "8"))
+except (ValueError, TypeError):
+    DOWNLOAD_WORKER_CONCURRENCY = 8
 DEFAULT_POST_PROCESS_BATCH_SIZE = 10
 DEFAULT_ACQUISITION_BATCH_SIZE = 25
+DEFAULT_PREPARE_AOI_BATCH_SIZE = 16  # features per prepare_aoi_batch activity
+DEFAULT_WRITE_METADATA_BATCH_SIZE = 32  # AOIs per write_metadata_batch activity
 BATCH_POLL_INTERVAL_SECONDS = 60
+BATCH_POLL_MAX_INTERVAL_SECONDS = 600
 try:
     DEFAULT_ENRICHMENT_CONCURRENCY = int(os.environ.get("ENRICHMENT_CONCURRENCY", "8"))
 except (ValueError, TypeError):
     DEFAULT_ENRICHMENT_CONCURRENCY = 8
 
+# --- Event ingress ---
+# Per-worker window for dropping Event Grid redeliveries (at-least-once) of a
+# blob write that has already started an orchestration.
+BLOB_TRIGGER_DEDUP_TTL_SECONDS = 300
+BLOB_TRIGGER_DEDUP_MAX_ENTRIES = 4_096
+
 # --- API ---
 API_CONTRACT_VERSION = "2026-03-15.1"
 
@@ -73,6 +108,31 @@ COSMOS_CONTAINER_RUNS = "runs"
 COSMOS_CONTAINER_PIPELINE_STATS = "pipeline_stats"
 PIPELINE_PAYLOADS_CONTAINER = "pipeline-payloads"
 
+# --- Blob transfer tuning ---
+# Shared BlobServiceClient settings.  The SDK already fetches blobs up to
+# 32 MiB in one GET (so KML/metadata blobs fit); larger blobs stream in
+# chunks of this size rather than the SDK's 4 MiB default.
+BLOB_MAX_CHUNK_GET_SIZE_BYTES = 8 * 1024 * 1024
+BLOB_CONNECTION_TIMEOUT_SECONDS = 30
+# Parallel ranged GETs for blobs larger than a single GET; smaller blobs still
+# come back in one request.  Tunable per deployment for larger worker SKUs.
+try:
+    BLOB_DOWNLOAD_MAX_CONCURRENCY = int(os.environ.get("BLOB_DOWNLOAD_CONCURRENCY", "4"))
+except (ValueError, TypeError):
+    BLOB_DOWNLOAD_MAX_CONCURRENCY = 4
+# Blocks staged in the background while the next streamed chunk is fetched.
+# Piped asset downloads use ASSET_PIPE_READ_AHEAD instead (see below).
+BLOB_STAGE_BLOCK_CONCURRENCY = 4
+# Concurrent small-blob uploads (metadata JSON, KML archive) within one activity.
+BLOB_UPLOAD_CONCURRENCY = 8
+# Keep-alive pool for the shared client. urllib3's default of 10 is smaller
+# than the activity fan-out, which silently drops and re-handshakes sockets.
+BLOB_HTTP_POOL_MAXSIZE = 64
+# Server-side blob copies: same-account copies usually finish on the first
+# request; anything still pending is polled at this interval up to the timeout.
+BLOB_COPY_POLL_INTERVAL_SECONDS = 1
+BLOB_COPY_TIMEOUT_SECONDS = 300
+
 # --- Geodesy ---
 METRES_PER_DEGREE_LATITUDE = 111_320.0
 EARTH_RADIUS_M = 6_371_000.0
@@ -96,6 +156,15 @@ ACTIVE_RUN_STATUSES = frozenset({"submitted", "running", "queued"})
 
 # --- HTTP ---
 DEFAULT_HTTP_TIMEOUT_SECONDS = 30.0
+ASSET_STREAM_CHUNK_BYTES = 8 * 1024 * 1024  # block size when piping assets into blob storage
+ASSET_RANGE_CONCURRENCY = 4  # parallel ranged GETs for full-asset downloads
+# When a full-asset download is piped into blob storage, the ranged GETs
+# running ahead and the blocks still staging behind (BLOB_STAGE_BLOCK_CONCURRENCY)
+# both hold chunks.  The piped path uses this many on each side instead, so
+# one transfer holds at most 2 * 2 + 1 chunks (~40 MiB at 8 MiB chunks), the
+# same as the single-stream pipe before ranged reads.  Multiply by
+# DOWNLOAD_WORKER_CONCURRENCY for the worst case per worker.
+ASSET_PIPE_READ_AHEAD = 2
 
 # --- AI inference ---
 AI_MAX_TOKENS = 1000
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from treesight.config import AOI_BUFFER_M, AOI_MAX_AREA_HA
 from treesight.constants import EARTH_RADIUS_M, METRES_PER_DEGREE_LATITUDE
 from treesight.models.aoi import AOI
 from treesight.models.feature import Feature
 
+if TYPE_CHECKING:
+    from pyproj import Geod
+
 
 def prepare_aoi(feature: Feature, buffer_m: float | None = None) -> AOI:
     """Compute bounding box, buffered bbox, geodesic area, centroid from a Feature."""
@@ -42,6 +47,11 @@ def prepare_aoi(feature: Feature, buffer_m: float | None = None) -> AOI:
     )
 
 
+def prepare_aois(features: list[Feature], buffer_m: float | None = None) -> list[AOI]:
+    """Batch form of :func:`prepare_aoi`."""
+    return [prepare_aoi(f, buffer_m) for f in features]
+
+
 def _compute_bbox(coords: list[list[float]]) -> list[float]:
     if not coords:
         return [0.0, 0.0, 0.0, 0.0]
@@ -71,9 +81,7 @@ def _geodesic_area_and_perimeter(coords: list[list[float]]) -> tuple[float, floa
     if len(coords) < 3:
         return 0.0, 0.0
     try:
-        from pyproj import Geod
-
-        geod = Geod(ellps="WGS84")
+        geod = _wgs84_geod()
         lons = [c[0] for c in coords]
         lats = [c[1] for c in coords]
         area_m2, perimeter_m = geod.polygon_area_perimeter(lons, lats)
@@ -82,6 +90,14 @@ def _geodesic_area_and_perimeter(coords: list[list[float]]) -> tuple[float, floa
         return _spherical_area_ha(coords), _haversine_perimeter_km(coords)
 
 
+@lru_cache(maxsize=1)
+def _wgs84_geod() -> Geod:
+    """Shared WGS84 geodesic solver; building one per polygon is wasted work."""
+    from pyproj import Geod
+
+    return Geod(ellps="WGS84")
+
+
 def transform_bbox(
     bbox: list[float],
     src_crs: str,
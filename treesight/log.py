@@ -2,23 +2,34 @@
 
 Emits JSON-structured log records when the ``JsonFormatter`` is installed,
 otherwise falls back to the pipe-delimited format for local development.
-Use ``configure_logging()`` at startup to install the JSON formatter.
+Use ``configure_logging()`` at startup to install the JSON formatter, and
+``log_context()`` to bind per-invocation fields once instead of repeating
+them on every call.
 """
 
 from __future__ import annotations
 
 import contextvars
-import json
 import logging
 import re
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
+import orjson
+
 APP_LOGGER_NAMES = ("treesight", "blueprints", "function_app")
 
 # Correlation ID propagated through async call chains.
 correlation_id: contextvars.ContextVar[str] = contextvars.ContextVar("correlation_id", default="")
 
+# Fields bound for the current invocation (activity name, blob, ...), merged
+# into every JSON record's properties by ``JsonFormatter``.
+_bound_fields: contextvars.ContextVar[dict[str, Any] | None] = contextvars.ContextVar(
+    "log_bound_fields", default=None
+)
+
 logger = logging.getLogger("treesight")
 
 # Strip control characters (newlines, tabs, etc.) to prevent log injection.
@@ -43,13 +54,16 @@ class JsonFormatter(logging.Formatter):
         cid = correlation_id.get("")
         if cid:
             payload["correlation_id"] = cid
-        # Attach custom properties set by log_phase / log_error.
+        # Attach bound context plus custom properties set by log_phase / log_error.
         props: dict[str, Any] = getattr(record, "custom_properties", {})
+        bound = _bound_fields.get()
+        if bound:
+            props = {**bound, **props}
         if props:
             payload["properties"] = props
         if record.exc_info and record.exc_info[1]:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, default=str)
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
 
 def _install_json_handler(logger_name: str, *, level: int) -> None:
@@ -71,37 +85,65 @@ def configure_logging(*, level: int = logging.INFO) -> None:
         _install_json_handler(logger_name, level=level)
 
 
+@contextmanager
+def log_context(*, correlation: str = "", **fields: object) -> Iterator[None]:
+    """Bind *fields* (and optionally the correlation ID) for the enclosed block.
+
+    Nested contexts layer on top of the outer one; everything is restored
+    on exit.
+    """
+    merged = {**(_bound_fields.get() or {}), **{k: _sanitise(v) for k, v in fields.items()}}
+    fields_token = _bound_fields.set(merged)
+    cid_token = correlation_id.set(_sanitise(correlation)) if correlation else None
+    try:
+        yield
+    finally:
+        if cid_token is not None:
+            correlation_id.reset(cid_token)
+        _bound_fields.reset(fields_token)
+
+
 def log_phase(
     phase: str,
     step: str,
     instance_id: str = "",
     blob_name: str = "",
+    *,
+    level: int = logging.INFO,
     **extra: object,
 ) -> str:
-    """Build a structured log line and emit it at INFO level."""
+    """Build a structured log line and emit it at *level* (INFO by default).
+
+    Per-item steps inside fan-out activities pass ``logging.DEBUG`` so a
+    large KML doesn't produce one telemetry record per blob write.  The
+    structured properties are only assembled when *level* is enabled.
+    """
     phase, step = _sanitise(phase), _sanitise(step)
     instance_id = _sanitise(instance_id)
     blob_name = _sanitise(blob_name)
-    props: dict[str, Any] = {"phase": phase, "step": step}
-    if instance_id:
-        props["instance_id"] = instance_id
-    if blob_name:
-        props["blob_name"] = blob_name
-    props.update(extra)
-    cid = correlation_id.get("")
-    if cid:
-        props["correlation_id"] = cid
     # Human-readable message for console / backward compat.
     # Extra kwargs are deliberately excluded from the clear-text msg to
     # avoid logging potentially sensitive data (CodeQL alert #2722).
-    # They remain available in structured custom_properties above.
+    # They remain available in structured custom_properties below.
     parts = [f"phase={phase} step={step}"]
     if instance_id:
         parts.append(f"instance={instance_id}")
     if blob_name:
         parts.append(f"blob={blob_name}")
     msg = " | ".join(parts)
-    logger.info(msg, extra={"custom_properties": props})
+    if not logger.isEnabledFor(level):
+        return msg
+
+    props: dict[str, Any] = {"phase": phase, "step": step}
+    if instance_id:
+        props["instance_id"] = instance_id
+    if blob_name:
+        props["blob_name"] = blob_name
+    props.update(extra)
+    cid = correlation_id.get("")
+    if cid:
+        props["correlation_id"] = cid
+    logger.log(level, msg, extra={"custom_properties": props})
     return msg
 
 
@@ -5,7 +5,7 @@ A feature after geometric processing — includes bounding box, area, centroid.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
 
 from treesight.constants import DEFAULT_AOI_BUFFER_M
 
@@ -54,3 +54,6 @@ class AOI(BaseModel):
         """
         source = self.source_file or "<unspecified>"
         return f"{source}:{self.feature_index}"
+
+
+AOI_LIST_ADAPTER: TypeAdapter[list[AOI]] = TypeAdapter(list[AOI])
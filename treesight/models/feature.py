@@ -5,7 +5,7 @@ Represents a single polygon extracted from a KML file.
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
 
 
 class Feature(BaseModel):
@@ -52,3 +52,8 @@ class Feature(BaseModel):
         """
         source = self.source_file or "<unspecified>"
         return f"{source}:{self.feature_index}"
+
+
+# Built once at import so batch activities validate/dump whole lists in a
+# single pydantic-core call rather than one model_validate per item.
+FEATURE_LIST_ADAPTER: TypeAdapter[list[Feature]] = TypeAdapter(list[Feature])
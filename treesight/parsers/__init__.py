@@ -3,6 +3,7 @@
 import re
 import zipfile
 from io import BytesIO
+from typing import TYPE_CHECKING
 
 from treesight.constants import (
     MAX_KMZ_COMPRESSION_RATIO,
@@ -10,6 +11,9 @@ from treesight.constants import (
     MAX_KMZ_FILE_COUNT,
 )
 
+if TYPE_CHECKING:
+    from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
+
 
 def ensure_closed(ring: list[list[float]]) -> list[list[float]]:
     """Ensure a coordinate ring is closed (first == last).
@@ -93,34 +97,71 @@ def validate_kml_bytes(data: bytes) -> None:
     2. No DOCTYPE declaration (blocks XXE and entity-expansion attacks).
     3. Root element uses a recognised KML namespace.
 
-    Raises ``ValueError`` on any violation.
+    Raises ``ValueError`` on any violation.  ``parse_kml_lxml(...,
+    validate=True)`` applies the same checks during its own parse.
+
+    The document is streamed with ``iterparse`` and each Placemark is
+    released once seen, so checking a large KML does not hold its whole
+    DOM in memory.
     """
+    reject_doctype(data)
+
+    from lxml import etree
+
+    context = etree.iterparse(
+        BytesIO(data),
+        events=("end",),
+        tag="{*}Placemark",
+        resolve_entities=False,
+        no_network=True,
+        huge_tree=False,
+    )
+    try:
+        for _event, placemark in context:
+            release_element(placemark)
+    except etree.XMLSyntaxError as exc:
+        raise ValueError(f"Malformed XML: {exc}") from exc
+
+    check_kml_root(context.root)
+
+
+def reject_doctype(data: bytes) -> None:
+    """Raise ``ValueError`` if *data* declares a DOCTYPE (XXE / entity expansion)."""
     # Fast pre-flight: reject DOCTYPE before even touching the XML parser
     if _DOCTYPE_RE.search(data[:4096]):
         raise ValueError(
             "KML contains a DOCTYPE declaration — DTD/entity declarations are not permitted"
         )
 
-    from lxml import etree
 
-    try:
-        root = etree.fromstring(data)
-    except etree.XMLSyntaxError as exc:
-        raise ValueError(f"Malformed XML: {exc}") from exc
+def release_element(elem: "_Element") -> None:
+    """Drop a parsed subtree and any already-processed preceding siblings."""
+    elem.clear()
+    parent = elem.getparent()
+    while parent is not None and elem.getprevious() is not None:
+        del parent[0]
+
+
+def check_kml_root(root: "_Element") -> None:
+    """Raise ``ValueError`` unless *root* is in a recognised KML namespace."""
+    from lxml import etree
 
-    # Verify KML namespace on root element
     ns = etree.QName(root).namespace or ""
     if ns not in _KML_NAMESPACES:
         raise ValueError(f"Root element namespace '{ns}' is not a recognised KML namespace")
 
 
 from treesight.parsers.fiona_parser import parse_kml_fiona  # noqa: E402
-from treesight.parsers.lxml_parser import parse_kml_lxml  # noqa: E402
+from treesight.parsers.lxml_parser import iter_kml_lxml, parse_kml_lxml  # noqa: E402
 
 __all__ = [
+    "check_kml_root",
     "ensure_closed",
+    "iter_kml_lxml",
     "maybe_unzip",
     "parse_kml_fiona",
     "parse_kml_lxml",
+    "reject_doctype",
+    "release_element",
     "validate_kml_bytes",
 ]
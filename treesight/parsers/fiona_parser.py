@@ -4,8 +4,6 @@ from __future__ import annotations
 
 import concurrent.futures
 import os
-import tempfile
-from pathlib import Path
 from typing import Any, cast
 
 # Disable PROJ network access and cap GDAL HTTP before fiona/GDAL initialises.
@@ -24,12 +22,31 @@ _NAME_KEYS = frozenset({"name", "description"})
 _FIONA_TIMEOUT_SECONDS = 60
 
 
-def _fiona_open_and_collect(tmp_path: str, source_file: str) -> list[dict[str, Any]]:
-    """Open the KML via Fiona and collect raw record dicts. Runs in a worker thread."""
-    import fiona  # type: ignore[import-untyped]  — fiona has no py.typed / type stubs
+def kml_driver_available() -> bool:
+    """Return True when Fiona is installed and its GDAL build can read KML.
+
+    Many GDAL builds ship without the KML driver enabled; callers check this
+    to go straight to lxml instead of spawning a parse thread that can only fail.
+    """
+    try:
+        import fiona  # type: ignore[import-untyped]  — no py.typed / stubs
+    except ImportError:
+        return False
+    return "r" in str(fiona.supported_drivers.get("KML", ""))  # pyright: ignore[reportUnknownMemberType]
+
+
+def _fiona_open_and_collect(kml_bytes: bytes, source_file: str) -> list[dict[str, Any]]:
+    """Open the KML via Fiona and collect raw record dicts. Runs in a worker thread.
+
+    The bytes are served to GDAL from ``/vsimem`` so nothing touches local disk.
+    """
+    from fiona.io import MemoryFile  # type: ignore[import-untyped]  — no py.typed / stubs
 
     records: list[dict[str, Any]] = []
-    with fiona.open(tmp_path, driver="KML") as src:  # pyright: ignore[reportUnknownMemberType]
+    with (
+        MemoryFile(kml_bytes, ext=".kml") as mem,  # pyright: ignore[reportUnknownVariableType]
+        mem.open(driver="KML") as src,  # pyright: ignore[reportUnknownMemberType]
+    ):
         for record in cast(list[dict[str, Any]], src):
             records.append(record)
     return records
@@ -39,56 +56,47 @@ def parse_kml_fiona(kml_bytes: bytes, source_file: str = "") -> list[Feature]:
     """Parse KML bytes using Fiona (GDAL driver). Returns list of Features."""
     features: list[Feature] = []
 
-    with tempfile.NamedTemporaryFile(suffix=".kml", delete=False) as tmp:
-        tmp.write(kml_bytes)
-        tmp_path = tmp.name
-
+    logger.info(
+        "fiona_parser: opening source=%s bytes=%d timeout=%ds",
+        source_file or "inline",
+        len(kml_bytes),
+        _FIONA_TIMEOUT_SECONDS,
+    )
+    # Use an explicit executor (not a context manager) so that on timeout we
+    # call shutdown(wait=False) and return immediately. The context-manager form
+    # calls shutdown(wait=True) on __exit__, which would block until the stuck
+    # GDAL thread finally finishes — defeating the entire purpose of the timeout.
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(_fiona_open_and_collect, kml_bytes, source_file)
     try:
-        logger.info(
-            "fiona_parser: opening source=%s bytes=%d timeout=%ds",
-            source_file or "inline",
-            len(kml_bytes),
-            _FIONA_TIMEOUT_SECONDS,
-        )
-        # Use an explicit executor (not a context manager) so that on timeout we
-        # call shutdown(wait=False) and return immediately. The context-manager form
-        # calls shutdown(wait=True) on __exit__, which would block until the stuck
-        # GDAL thread finally finishes — defeating the entire purpose of the timeout.
-        pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
-        future = pool.submit(_fiona_open_and_collect, tmp_path, source_file)
-        try:
-            records = future.result(timeout=_FIONA_TIMEOUT_SECONDS)
-        except concurrent.futures.TimeoutError as exc:
-            pool.shutdown(wait=False)  # detach; worker stays alive until process exits
-            raise TimeoutError(
-                f"Fiona/GDAL parse timed out after {_FIONA_TIMEOUT_SECONDS}s "
-                f"for {source_file!r} — GDAL may be making a blocked network call"
-            ) from exc
-        pool.shutdown(wait=False)
-
-        for idx, record in enumerate(records):
-            geom: dict[str, Any] = record.get("geometry", {})
-            props: dict[str, Any] = record.get("properties", {})
-            geom_type: str = str(geom.get("type", ""))
-
-            if geom_type == "Polygon":
-                features.append(_polygon_to_feature(geom, props, source_file, len(features)))
-            elif geom_type == "MultiPolygon":
-                for poly_coords in geom.get("coordinates", []):
-                    features.append(
-                        _multi_polygon_part_to_feature(
-                            poly_coords, props, source_file, len(features)
-                        )
-                    )
-            else:
-                logger.warning(
-                    "fiona_parser: skipping non-polygon type=%s index=%d source=%s",
-                    geom_type,
-                    idx,
-                    source_file,
+        records = future.result(timeout=_FIONA_TIMEOUT_SECONDS)
+    except concurrent.futures.TimeoutError as exc:
+        pool.shutdown(wait=False)  # detach; worker stays alive until process exits
+        raise TimeoutError(
+            f"Fiona/GDAL parse timed out after {_FIONA_TIMEOUT_SECONDS}s "
+            f"for {source_file!r} — GDAL may be making a blocked network call"
+        ) from exc
+    pool.shutdown(wait=False)
+
+    for idx, record in enumerate(records):
+        geom: dict[str, Any] = record.get("geometry", {})
+        props: dict[str, Any] = record.get("properties", {})
+        geom_type: str = str(geom.get("type", ""))
+
+        if geom_type == "Polygon":
+            features.append(_polygon_to_feature(geom, props, source_file, len(features)))
+        elif geom_type == "MultiPolygon":
+            for poly_coords in geom.get("coordinates", []):
+                features.append(
+                    _multi_polygon_part_to_feature(poly_coords, props, source_file, len(features))
                 )
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+        else:
+            logger.warning(
+                "fiona_parser: skipping non-polygon type=%s index=%d source=%s",
+                geom_type,
+                idx,
+                source_file,
+            )
 
     logger.info(
         "fiona_parser: done source=%s features=%d",
@@ -162,8 +170,4 @@ def _multi_polygon_part_to_feature(
 
 def _normalise_ring(ring: list[Any]) -> list[list[float]]:
     """Convert coordinate tuples to [lon, lat], discarding altitude."""
-    normalised: list[list[float]] = []
-    for coord in ring:
-        if len(coord) >= 2:
-            normalised.append([float(coord[0]), float(coord[1])])
-    return normalised
+    return [[float(coord[0]), float(coord[1])] for coord in ring if len(coord) >= 2]
@@ -2,51 +2,106 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Iterator
+from functools import cache
+from io import BytesIO
+from typing import TYPE_CHECKING, BinaryIO
 
 from treesight.log import logger
 from treesight.models.feature import Feature
+from treesight.parsers import check_kml_root, reject_doctype
 from treesight.parsers import ensure_closed as _ensure_closed
+from treesight.parsers import release_element as _release
 
 if TYPE_CHECKING:
-    from lxml.etree import _Element  # pyright: ignore[reportPrivateUsage]
+    from lxml.etree import XPath, _Element  # pyright: ignore[reportPrivateUsage]
 
 KML_NS = "{http://www.opengis.net/kml/2.2}"
+_XPATH_NS = {"kml": "http://www.opengis.net/kml/2.2"}
 
 
-def parse_kml_lxml(kml_bytes: bytes, source_file: str = "") -> list[Feature]:
-    """Parse KML bytes using lxml. Fallback when Fiona/GDAL is unavailable."""
+def parse_kml_lxml(
+    kml_bytes: bytes, source_file: str = "", *, validate: bool = False
+) -> list[Feature]:
+    """Parse KML bytes using lxml. Fallback when Fiona/GDAL is unavailable.
+
+    With *validate*, the ``validate_kml_bytes`` checks run as part of this
+    parse rather than as a separate full parse beforehand.
+    """
+    if validate:
+        reject_doctype(kml_bytes)
+    return list(iter_kml_lxml(BytesIO(kml_bytes), source_file=source_file, validate=validate))
+
+
+def iter_kml_lxml(
+    source: BinaryIO, source_file: str = "", *, validate: bool = False
+) -> Iterator[Feature]:
+    """Stream features from a KML file-like object one Placemark at a time.
+
+    Uses ``iterparse`` and clears each Placemark subtree once it has been
+    converted, so peak memory tracks the largest Placemark rather than the
+    whole document.
+
+    With *validate*, a non-KML root namespace or malformed XML raises
+    ``ValueError`` (as ``validate_kml_bytes`` would).  The root is checked
+    before the first feature is yielded; syntax errors surface wherever
+    the stream reaches them.
+    """
     from lxml import etree
 
     # Secure parser: disable external entities and network access to prevent XXE
-    parser = etree.XMLParser(resolve_entities=False, no_network=True, dtd_validation=False)
-    root: _Element = etree.fromstring(kml_bytes, parser=parser)
+    context = etree.iterparse(
+        source,
+        events=("end",),
+        tag=f"{KML_NS}Placemark",
+        resolve_entities=False,
+        no_network=True,
+        dtd_validation=False,
+        huge_tree=False,
+    )
+    index = 0
+    root_checked = not validate
+    try:
+        for _event, placemark in context:
+            if not root_checked:
+                check_kml_root(placemark.getroottree().getroot())
+                root_checked = True
+            for feature in _placemark_features(placemark, index, source_file):
+                yield feature
+                index += 1
+            _release(placemark)
+    except etree.XMLSyntaxError as exc:
+        if not validate:
+            raise
+        raise ValueError(f"Malformed XML: {exc}") from exc
+    if not root_checked:
+        check_kml_root(context.root)
+
+
+def _placemark_features(placemark: _Element, start_index: int, source_file: str) -> list[Feature]:
+    """Build one Feature per valid Polygon inside a Placemark."""
+    name = _text(placemark, "kml:name") or f"Unnamed Feature {start_index}"
+    description = _text(placemark, "kml:description") or ""
+    metadata = _parse_extended_data(placemark)
     features: list[Feature] = []
 
-    for placemark in root.iter(f"{KML_NS}Placemark"):
-        name = _text(placemark, f"{KML_NS}name") or f"Unnamed Feature {len(features)}"
-        description = _text(placemark, f"{KML_NS}description") or ""
-        metadata = _parse_extended_data(placemark)
-
-        for polygon in placemark.iter(f"{KML_NS}Polygon"):
-            exterior, interior = _parse_polygon(polygon)
-            if len(exterior) < 3:
-                logger.warning("Skipping polygon with < 3 coords: %s", name)
-                continue
-            exterior = _ensure_closed(exterior)
-            interior = [_ensure_closed(ring) for ring in interior]
-            features.append(
-                Feature(
-                    name=name,
-                    description=description,
-                    exterior_coords=exterior,
-                    interior_coords=interior,
-                    crs="EPSG:4326",
-                    metadata=metadata,
-                    source_file=source_file,
-                    feature_index=len(features),
-                )
+    for polygon in placemark.iter(f"{KML_NS}Polygon"):
+        exterior, interior = _parse_polygon(polygon)
+        if len(exterior) < 3:
+            logger.warning("Skipping polygon with < 3 coords: %s", name)
+            continue
+        features.append(
+            Feature(
+                name=name,
+                description=description,
+                exterior_coords=_ensure_closed(exterior),
+                interior_coords=[_ensure_closed(ring) for ring in interior],
+                crs="EPSG:4326",
+                metadata=metadata,
+                source_file=source_file,
+                feature_index=start_index + len(features),
             )
+        )
 
     return features
 
@@ -58,13 +113,11 @@ def _parse_polygon(
     exterior: list[list[float]] = []
     interior: list[list[list[float]]] = []
 
-    outer = polygon.find(f"{KML_NS}outerBoundaryIs/{KML_NS}LinearRing/{KML_NS}coordinates")
-    if outer is not None and outer.text:
-        exterior = _parse_coordinates(outer.text)
+    outer = _xpath("kml:outerBoundaryIs/kml:LinearRing/kml:coordinates[1]")(polygon)
+    if outer and outer[0].text:
+        exterior = _parse_coordinates(outer[0].text)
 
-    for inner_elem in polygon.findall(
-        f"{KML_NS}innerBoundaryIs/{KML_NS}LinearRing/{KML_NS}coordinates"
-    ):
+    for inner_elem in _xpath("kml:innerBoundaryIs/kml:LinearRing/kml:coordinates")(polygon):
         if inner_elem.text:
             ring = _parse_coordinates(inner_elem.text)
             if ring:
@@ -76,8 +129,10 @@ def _parse_polygon(
 def _parse_coordinates(text: str) -> list[list[float]]:
     """Parse a KML coordinate string into a list of [lon, lat] pairs."""
     coords: list[list[float]] = []
-    for token in text.strip().split():
-        parts = token.strip().split(",")
+    # split() already drops surrounding whitespace; altitude is never used,
+    # so stop splitting after lon/lat.
+    for token in text.split():
+        parts = token.split(",", 2)
         if len(parts) >= 2:
             try:
                 lon, lat = float(parts[0]), float(parts[1])
@@ -90,18 +145,27 @@ def _parse_coordinates(text: str) -> list[list[float]]:
 def _parse_extended_data(placemark: _Element) -> dict[str, str]:
     """Extract ExtendedData key-value pairs from a Placemark element."""
     metadata: dict[str, str] = {}
-    ext = placemark.find(f"{KML_NS}ExtendedData")
-    if ext is None:
-        return metadata
-    for data in ext.findall(f"{KML_NS}Data"):
+    for data in _xpath("kml:ExtendedData[1]/kml:Data")(placemark):
         key = data.get("name", "")
-        val_elem = data.find(f"{KML_NS}value")
-        if key and val_elem is not None and val_elem.text:
-            metadata[key] = val_elem.text
+        val_elem = _xpath("kml:value[1]")(data)
+        if key and val_elem and val_elem[0].text:
+            metadata[key] = val_elem[0].text
     return metadata
 
 
-def _text(elem: _Element, tag: str) -> str:
-    """Extract text content from a child element, or empty string if absent."""
-    child = elem.find(tag)
-    return child.text.strip() if child is not None and child.text else ""
+def _text(elem: _Element, path: str) -> str:
+    """Extract text content from the first child at *path*, or empty string if absent."""
+    child = _xpath(f"{path}[1]")(elem)
+    return child[0].text.strip() if child and child[0].text else ""
+
+
+@cache
+def _xpath(path: str) -> XPath:
+    """Compile a ``kml:``-prefixed *path* once and reuse it for every Placemark.
+
+    ``find``/``findall`` re-resolve the path on each call, which dominates
+    the per-Placemark cost in large KML files.
+    """
+    from lxml import etree
+
+    return etree.XPath(path, namespaces=_XPATH_NS)
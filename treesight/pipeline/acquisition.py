@@ -5,6 +5,7 @@ Pure business logic for imagery search, order, and polling.
 
 from __future__ import annotations
 
+import random
 import time
 from typing import Any, TypeGuard, get_args
 
@@ -14,11 +15,12 @@ from treesight.constants import (
     DEFAULT_POLL_INTERVAL_SECONDS,
     DEFAULT_POLL_TIMEOUT_SECONDS,
     DEFAULT_RETRY_BASE_SECONDS,
+    MAX_POLL_INTERVAL_SECONDS,
     MAX_POLL_ITERATIONS,
 )
 from treesight.log import log_error, log_phase
 from treesight.models.aoi import AOI
-from treesight.models.imagery import ImageryFilters
+from treesight.models.imagery import ImageryFilters, SearchResult
 from treesight.models.outcomes import ImageryOutcome, ImageryOutcomeState
 from treesight.providers.base import ImageryProvider
 
@@ -84,7 +86,37 @@ def acquire_composite(
         results = provider.composite_search(aoi, filters, temporal_count=temporal_count)  # type: ignore[attr-defined]
     else:
         results = provider.search(aoi, filters)
+    return _place_orders(aoi, provider, results)
 
+
+def acquire_composite_batch(
+    aois: list[AOI],
+    provider: ImageryProvider,
+    filters: ImageryFilters,
+    *,
+    temporal_count: int = 6,
+) -> list[list[dict[str, Any]]]:
+    """:func:`acquire_composite` for several AOIs; one order list per AOI, in order.
+
+    Providers with ``composite_search_many`` answer the whole batch with one
+    catalogue query per collection; others are searched AOI by AOI.
+    """
+    if hasattr(provider, "composite_search_many"):
+        batch = provider.composite_search_many(aois, filters, temporal_count=temporal_count)  # type: ignore[attr-defined]
+        return [
+            _place_orders(aoi, provider, results) for aoi, results in zip(aois, batch, strict=True)
+        ]
+    return [
+        acquire_composite(aoi, provider, filters, temporal_count=temporal_count) for aoi in aois
+    ]
+
+
+def _place_orders(
+    aoi: AOI,
+    provider: ImageryProvider,
+    results: list[SearchResult],
+) -> list[dict[str, Any]]:
+    """Order every search result for *aoi*, or return a single failed outcome."""
     if not results:
         return [
             ImageryOutcome(
@@ -129,6 +161,63 @@ def acquire_composite(
     return orders
 
 
+def poll_delay(attempt: int, base: float, cap: float = MAX_POLL_INTERVAL_SECONDS) -> float:
+    """Return the jittered exponential wait before pending poll *attempt* (0-based).
+
+    The nominal delay is ``min(cap, base * 2**attempt)``; the actual delay is
+    drawn uniformly from ``[nominal, 1.5 * nominal]`` (still capped) so
+    concurrent pollers drift apart without ever waiting less than *base*.
+    """
+    nominal = min(cap, base * (2 ** min(attempt, 32)))
+    return random.uniform(nominal, min(cap, nominal * 1.5))  # noqa: S311 — scheduling jitter, not crypto
+
+
+def _terminal_outcome(
+    state: str,
+    order_id: str,
+    provider: ImageryProvider,
+    poll_count: int,
+    elapsed: float,
+) -> ImageryOutcome:
+    """Map a terminal provider state onto an :class:`ImageryOutcome`."""
+    if _is_imagery_outcome_state(state):
+        return ImageryOutcome(
+            state=state,
+            order_id=order_id,
+            provider=provider.name,
+            poll_count=poll_count,
+            elapsed_seconds=elapsed,
+        )
+    return ImageryOutcome(
+        state="failed",
+        order_id=order_id,
+        provider=provider.name,
+        poll_count=poll_count,
+        elapsed_seconds=elapsed,
+        error=f"Unsupported terminal state '{state}' from provider {provider.name}",
+    )
+
+
+def check_order(order_id: str, provider: ImageryProvider) -> ImageryOutcome:
+    """Poll *order_id* exactly once without waiting.
+
+    Non-terminal orders come back as ``pending`` so the orchestrator can
+    wait on a Durable timer instead of holding an activity slot asleep.
+    A provider error also comes back as ``pending``, with ``error`` set;
+    the orchestrator counts these per order and marks the order
+    ``failed`` once ``max_retries`` is exhausted, as :func:`poll_order` does.
+    """
+    try:
+        status = provider.poll(order_id)
+    except Exception as exc:
+        log_error("acquisition", "poll_retry", str(exc), order_id=order_id)
+        return ImageryOutcome(order_id=order_id, provider=provider.name, error=str(exc))
+    log_phase("acquisition", "poll", order_id=order_id, state=status.state, poll_count=1)
+    if status.is_terminal:
+        return _terminal_outcome(status.state, order_id, provider, 1, 0.0)
+    return ImageryOutcome(order_id=order_id, provider=provider.name, poll_count=1)
+
+
 def poll_order(
     order_id: str,
     provider: ImageryProvider,
@@ -138,9 +227,14 @@ def poll_order(
     max_retries: int = DEFAULT_MAX_RETRIES,
     retry_base: int = DEFAULT_RETRY_BASE_SECONDS,
 ) -> ImageryOutcome:
-    """Poll a single order until terminal state or timeout."""
+    """Poll a single order until terminal state or timeout.
+
+    Pending polls back off exponentially from *poll_interval* (see
+    :func:`poll_delay`) so long-running orders cost fewer provider calls.
+    """
     start = time.monotonic()
     poll_count = 0
+    pending_polls = 0
     retries = 0
 
     for _iteration in range(MAX_POLL_ITERATIONS):
@@ -168,23 +262,8 @@ def poll_order(
             )
 
             if status.is_terminal:
-                if _is_imagery_outcome_state(status.state):
-                    return ImageryOutcome(
-                        state=status.state,
-                        order_id=order_id,
-                        provider=provider.name,
-                        poll_count=poll_count,
-                        elapsed_seconds=time.monotonic() - start,
-                    )
-                return ImageryOutcome(
-                    state="failed",
-                    order_id=order_id,
-                    provider=provider.name,
-                    poll_count=poll_count,
-                    elapsed_seconds=time.monotonic() - start,
-                    error=(
-                        f"Unsupported terminal state '{status.state}' from provider {provider.name}"
-                    ),
+                return _terminal_outcome(
+                    status.state, order_id, provider, poll_count, time.monotonic() - start
                 )
 
         except Exception as exc:
@@ -209,7 +288,9 @@ def poll_order(
             time.sleep(backoff)
             continue
 
-        time.sleep(poll_interval)
+        remaining = poll_timeout - (time.monotonic() - start)
+        time.sleep(max(0.0, min(poll_delay(pending_polls, poll_interval), remaining)))
+        pending_polls += 1
 
     # Exhausted MAX_POLL_ITERATIONS without reaching timeout or terminal state
     return ImageryOutcome(
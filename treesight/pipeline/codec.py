@@ -0,0 +1,36 @@
+"""Compact envelope for large Durable activity results.
+
+Durable Functions persists every activity return value in orchestration
+history and replays it on each resume.  Coordinate-heavy results (prepared
+AOIs) compress well, so large values travel as a gzip+base64 envelope and
+are unpacked at the orchestrator seam.  Small results pass through untouched
+so history stays readable for routine payloads.
+"""
+
+from __future__ import annotations
+
+import base64
+import gzip
+from typing import Any
+
+import orjson
+
+from treesight.constants import ACTIVITY_RESULT_PACK_THRESHOLD_BYTES
+
+PACKED_KEY = "__gz__"
+
+
+def pack_result(data: Any) -> Any:
+    """Return *data* or a ``{"__gz__": ...}`` envelope if it is large."""
+    raw = orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+    if len(raw) < ACTIVITY_RESULT_PACK_THRESHOLD_BYTES:
+        return data
+    compressed = gzip.compress(raw, compresslevel=6, mtime=0)
+    return {PACKED_KEY: base64.b64encode(compressed).decode("ascii")}
+
+
+def unpack_result(value: Any) -> Any:
+    """Inverse of :func:`pack_result`; non-envelope values are returned as-is."""
+    if isinstance(value, dict) and len(value) == 1 and PACKED_KEY in value:
+        return orjson.loads(gzip.decompress(base64.b64decode(value[PACKED_KEY])))
+    return value
@@ -59,8 +59,22 @@ def ensure_parse_kml_output(value: Any) -> list[dict[str, Any]] | dict[str, Any]
     """Validate parse_kml's bifurcated output (inline list or offloaded ref dict)."""
     if isinstance(value, list):
         return ensure_list_of_dicts(value, name="parse_kml")
+    if isinstance(value, dict) and "shards" in value:
+        out = ensure_dict_with_keys(value, name="parse_kml", required=("shards", "count"))
+        if not isinstance(out["shards"], list):
+            raise TypeError("parse_kml output shards must be a list")
+        for index, ref in enumerate(out["shards"]):
+            ensure_nonempty_str_field(ref, name="parse_kml", field="shards", index=index)
+        return out
     if isinstance(value, dict):
         out = ensure_dict_with_keys(value, name="parse_kml", required=("ref",))
         ensure_nonempty_str_field(out["ref"], name="parse_kml", field="ref")
         return out
     raise TypeError("parse_kml activity output must be list[dict] or dict with required keys: ref")
+
+
+def ensure_parse_and_prepare_output(value: Any) -> dict[str, Any]:
+    """Validate parse_and_prepare_kml output: remaining features plus packed AOIs."""
+    out = ensure_dict_with_keys(value, name="parse_and_prepare_kml", required=("features", "aois"))
+    ensure_parse_kml_output(out["features"])
+    return out
@@ -13,14 +13,27 @@ from __future__ import annotations
 
 import io
 import logging
+import random
+import re
 import time
-from typing import Any
-
-import rasterio
-from rasterio.io import MemoryFile
-from rasterio.warp import Resampling, calculate_default_transform, reproject
-from rasterio.windows import from_bounds as window_from_bounds
-
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from treesight.constants import (
+    ASSET_PIPE_READ_AHEAD,
+    ASSET_RANGE_CONCURRENCY,
+    ASSET_STREAM_CHUNK_BYTES,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BASE_SECONDS,
+    MAX_RETRY_BACKOFF_SECONDS,
+    RASTER_BLOCK_SIZE_PX,
+    RASTER_READ_NUM_THREADS,
+    RASTER_WARP_MEM_LIMIT_MB,
+    RETRYABLE_HTTP_STATUSES,
+)
+from treesight.errors import PipelineError
 from treesight.geo import transform_bbox
 from treesight.log import log_error, log_phase
 from treesight.models.aoi import AOI
@@ -28,9 +41,18 @@ from treesight.models.outcomes import DownloadResult, PostProcessResult
 from treesight.providers.base import ImageryProvider
 from treesight.storage.client import BlobStorageClient
 
+if TYPE_CHECKING:
+    import httpx
+    import rasterio
+
 logger = logging.getLogger(__name__)
 
 
+def _elapsed_seconds(start_ns: int) -> float:
+    """Seconds since *start_ns* (a ``perf_counter_ns`` reading), to the millisecond."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000 / 1000
+
+
 def download_imagery(
     outcome: dict[str, Any],
     provider: ImageryProvider,
@@ -42,6 +64,8 @@ def download_imagery(
     aoi_bbox: list[float] | None = None,
     role: str = "",
     collection: str = "",
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    retry_base: float = DEFAULT_RETRY_BASE_SECONDS,
 ) -> dict[str, Any]:
     """Download imagery for a single AOI and upload to blob storage.
 
@@ -52,8 +76,11 @@ def download_imagery(
     The *role* tag (``"detail"`` or ``"temporal"``) controls the output
     sub-path: detail images (NAIP) go to ``imagery/detail/``, temporal
     images (Sentinel-2) go to ``imagery/raw/``.
+
+    Transient network and storage errors are retried up to *max_retries*
+    times with jittered exponential back-off from *retry_base* seconds.
     """
-    start = time.monotonic()
+    start_ns = time.perf_counter_ns()
     order_id = outcome.get("order_id", "")
     scene_id = outcome.get("scene_id", "")
     aoi_name = outcome.get("aoi_feature_name", "")
@@ -64,30 +91,27 @@ def download_imagery(
         subdir = "detail" if role == "detail" else "raw"
         dest_path = f"imagery/{subdir}/{project_name}/{timestamp}/{safe_name}/{scene_id}.tif"
 
-        if asset_url and aoi_bbox:
-            image_bytes = cog_windowed_read(asset_url, aoi_bbox)
-        elif asset_url:
-            image_bytes = fetch_asset_bytes(asset_url)
-        else:
+        content_type = blob_ref.content_type or "image/tiff"
+        if not asset_url:
             raise ValueError(
                 "No asset_url provided — cannot download imagery. Use a stub provider in tests."
             )
-
-        content_type = blob_ref.content_type or "image/tiff"
-        storage.upload_bytes(
-            output_container,
-            dest_path,
-            image_bytes,
-            content_type=content_type,
+        size_bytes, retry_count = _transfer_with_retry(
+            lambda: _transfer_asset(
+                storage, output_container, dest_path, content_type, asset_url, aoi_bbox
+            ),
+            order_id,
+            max_retries=max_retries,
+            retry_base=retry_base,
         )
 
-        duration = time.monotonic() - start
+        duration = _elapsed_seconds(start_ns)
         log_phase(
             "fulfilment",
             "download_complete",
             order_id=order_id,
             blob_path=dest_path,
-            size_bytes=len(image_bytes),
+            size_bytes=size_bytes,
             duration=f"{duration:.1f}s",
         )
 
@@ -99,14 +123,14 @@ def download_imagery(
             blob_path=dest_path,
             adapter_blob_path=blob_ref.blob_path,
             container=output_container,
-            size_bytes=len(image_bytes),
+            size_bytes=size_bytes,
             content_type=content_type,
             download_duration_seconds=duration,
-            retry_count=0,
+            retry_count=retry_count,
         ).model_dump()
 
     except Exception as exc:
-        duration = time.monotonic() - start
+        duration = _elapsed_seconds(start_ns)
         log_error("fulfilment", "download_failed", str(exc), order_id=order_id)
         return DownloadResult(
             state="failed",
@@ -141,7 +165,7 @@ def post_process_imagery(
     detection, area calculations).  The square frame gives regular tiles
     that are easy to compare side-by-side in a UI grid.
     """
-    start = time.monotonic()
+    start_ns = time.perf_counter_ns()
     order_id = download_result.get("order_id", "")
     source_path = download_result.get("blob_path", "")
 
@@ -155,43 +179,37 @@ def post_process_imagery(
         else:
             clipped_path = f"imagery/clipped/{project_name}/{timestamp}/{safe_name}/{scene_id}.tif"
 
-        # Fetch the raw raster bytes from storage
-        raw_bytes = storage.download_bytes(
-            download_result.get("container", output_container),
-            source_path,
-        )
-        source_size = len(raw_bytes)
-
+        source_container = download_result.get("container", output_container)
         clipped = False
         reprojected = False
         source_crs = ""
-        output_bytes = raw_bytes
-
-        with MemoryFile(raw_bytes) as memfile, memfile.open() as src:
-            source_crs = str(src.crs) if src.crs else ""
-
-            if square_frame and aoi.bbox:
-                from treesight.geo import square_bbox
-
-                sq_bbox = square_bbox(aoi.bbox, padding_pct=frame_padding_pct)
-                output_bytes = _clip_to_bbox(src, sq_bbox)
-                clipped = True
-            elif enable_clipping and aoi.exterior_coords:
-                output_bytes = _clip_to_bbox(src, aoi.buffered_bbox)
-                clipped = True
-
-            if enable_reprojection and source_crs and source_crs != target_crs:
-                output_bytes = _reproject_bytes(output_bytes, target_crs)
-                reprojected = True
-
-        storage.upload_bytes(
-            output_container,
-            clipped_path,
-            output_bytes,
-            content_type="image/tiff",
-        )
 
-        duration = time.monotonic() - start
+        if square_frame or enable_clipping or enable_reprojection:
+            raw_bytes = storage.download_bytes(source_container, source_path)
+            source_size = len(raw_bytes)
+            output_bytes, clipped, reprojected, source_crs = _transform_raster(
+                raw_bytes,
+                aoi,
+                target_crs,
+                enable_clipping=enable_clipping,
+                enable_reprojection=enable_reprojection,
+                square_frame=square_frame,
+                frame_padding_pct=frame_padding_pct,
+            )
+            storage.upload_bytes(
+                output_container,
+                clipped_path,
+                output_bytes,
+                content_type="image/tiff",
+            )
+            output_size = len(output_bytes)
+        else:
+            # Pass-through never needs GDAL, or the bytes: copy server-side.
+            source_size = output_size = storage.copy_blob(
+                source_container, source_path, output_container, clipped_path
+            )
+
+        duration = _elapsed_seconds(start_ns)
         log_phase(
             "fulfilment",
             "post_process_complete",
@@ -211,12 +229,12 @@ def post_process_imagery(
             source_crs=source_crs,
             target_crs=target_crs,
             source_size_bytes=source_size,
-            output_size_bytes=len(output_bytes),
+            output_size_bytes=output_size,
             processing_duration_seconds=duration,
         ).model_dump()
 
     except Exception as exc:
-        duration = time.monotonic() - start
+        duration = _elapsed_seconds(start_ns)
         log_error("fulfilment", "post_process_failed", str(exc), order_id=order_id)
         return PostProcessResult(
             state="failed",
@@ -234,6 +252,170 @@ def post_process_imagery(
 # ---------------------------------------------------------------------------
 
 
+def _transfer_asset(
+    storage: BlobStorageClient,
+    output_container: str,
+    dest_path: str,
+    content_type: str,
+    asset_url: str,
+    aoi_bbox: list[float] | None,
+) -> int:
+    """Copy *asset_url* (windowed when *aoi_bbox* is set) to *dest_path*; return bytes written."""
+    if aoi_bbox:
+        image_bytes = cog_windowed_read(asset_url, aoi_bbox)
+        storage.upload_bytes(output_container, dest_path, image_bytes, content_type=content_type)
+        return len(image_bytes)
+    # Full-file fallback: pipe the HTTP body into staged blocks rather
+    # than buffering the whole asset in memory first.  Both stages buffer
+    # chunks, so each gets ASSET_PIPE_READ_AHEAD rather than its own default.
+    _, size_bytes = storage.upload_chunks(
+        output_container,
+        dest_path,
+        iter_asset_chunks(asset_url, concurrency=ASSET_PIPE_READ_AHEAD),
+        content_type=content_type,
+        max_in_flight=ASSET_PIPE_READ_AHEAD,
+    )
+    return size_bytes
+
+
+# GDAL reports /vsicurl/ failures through RasterioIOError text only.
+_GDAL_HTTP_STATUS = re.compile(r"HTTP response code: (\d{3})")
+_GDAL_TRANSIENT_MARKERS = ("curl error", "timed out", "timeout", "connection reset")
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Return whether *exc* is worth retrying (network blip, throttling, 5xx).
+
+    Classification is by exception type and, for HTTP errors, by status
+    (``RETRYABLE_HTTP_STATUSES``).  Pipeline errors flagged ``retryable`` are
+    retried; unflagged ones are still retried when they wrap a transient
+    cause, so a provider that forgets the flag does not turn a dropped
+    connection into a permanent failure.  GDAL read errors are classified
+    by message (see :func:`_is_transient_gdal_error`).
+    """
+    import httpx
+    from azure.core.exceptions import (
+        HttpResponseError,
+        ServiceRequestError,
+        ServiceResponseError,
+    )
+    from rasterio.errors import RasterioIOError
+
+    if isinstance(exc, PipelineError):
+        cause = exc.__cause__
+        return exc.retryable or (isinstance(cause, Exception) and _is_transient(cause))
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_HTTP_STATUSES
+    if isinstance(exc, HttpResponseError):
+        return exc.status_code in RETRYABLE_HTTP_STATUSES
+    if isinstance(exc, RasterioIOError):
+        return _is_transient_gdal_error(exc)
+    return isinstance(
+        exc,
+        (
+            httpx.TransportError,
+            ServiceRequestError,
+            ServiceResponseError,
+            TimeoutError,
+            ConnectionError,
+        ),
+    )
+
+
+def _is_transient_gdal_error(exc: Exception) -> bool:
+    """Return whether a GDAL read error is a network blip rather than a bad asset.
+
+    GDAL raises the same ``RasterioIOError`` for a 404, an expired-SAS 403 or
+    a file it cannot decode; only an HTTP status in
+    ``RETRYABLE_HTTP_STATUSES`` or a curl/timeout failure is retried.
+    """
+    message = str(exc)
+    match = _GDAL_HTTP_STATUS.search(message)
+    if match:
+        return int(match.group(1)) in RETRYABLE_HTTP_STATUSES
+    lowered = message.lower()
+    return any(marker in lowered for marker in _GDAL_TRANSIENT_MARKERS)
+
+
+def _transfer_with_retry(
+    transfer: Callable[[], int],
+    order_id: str,
+    *,
+    max_retries: int,
+    retry_base: float,
+) -> tuple[int, int]:
+    """Run *transfer*, retrying transient failures; return ``(size_bytes, retries)``.
+
+    Each wait is drawn from the upper half of ``retry_base * 2**attempt``
+    (capped at ``MAX_RETRY_BACKOFF_SECONDS``) so concurrent downloads that
+    failed together do not retry in lockstep.
+    """
+    retries = 0
+    while True:
+        try:
+            return transfer(), retries
+        except Exception as exc:
+            if retries >= max_retries or not _is_transient(exc):
+                raise
+            nominal = min(retry_base * 2**retries, MAX_RETRY_BACKOFF_SECONDS)
+            delay = random.uniform(nominal / 2, nominal)  # noqa: S311 — retry jitter, not crypto
+            retries += 1
+            log_error(
+                "fulfilment",
+                "download_retry",
+                str(exc),
+                order_id=order_id,
+                retry=retries,
+                backoff=f"{delay:.1f}s",
+            )
+            time.sleep(delay)
+
+
+def _transform_raster(
+    raw_bytes: bytes,
+    aoi: AOI,
+    target_crs: str,
+    *,
+    enable_clipping: bool,
+    enable_reprojection: bool,
+    square_frame: bool,
+    frame_padding_pct: float,
+) -> tuple[bytes, bool, bool, str]:
+    """Clip and/or reproject GeoTIFF bytes.
+
+    Returns ``(output_bytes, clipped, reprojected, source_crs)``.
+    """
+    import rasterio
+    from rasterio.io import MemoryFile
+
+    clipped = False
+    reprojected = False
+    output_bytes = raw_bytes
+
+    with (
+        rasterio.Env(GDAL_NUM_THREADS=RASTER_READ_NUM_THREADS),
+        MemoryFile(raw_bytes) as memfile,
+        memfile.open() as src,
+    ):
+        source_crs = str(src.crs) if src.crs else ""
+
+        if square_frame and aoi.bbox:
+            from treesight.geo import square_bbox
+
+            sq_bbox = square_bbox(aoi.bbox, padding_pct=frame_padding_pct)
+            output_bytes = _clip_to_bbox(src, sq_bbox)
+            clipped = True
+        elif enable_clipping and aoi.exterior_coords:
+            output_bytes = _clip_to_bbox(src, aoi.buffered_bbox)
+            clipped = True
+
+        if enable_reprojection and source_crs and source_crs != target_crs:
+            output_bytes = _reproject_bytes(output_bytes, target_crs)
+            reprojected = True
+
+    return output_bytes, clipped, reprojected, source_crs
+
+
 def cog_windowed_read(url: str, bbox: list[float]) -> bytes:
     """Read only the pixels covering *bbox* from a Cloud Optimized GeoTIFF.
 
@@ -259,9 +441,22 @@ def cog_windowed_read(url: str, bbox: list[float]) -> bytes:
 
         return get_stub_geotiff()
 
-    log_phase("fulfilment", "cog_read_start", url=url[:120])
+    import rasterio
+    from rasterio.windows import from_bounds as window_from_bounds
+
+    log_phase("fulfilment", "cog_read_start", level=logging.DEBUG, url=url[:120])
 
-    with rasterio.open(url) as src:
+    # GDAL fetches and decodes the window's tiles on a worker pool (one HTTP
+    # range request per tile, multiplexed) instead of one after another.
+    with (
+        rasterio.Env(
+            GDAL_NUM_THREADS=RASTER_READ_NUM_THREADS,
+            GDAL_HTTP_MULTIPLEX="YES",
+            GDAL_HTTP_MERGE_CONSECUTIVE_RANGES="YES",
+            GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR",
+        ),
+        rasterio.open(url) as src,
+    ):
         # Transform bbox from EPSG:4326 → source CRS if needed
         src_bbox = transform_bbox(bbox, "EPSG:4326", str(src.crs))
 
@@ -297,6 +492,9 @@ def cog_windowed_read(url: str, bbox: list[float]) -> bytes:
 
 def _clip_to_bbox(src: rasterio.DatasetReader, bbox: list[float]) -> bytes:
     """Clip an open rasterio dataset to a bounding box, return GeoTIFF bytes."""
+    import rasterio
+    from rasterio.windows import from_bounds as window_from_bounds
+
     src_bbox = transform_bbox(bbox, "EPSG:4326", str(src.crs))
     window = window_from_bounds(*src_bbox, transform=src.transform)
     window = window.intersection(rasterio.windows.Window(0, 0, src.width, src.height))
@@ -305,77 +503,156 @@ def _clip_to_bbox(src: rasterio.DatasetReader, bbox: list[float]) -> bytes:
     win_transform = src.window_transform(window)
 
     buf = io.BytesIO()
-    profile = src.profile.copy()
+    profile = _tiled_gtiff_profile(src.profile, src.dtypes[0])
     profile.update(
-        driver="GTiff",
         height=data.shape[1],
         width=data.shape[2],
         transform=win_transform,
-        compress="deflate",
     )
     with rasterio.open(buf, "w", **profile) as dst:
         dst.write(data)
     return buf.getvalue()
 
 
+def _tiled_gtiff_profile(base: Any, dtype: str) -> dict[str, Any]:
+    """Return a write profile for tiled, LZW-compressed GeoTIFF output.
+
+    Horizontal differencing (predictor 2) suits integer bands; floating-point
+    bands use the floating-point predictor (3) instead.
+    """
+    import numpy as np
+
+    profile = dict(base)
+    profile.update(
+        driver="GTiff",
+        tiled=True,
+        blockxsize=RASTER_BLOCK_SIZE_PX,
+        blockysize=RASTER_BLOCK_SIZE_PX,
+        compress="lzw",
+        predictor=3 if np.issubdtype(np.dtype(dtype), np.floating) else 2,
+        BIGTIFF="IF_SAFER",
+        num_threads="ALL_CPUS",
+    )
+    return profile
+
+
 def _reproject_bytes(tiff_bytes: bytes, target_crs: str) -> bytes:
-    """Reproject GeoTIFF bytes to *target_crs*, return new GeoTIFF bytes."""
+    """Reproject GeoTIFF bytes to *target_crs*, return new GeoTIFF bytes.
+
+    Warps through a multi-threaded ``WarpedVRT`` and writes one output tile
+    at a time, so peak memory is bounded by the block size rather than the
+    full raster.
+    """
+    import os
+
+    import rasterio
+    from rasterio.io import MemoryFile
+    from rasterio.vrt import WarpedVRT
+    from rasterio.warp import Resampling
+
     with MemoryFile(tiff_bytes) as memfile, memfile.open() as src:
         if src.crs is None:
             msg = "Source GeoTIFF has no CRS — cannot reproject"
             raise ValueError(msg)
-        transform, width, height = calculate_default_transform(
-            src.crs,
-            target_crs,
-            src.width,
-            src.height,
-            *src.bounds,
-        )
-        profile = src.profile.copy()
-        profile.update(
+        with WarpedVRT(
+            src,
             crs=target_crs,
-            transform=transform,
-            width=width,
-            height=height,
-        )
+            resampling=Resampling.bilinear,
+            num_threads=os.cpu_count() or 1,
+            warp_mem_limit=RASTER_WARP_MEM_LIMIT_MB,
+        ) as vrt:
+            profile = _tiled_gtiff_profile(src.profile, src.dtypes[0])
+            profile.update(
+                crs=vrt.crs,
+                transform=vrt.transform,
+                width=vrt.width,
+                height=vrt.height,
+            )
 
-        buf = io.BytesIO()
-        with rasterio.open(buf, "w", **profile) as dst:
-            for i in range(1, src.count + 1):
-                reproject(
-                    source=rasterio.band(src, i),
-                    destination=rasterio.band(dst, i),
-                    src_transform=src.transform,
-                    src_crs=src.crs,
-                    dst_transform=transform,
-                    dst_crs=target_crs,
-                    resampling=Resampling.bilinear,
-                )
+            buf = io.BytesIO()
+            with rasterio.open(buf, "w", **profile) as dst:
+                for _, window in dst.block_windows(1):
+                    dst.write(vrt.read(window=window), window=window)
     return buf.getvalue()
 
 
-def fetch_asset_bytes(url: str) -> bytes:
-    """Full-file download fallback for non-COG assets."""
+def iter_asset_chunks(
+    url: str,
+    chunk_size: int = ASSET_STREAM_CHUNK_BYTES,
+    *,
+    concurrency: int = ASSET_RANGE_CONCURRENCY,
+) -> Iterator[bytes]:
+    """Stream a non-COG asset as ``chunk_size`` pieces without buffering it.
+
+    The first request asks for just the first chunk.  If the server honours
+    the range, the rest of the asset is fetched as up to *concurrency*
+    parallel ranged GETs and yielded in order; otherwise the whole body
+    streams over that request.
+    """
     from treesight.config import is_test_mode_enabled
 
     if is_test_mode_enabled():
         from treesight.providers.stub import get_stub_geotiff
 
-        return get_stub_geotiff()
+        yield get_stub_geotiff()
+        return
 
     import httpx
 
-    log_phase("fulfilment", "fetch_start", url=url[:120])
+    log_phase("fulfilment", "fetch_start", level=logging.DEBUG, url=url[:120])
 
-    with (
-        httpx.Client(timeout=300.0, follow_redirects=True, trust_env=False) as client,
-        client.stream("GET", url) as response,
-    ):
+    size = 0
+    with httpx.Client(timeout=300.0, follow_redirects=True, trust_env=False) as client:
+        with client.stream("GET", url, headers={"Range": f"bytes=0-{chunk_size - 1}"}) as response:
+            response.raise_for_status()
+            total = _content_range_total(response) if response.status_code == 206 else None
+            for chunk in response.iter_bytes(chunk_size=chunk_size):
+                size += len(chunk)
+                yield chunk
+        if total is not None and total > size:
+            for chunk in _iter_ranges(client, url, size, total, chunk_size, concurrency):
+                size += len(chunk)
+                yield chunk
+
+    log_phase("fulfilment", "fetch_complete", size_bytes=size)
+
+
+def _content_range_total(response: httpx.Response) -> int | None:
+    """Total asset size from a ``Content-Range: bytes a-b/total`` header, if known."""
+    _, _, total = response.headers.get("content-range", "").rpartition("/")
+    return int(total) if total.isdigit() else None
+
+
+def _iter_ranges(
+    client: httpx.Client, url: str, start: int, total: int, chunk_size: int, concurrency: int
+) -> Iterator[bytes]:
+    """Yield ``[start, total)`` of *url* in order, *concurrency* GETs at a time.
+
+    At most *concurrency* chunks are fetched or held ahead of the consumer,
+    plus the one it is working on; a consumer that buffers too (such as
+    ``upload_chunks``) adds its own.  A server that stops honouring ranges
+    part-way through fails the transfer instead of silently producing a
+    corrupt blob.
+    """
+
+    def _get(offset: int) -> bytes:
+        end = min(offset + chunk_size, total) - 1
+        response = client.get(url, headers={"Range": f"bytes={offset}-{end}"})
         response.raise_for_status()
-        chunks: list[bytes] = []
-        for chunk in response.iter_bytes(chunk_size=1_048_576):
-            chunks.append(chunk)
+        if response.status_code != 206 or len(response.content) != end - offset + 1:
+            raise ValueError(f"Range {offset}-{end} of {url[:120]} not honoured")
+        return response.content
+
+    in_flight: deque[Future[bytes]] = deque()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for offset in range(start, total, chunk_size):
+            if len(in_flight) >= concurrency:
+                yield in_flight.popleft().result()
+            in_flight.append(pool.submit(_get, offset))
+        while in_flight:
+            yield in_flight.popleft().result()
 
-    data = b"".join(chunks)
-    log_phase("fulfilment", "fetch_complete", size_bytes=len(data))
-    return data
+
+def fetch_asset_bytes(url: str) -> bytes:
+    """Full-file download fallback for non-COG assets."""
+    return b"".join(iter_asset_chunks(url))
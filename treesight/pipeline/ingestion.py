@@ -12,7 +12,7 @@ from typing import Any
 
 from treesight import __version__
 from treesight.constants import AOI_METADATA_SCHEMA, AOI_METADATA_SCHEMA_VERSION
-from treesight.geo import prepare_aoi
+from treesight.geo import prepare_aois as _prepare_aois
 from treesight.log import log_phase
 from treesight.models.aoi import AOI
 from treesight.models.blob_event import BlobEvent
@@ -30,8 +30,9 @@ def parse_kml_from_blob(blob_event: BlobEvent, storage: BlobStorageClient) -> li
         raise ValueError("blob_event.blob_name must not be empty")
 
     from treesight.parsers import maybe_unzip, validate_kml_bytes
+    from treesight.parsers.fiona_parser import kml_driver_available, parse_kml_fiona
 
-    logger.info(
+    logger.debug(
         "parse_kml_from_blob: downloading container=%s blob=%s",
         blob_event.container_name,
         blob_event.blob_name,
@@ -45,32 +46,34 @@ def parse_kml_from_blob(blob_event: BlobEvent, storage: BlobStorageClient) -> li
     kml_bytes = maybe_unzip(raw_bytes)
     source_file = PurePosixPath(blob_event.blob_name).name
 
-    # Reject malformed or dangerous XML before parser dispatch
-    validate_kml_bytes(kml_bytes)
-    logger.info(
-        "parse_kml_from_blob: KML validated, dispatching Fiona parser blob=%s",
-        blob_event.blob_name,
-    )
-
-    # Try Fiona first, fall back to lxml
-    try:
-        from treesight.parsers.fiona_parser import parse_kml_fiona
-
-        features = parse_kml_fiona(kml_bytes, source_file=source_file)
-        logger.info(
-            "parse_kml_from_blob: Fiona parsed features=%d blob=%s",
-            len(features),
-            blob_event.blob_name,
-        )
-    except Exception:
-        logger.warning(
-            "parse_kml_from_blob: Fiona failed for %s, falling back to lxml",
+    # Try Fiona first (when its GDAL build reads KML), fall back to lxml
+    features: list[Feature] | None = None
+    if kml_driver_available():
+        # Reject malformed or dangerous XML before handing it to GDAL
+        validate_kml_bytes(kml_bytes)
+        logger.debug(
+            "parse_kml_from_blob: KML validated, dispatching parser blob=%s",
             blob_event.blob_name,
-            exc_info=True,
         )
+        try:
+            features = parse_kml_fiona(kml_bytes, source_file=source_file)
+            logger.info(
+                "parse_kml_from_blob: Fiona parsed features=%d blob=%s",
+                len(features),
+                blob_event.blob_name,
+            )
+        except Exception:
+            logger.warning(
+                "parse_kml_from_blob: Fiona failed for %s, falling back to lxml",
+                blob_event.blob_name,
+                exc_info=True,
+            )
+
+    if features is None:
         from treesight.parsers.lxml_parser import parse_kml_lxml
 
-        features = parse_kml_lxml(kml_bytes, source_file=source_file)
+        # The lxml parser applies the same checks in its own single pass
+        features = parse_kml_lxml(kml_bytes, source_file=source_file, validate=True)
         logger.info(
             "parse_kml_from_blob: lxml parsed features=%d blob=%s",
             len(features),
@@ -116,7 +119,7 @@ def _suggest_tier(feature_count: int, catalog: dict[str, dict]) -> str:
 
 def prepare_aois(features: list[Feature], buffer_m: float | None = None) -> list[AOI]:
     """Fan-out: prepare AOI for each feature."""
-    aois = [prepare_aoi(f, buffer_m=buffer_m) for f in features]
+    aois = _prepare_aois(features, buffer_m=buffer_m)
     log_phase("ingestion", "prepare_aois", aoi_count=len(aois))
     return aois
 
@@ -178,7 +181,7 @@ def write_metadata(
             content_type="application/vnd.google-earth.kml+xml",
         )
 
-    log_phase("ingestion", "write_metadata", metadata_path=metadata_path)
+    log_phase("ingestion", "write_metadata", level=logging.DEBUG, metadata_path=metadata_path)
     return {
         "metadata": metadata_doc,
         "metadata_path": metadata_path,
@@ -28,7 +28,13 @@ class BlobReference:
 
 
 class ImageryProvider(ABC):
-    """Abstract base for all imagery providers (§5.1)."""
+    """Abstract base for all imagery providers (§5.1).
+
+    ``get_provider`` caches one instance per name and config, and batch
+    activities call it from several worker threads at once.  Implementations
+    must therefore keep no per-call state on ``self`` and must lock any
+    shared mutable state they hold.
+    """
 
     def __init__(self, config: ProviderConfig | None = None) -> None:
         """Initialise with optional provider-specific configuration."""
@@ -219,3 +219,31 @@ class GeoRoutingProvider(ImageryProvider):
             r.extra["routed_by"] = self.name
 
         return results
+
+    def composite_search_many(
+        self,
+        aois: list[AOI],
+        filters: ImageryFilters,
+        *,
+        temporal_count: int = 6,
+    ) -> list[list[SearchResult]]:
+        """:meth:`composite_search` for several AOIs, batched per region."""
+        by_region: dict[str, list[int]] = {}
+        regions: dict[str, Region] = {}
+        for i, aoi in enumerate(aois):
+            region = self._route(aoi)
+            regions[region.name] = region
+            by_region.setdefault(region.name, []).append(i)
+
+        out: list[list[SearchResult]] = [[] for _ in aois]
+        for name, indices in by_region.items():
+            pc = self._make_pc(list(regions[name].collections))
+            batch = pc.composite_search_many(
+                [aois[i] for i in indices], filters, temporal_count=temporal_count
+            )
+            for i, results in zip(indices, batch, strict=True):
+                for r in results:
+                    r.extra["region"] = name
+                    r.extra["routed_by"] = self.name
+                out[i] = results
+        return out
@@ -16,16 +16,32 @@ and downloads are returned without any network calls.
 from __future__ import annotations
 
 import logging
+import math
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
 from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from treesight.config import OUTPUT_CONTAINER
+from treesight.constants import (
+    STAC_BATCH_SEARCH_MAX_ITEMS,
+    STAC_SEARCH_CACHE_GRID_DEG,
+    STAC_SEARCH_CACHE_MAX_ENTRIES,
+    STAC_SEARCH_CACHE_OVERFETCH,
+    STAC_SEARCH_CACHE_TTL_SECONDS,
+)
 from treesight.log import log_phase
 from treesight.models.aoi import AOI
 from treesight.models.imagery import ImageryFilters, SearchResult
 from treesight.providers.base import BlobReference, ImageryProvider, OrderStatus, ProviderConfig
 
+if TYPE_CHECKING:
+    from pystac_client import Client
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_API_URL = "https://planetarycomputer.microsoft.com/api/stac/v1"
@@ -54,6 +70,69 @@ _NO_CLOUD_FILTER_COLLECTIONS: frozenset[str] = frozenset({"naip"})
 DEFAULT_MAX_ITEMS = 5
 
 
+@lru_cache(maxsize=4)
+def _open_catalog(api_url: str) -> Client:
+    """Return a shared STAC client for *api_url*.
+
+    ``Client.open`` fetches the landing page and builds a fresh
+    ``requests.Session``; sharing one client per worker lets every search
+    reuse that session's pooled keep-alive connections instead of paying
+    a landing-page round-trip and TLS handshake per activity.
+    """
+    import planetary_computer
+    from pystac_client import Client
+
+    return Client.open(api_url, modifier=planetary_computer.sign_inplace)
+
+
+# (api_url, collections, snapped bbox, datetime, query, max_items) ->
+# (monotonic fetch time, items).  Best-effort and per worker; the lock only
+# covers bookkeeping, never the STAC request itself.
+_SEARCH_CACHE: OrderedDict[tuple[Any, ...], tuple[float, list[Any]]] = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def clear_search_cache() -> None:
+    """Drop all cached STAC search responses."""
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE.clear()
+
+
+def _snap_bbox(bbox: list[float]) -> tuple[float, float, float, float]:
+    """Round *bbox* outward to the ``STAC_SEARCH_CACHE_GRID_DEG`` grid."""
+    g = STAC_SEARCH_CACHE_GRID_DEG
+    return (
+        round(math.floor(bbox[0] / g) * g, 6),
+        round(math.floor(bbox[1] / g) * g, 6),
+        round(math.ceil(bbox[2] / g) * g, 6),
+        round(math.ceil(bbox[3] / g) * g, 6),
+    )
+
+
+def _items_intersecting(items: list[Any], bbox: list[float]) -> list[Any]:
+    """Return the *items* whose footprint intersects *bbox*, in catalogue order."""
+    return _items_intersecting_many(items, [bbox])[0]
+
+
+def _items_intersecting_many(items: list[Any], bboxes: list[list[float]]) -> list[list[Any]]:
+    """For each of *bboxes*, the *items* whose footprint intersects it, in catalogue order.
+
+    Footprints are built and prepared once, then each bbox is tested against
+    all of them in a single vectorised GEOS call.
+    """
+    import shapely
+    from shapely.geometry import shape
+
+    if not items:
+        return [[] for _ in bboxes]
+    footprints = [shape(it.geometry) if it.geometry else shapely.box(*it.bbox) for it in items]
+    shapely.prepare(footprints)
+    return [
+        [items[i] for i in shapely.intersects(footprints, shapely.box(*bbox)).nonzero()[0]]
+        for bbox in bboxes
+    ]
+
+
 class PlanetaryComputerProvider(ImageryProvider):
     def __init__(self, config: ProviderConfig | None = None) -> None:
         super().__init__(config)
@@ -88,10 +167,7 @@ class PlanetaryComputerProvider(ImageryProvider):
                 "use tests.stub_provider.StubPlanetaryComputerProvider instead"
             )
 
-        import planetary_computer
-        from pystac_client import Client
-
-        catalog = Client.open(self.api_url, modifier=planetary_computer.sign_inplace)
+        catalog = _open_catalog(self.api_url)
 
         collections = filters.collections or self._collections
         datetime_range = self._build_datetime_range(filters)
@@ -153,19 +229,137 @@ class PlanetaryComputerProvider(ImageryProvider):
         filters: ImageryFilters,
         datetime_range: str | None,
     ) -> list[SearchResult]:
-        """Run a single STAC search for the given *collections*."""
+        """Run a single STAC search for the given *collections*.
+
+        The search runs over the AOI's bbox snapped outward to a coarse grid
+        and the response is cached, so neighbouring AOIs with the same filters
+        share one upstream call; each AOI then keeps the items whose footprint
+        intersects its own buffered bbox.  The cell search over-fetches, and
+        if it was truncated before ``max_items`` matches were found the exact
+        bbox is searched instead, so results match an uncached search.
+        """
         query = self._build_query(filters, collections)
+        bbox = aoi.buffered_bbox
+        if bbox[0] > bbox[2]:
+            # Antimeridian-crossing boxes don't snap cleanly; search exactly.
+            items = self._stac_items(
+                catalog, collections, bbox, datetime_range, query, self._max_items
+            )
+            return self._to_results(items, aoi)
+
+        cell = _snap_bbox(bbox)
+        fetch = self._max_items * STAC_SEARCH_CACHE_OVERFETCH
+        key = (
+            self.api_url,
+            tuple(collections),
+            cell,
+            datetime_range,
+            repr(sorted(query.items())),
+            fetch,
+        )
+        now = time.monotonic()
+        with _SEARCH_CACHE_LOCK:
+            cached = _SEARCH_CACHE.get(key)
+            if cached is not None and now - cached[0] >= STAC_SEARCH_CACHE_TTL_SECONDS:
+                cached = None
+            if cached is not None:
+                _SEARCH_CACHE.move_to_end(key)
+        if cached is not None:
+            items = cached[1]
+        else:
+            items = self._stac_items(catalog, collections, list(cell), datetime_range, query, fetch)
+            with _SEARCH_CACHE_LOCK:
+                _SEARCH_CACHE[key] = (now, items)
+                _SEARCH_CACHE.move_to_end(key)
+                while len(_SEARCH_CACHE) > STAC_SEARCH_CACHE_MAX_ENTRIES:
+                    _SEARCH_CACHE.popitem(last=False)
+
+        matched = _items_intersecting(items, bbox)
+        if len(items) >= fetch and len(matched) < self._max_items:
+            matched = self._stac_items(
+                catalog, collections, bbox, datetime_range, query, self._max_items
+            )
+        return self._to_results(matched[: self._max_items], aoi)
 
+    @staticmethod
+    def _stac_items(
+        catalog: Any,
+        collections: list[str],
+        bbox: list[float],
+        datetime_range: str | None,
+        query: dict[str, Any],
+        max_items: int,
+    ) -> list[Any]:
+        """Run one STAC search and materialise its items."""
         stac_search = catalog.search(
             collections=collections,
-            bbox=aoi.buffered_bbox,
+            bbox=bbox,
             datetime=datetime_range,
             query=query,
-            max_items=self._max_items,
+            max_items=max_items,
         )
+        return list(stac_search.items())
+
+    def _search_collection_many(
+        self,
+        catalog: Any,
+        collections: list[str],
+        aois: list[AOI],
+        filters: ImageryFilters,
+        datetime_range: str | None,
+    ) -> list[list[SearchResult]]:
+        """Run one STAC search covering every AOI and split the items per AOI.
+
+        Items are assigned by footprint intersection with each AOI's buffered
+        bbox — the same test the per-AOI bbox search applies server-side — and
+        each AOI keeps its first ``max_items`` in catalogue order, matching
+        :meth:`_search_collection`.  Antimeridian-crossing AOIs, or a result
+        set that hits ``STAC_BATCH_SEARCH_MAX_ITEMS`` (and so may be
+        truncated), fall back to one search per AOI.
+        """
+
+        def _per_aoi() -> list[list[SearchResult]]:
+            return [
+                self._search_collection(catalog, collections, aoi, filters, datetime_range)
+                for aoi in aois
+            ]
+
+        bboxes = [aoi.buffered_bbox for aoi in aois]
+        if any(b[0] > b[2] for b in bboxes):
+            return _per_aoi()
+
+        union = [
+            min(b[0] for b in bboxes),
+            min(b[1] for b in bboxes),
+            max(b[2] for b in bboxes),
+            max(b[3] for b in bboxes),
+        ]
+        items = self._stac_items(
+            catalog,
+            collections,
+            union,
+            datetime_range,
+            self._build_query(filters, collections),
+            STAC_BATCH_SEARCH_MAX_ITEMS,
+        )
+        if len(items) >= STAC_BATCH_SEARCH_MAX_ITEMS:
+            logger.info(
+                "Batched %s search hit %d items for %d AOIs, searching per AOI",
+                ",".join(collections),
+                len(items),
+                len(aois),
+            )
+            return _per_aoi()
+
+        return [
+            self._to_results(matched[: self._max_items], aoi)
+            for matched, aoi in zip(_items_intersecting_many(items, bboxes), aois, strict=True)
+        ]
 
+    def _to_results(self, items: Iterable[Any], aoi: AOI) -> list[SearchResult]:
+        """Convert STAC items to search results, least cloudy first."""
         results: list[SearchResult] = []
-        for item in stac_search.items():
+        for item in items:
             coll_id = item.collection_id or ""
             asset_key = COLLECTION_ASSET_KEYS.get(coll_id, self._asset_key)
             asset = item.assets.get(asset_key)
@@ -270,21 +464,65 @@ class PlanetaryComputerProvider(ImageryProvider):
                 "use tests.stub_provider.StubPlanetaryComputerProvider instead"
             )
 
-        import planetary_computer
-        from pystac_client import Client
+        catalog = _open_catalog(self.api_url)
+        datetime_range = self._build_datetime_range(filters)
+        naip_results = self._search_collection(
+            catalog, ["naip"], aoi, filters, datetime_range=datetime_range
+        )
+        s2_results = self._search_collection(
+            catalog, ["sentinel-2-l2a"], aoi, filters.model_copy(), datetime_range=datetime_range
+        )
+        return self._compose(aoi, naip_results, s2_results, temporal_count)
+
+    def composite_search_many(
+        self,
+        aois: list[AOI],
+        filters: ImageryFilters,
+        *,
+        temporal_count: int = 6,
+    ) -> list[list[SearchResult]]:
+        """:meth:`composite_search` for several AOIs with one STAC query per collection.
+
+        Returns one result list per AOI, in input order.
+        """
+        if len(aois) <= 1:
+            return [self.composite_search(a, filters, temporal_count=temporal_count) for a in aois]
+
+        log_phase(
+            "acquisition",
+            "composite_search_many",
+            aoi_count=len(aois),
+            provider=self.name,
+        )
+
+        if self._stub_mode:
+            raise NotImplementedError(
+                "stub_mode is no longer supported inline — "
+                "use tests.stub_provider.StubPlanetaryComputerProvider instead"
+            )
 
-        catalog = Client.open(self.api_url, modifier=planetary_computer.sign_inplace)
+        catalog = _open_catalog(self.api_url)
+        datetime_range = self._build_datetime_range(filters)
+        naip = self._search_collection_many(catalog, ["naip"], aois, filters, datetime_range)
+        s2 = self._search_collection_many(
+            catalog, ["sentinel-2-l2a"], aois, filters.model_copy(), datetime_range
+        )
+        return [
+            self._compose(aoi, naip_results, s2_results, temporal_count)
+            for aoi, naip_results, s2_results in zip(aois, naip, s2, strict=True)
+        ]
 
+    def _compose(
+        self,
+        aoi: AOI,
+        naip_results: list[SearchResult],
+        s2_results: list[SearchResult],
+        temporal_count: int,
+    ) -> list[SearchResult]:
+        """Combine the best NAIP scene with the Sentinel-2 temporal series."""
         results: list[SearchResult] = []
 
         # --- NAIP detail layer (best single image) ---
-        naip_results = self._search_collection(
-            catalog,
-            ["naip"],
-            aoi,
-            filters,
-            datetime_range=self._build_datetime_range(filters),
-        )
         if naip_results:
             best_naip = naip_results[0]
             best_naip.extra["role"] = "detail"
@@ -302,14 +540,6 @@ class PlanetaryComputerProvider(ImageryProvider):
             )
 
         # --- Sentinel-2 temporal series ---
-        s2_filters = filters.model_copy()
-        s2_results = self._search_collection(
-            catalog,
-            ["sentinel-2-l2a"],
-            aoi,
-            s2_filters,
-            datetime_range=self._build_datetime_range(s2_filters),
-        )
         for r in s2_results[:temporal_count]:
             r.extra["role"] = "temporal"
             results.append(r)
@@ -354,11 +584,15 @@ class PlanetaryComputerProvider(ImageryProvider):
 
     @staticmethod
     def _parse_datetime(value: str | None) -> datetime:
-        """Parse an ISO datetime string, falling back to now(UTC)."""
+        """Parse an ISO datetime string, falling back to now(UTC).
+
+        ``fromisoformat`` accepts the ``Z`` suffix natively on 3.11+, so STAC
+        timestamps parse without an intermediate string copy.
+        """
         if not value:
             return datetime.now(UTC)
         try:
-            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+            dt = datetime.fromisoformat(value)
             return dt if dt.tzinfo else dt.replace(tzinfo=UTC)
         except (ValueError, TypeError):
             return datetime.now(UTC)
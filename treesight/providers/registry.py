@@ -2,10 +2,22 @@
 
 from __future__ import annotations
 
+import importlib
+import json
+
 from treesight.providers.base import ImageryProvider, ProviderConfig
 
 _registry: dict[str, type[ImageryProvider]] = {}
-_cache: dict[tuple[str, str, str, str, str], ImageryProvider] = {}
+_cache: dict[tuple[str, str], ImageryProvider] = {}
+
+# Built-in providers, imported on first use: name -> (module, class name).
+_BUILTIN_PROVIDERS: dict[str, tuple[str, str]] = {
+    "planetary_computer": (
+        "treesight.providers.planetary_computer",
+        "PlanetaryComputerProvider",
+    ),
+    "geo_routing": ("treesight.providers.geo_router", "GeoRoutingProvider"),
+}
 
 
 def register_provider(name: str, cls: type[ImageryProvider]) -> None:
@@ -13,33 +25,31 @@ def register_provider(name: str, cls: type[ImageryProvider]) -> None:
     _registry[name] = cls
 
 
+def _config_key(config: ProviderConfig) -> str:
+    """Canonical, order-independent fingerprint of a provider config."""
+    if not config:
+        return "{}"
+    return json.dumps(config, sort_keys=True, separators=(",", ":"), default=str)
+
+
 def get_provider(name: str, config: ProviderConfig | None = None) -> ImageryProvider:
-    """Return a (cached) provider instance, creating it if necessary."""
+    """Return a (cached) provider instance, creating it if necessary.
+
+    Instances are keyed by *name* and the full *config*, so any setting a
+    provider reads (``collections``, ``max_items``, ``api_url`` …) yields a
+    distinct instance rather than silently sharing the first one built.
+    """
     config = config or {}
-    extra = config.get("extra_params")
-    extra_key = str(sorted(extra.items())) if isinstance(extra, dict) else ""
-    cache_key = (
-        name,
-        str(config.get("api_base_url", "")),
-        str(config.get("auth_mechanism", "")),
-        str(config.get("keyvault_secret", "")),
-        extra_key,
-    )
+    cache_key = (name, _config_key(config))
     if cache_key in _cache:
         return _cache[cache_key]
 
     if name not in _registry:
         # Lazy-import known providers
-        if name == "planetary_computer":
-            from treesight.providers.planetary_computer import PlanetaryComputerProvider
-
-            register_provider("planetary_computer", PlanetaryComputerProvider)
-        elif name == "geo_routing":
-            from treesight.providers.geo_router import GeoRoutingProvider
-
-            register_provider("geo_routing", GeoRoutingProvider)
-        else:
+        if name not in _BUILTIN_PROVIDERS:
             raise ValueError(f"Unknown imagery provider: {name}")
+        module_name, class_name = _BUILTIN_PROVIDERS[name]
+        register_provider(name, getattr(importlib.import_module(module_name), class_name))
 
     provider = _registry[name](config)
     _cache[cache_key] = provider
@@ -187,3 +187,12 @@ class StubPlanetaryComputerProvider(PlanetaryComputerProvider):
             )
 
         return results
+
+    def composite_search_many(
+        self,
+        aois: list[AOI],
+        filters: ImageryFilters,
+        *,
+        temporal_count: int = 6,
+    ) -> list[list[SearchResult]]:
+        return [self.composite_search(a, filters, temporal_count=temporal_count) for a in aois]
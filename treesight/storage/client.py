@@ -2,16 +2,41 @@
 
 from __future__ import annotations
 
-import json
+import base64
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import PurePosixPath
 from typing import Any, ClassVar, cast
 
+import orjson
 from azure.storage.blob import BlobServiceClient, ContentSettings, StorageStreamDownloader
 
 from treesight.config import STORAGE_ACCOUNT_NAME, STORAGE_CONNECTION_STRING
+from treesight.constants import (
+    BLOB_CONNECTION_TIMEOUT_SECONDS,
+    BLOB_COPY_POLL_INTERVAL_SECONDS,
+    BLOB_COPY_TIMEOUT_SECONDS,
+    BLOB_DOWNLOAD_MAX_CONCURRENCY,
+    BLOB_HTTP_POOL_MAXSIZE,
+    BLOB_MAX_CHUNK_GET_SIZE_BYTES,
+    BLOB_STAGE_BLOCK_CONCURRENCY,
+)
 from treesight.log import log_phase
 
 _client: BlobServiceClient | None = None
+_client_lock = threading.Lock()
+
+# Applied to the shared client so every activity on the worker gets the same
+# transfer sizes and pooled connections.
+_CLIENT_OPTIONS: dict[str, Any] = {
+    "max_chunk_get_size": BLOB_MAX_CHUNK_GET_SIZE_BYTES,
+    "connection_timeout": BLOB_CONNECTION_TIMEOUT_SECONDS,
+}
 
 
 def _safe_blob_path(blob_path: str) -> str:
@@ -31,24 +56,56 @@ def get_blob_service_client() -> BlobServiceClient:
 
     Uses a connection string when ``AzureWebJobsStorage`` is set, otherwise
     falls back to managed identity via ``AzureWebJobsStorage__accountName``.
+    Initialisation is lock-guarded so concurrent invocations on one worker
+    share a single HTTP pool and credential cache.
     """
     global _client
-    if _client is None:
-        if STORAGE_CONNECTION_STRING:
-            _client = BlobServiceClient.from_connection_string(STORAGE_CONNECTION_STRING)
-        elif STORAGE_ACCOUNT_NAME:
-            from azure.identity import DefaultAzureCredential
-
-            account_url = f"https://{STORAGE_ACCOUNT_NAME}.blob.core.windows.net"
-            _client = BlobServiceClient(account_url, credential=DefaultAzureCredential())
-        else:
-            raise RuntimeError(
-                "Storage is not configured: set AzureWebJobsStorage or "
-                "AzureWebJobsStorage__accountName"
-            )
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            _client = _build_blob_service_client()
     return _client
 
 
+def _pooled_transport() -> Any:
+    """Return a requests transport whose keep-alive pool fits the fan-out."""
+    import requests
+    from azure.core.pipeline.transport import RequestsTransport
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=BLOB_HTTP_POOL_MAXSIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return RequestsTransport(
+        session=session,
+        session_owner=False,
+        connection_timeout=BLOB_CONNECTION_TIMEOUT_SECONDS,
+    )
+
+
+@lru_cache(maxsize=4)
+def _blob_service_client_for(connection_string: str) -> BlobServiceClient:
+    """Return a shared client for an explicit connection string (tests, tooling)."""
+    return BlobServiceClient.from_connection_string(
+        connection_string, **_CLIENT_OPTIONS, transport=_pooled_transport()
+    )
+
+
+def _build_blob_service_client() -> BlobServiceClient:
+    options = {**_CLIENT_OPTIONS, "transport": _pooled_transport()}
+    if STORAGE_CONNECTION_STRING:
+        return BlobServiceClient.from_connection_string(STORAGE_CONNECTION_STRING, **options)
+    if STORAGE_ACCOUNT_NAME:
+        from azure.identity import DefaultAzureCredential
+
+        account_url = f"https://{STORAGE_ACCOUNT_NAME}.blob.core.windows.net"
+        return BlobServiceClient(account_url, credential=DefaultAzureCredential(), **options)
+    raise RuntimeError(
+        "Storage is not configured: set AzureWebJobsStorage or AzureWebJobsStorage__accountName"
+    )
+
+
 class BlobStorageClient:
     """Thin wrapper around Azure Blob SDK for pipeline operations."""
 
@@ -56,7 +113,7 @@ class BlobStorageClient:
 
     def __init__(self, connection_string: str | None = None) -> None:
         if connection_string:
-            self._client = BlobServiceClient.from_connection_string(connection_string)
+            self._client = _blob_service_client_for(connection_string)
         else:
             self._client = get_blob_service_client()
 
@@ -90,23 +147,127 @@ class BlobStorageClient:
             overwrite=overwrite,
             content_settings=ContentSettings(content_type=content_type),
         )
-        log_phase("storage", "upload", blob_path=blob_path, container=container, size=len(data))
+        log_phase(
+            "storage",
+            "upload",
+            level=logging.DEBUG,
+            blob_path=blob_path,
+            container=container,
+            size=len(data),
+        )
         return blob.url
 
+    def upload_chunks(
+        self,
+        container: str,
+        blob_path: str,
+        chunks: Iterable[bytes],
+        content_type: str = "application/octet-stream",
+        *,
+        max_in_flight: int = BLOB_STAGE_BLOCK_CONCURRENCY,
+    ) -> tuple[str, int]:
+        """Stream *chunks* into a block blob and return ``(url, size)``.
+
+        Each chunk is staged as one block and the list is committed at the
+        end.  Up to *max_in_flight* blocks upload in the background while the
+        next chunk is read, so the source download and the blob upload
+        overlap; this side holds at most *max_in_flight* + 1 chunks, on top of
+        whatever the *chunks* iterator buffers itself.
+        """
+        blob_path = _safe_blob_path(blob_path)
+        self.ensure_container(container)
+        blob = self._client.get_blob_client(container, blob_path)
+        block_ids: list[str] = []
+        size = 0
+        in_flight: deque[Future[Any]] = deque()
+        with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                if len(in_flight) >= max_in_flight:
+                    in_flight.popleft().result()
+                block_id = base64.b64encode(f"{len(block_ids):08d}".encode()).decode("ascii")
+                in_flight.append(pool.submit(blob.stage_block, block_id, chunk))
+                block_ids.append(block_id)
+                size += len(chunk)
+            for staged in in_flight:
+                staged.result()
+        blob.commit_block_list(
+            block_ids,  # pyright: ignore[reportArgumentType]
+            content_settings=ContentSettings(content_type=content_type),
+        )
+        log_phase(
+            "storage",
+            "upload",
+            level=logging.DEBUG,
+            blob_path=blob_path,
+            container=container,
+            size=size,
+        )
+        return blob.url, size
+
     def upload_json(self, container: str, blob_path: str, data: dict[str, Any]) -> str:
         """Serialise *data* as JSON and upload it."""
-        payload = json.dumps(data, indent=2, default=str).encode("utf-8")
+        payload = orjson.dumps(
+            data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
         return self.upload_bytes(container, blob_path, payload, content_type="application/json")
 
+    def copy_blob(
+        self,
+        src_container: str,
+        src_path: str,
+        dest_container: str,
+        dest_path: str,
+    ) -> int:
+        """Copy a blob within this account server-side and return its size.
+
+        The bytes never pass through the worker.  Same-account copies
+        normally complete on the initial request; a pending copy is polled
+        until it finishes or ``BLOB_COPY_TIMEOUT_SECONDS`` elapses.
+        """
+        src_path = _safe_blob_path(src_path)
+        dest_path = _safe_blob_path(dest_path)
+        self.ensure_container(dest_container)
+        src = self._client.get_blob_client(src_container, src_path)
+        dest = self._client.get_blob_client(dest_container, dest_path)
+        dest.start_copy_from_url(src.url)
+
+        deadline = time.monotonic() + BLOB_COPY_TIMEOUT_SECONDS
+        props = dest.get_blob_properties()
+        while props.copy.status == "pending":
+            if time.monotonic() >= deadline:
+                dest.abort_copy(props.copy.id)
+                raise TimeoutError(f"Copy to {dest_container}/{dest_path} did not complete")
+            time.sleep(BLOB_COPY_POLL_INTERVAL_SECONDS)
+            props = dest.get_blob_properties()
+        if props.copy.status not in (None, "success"):
+            msg = f"Copy to {dest_container}/{dest_path} {props.copy.status}: "
+            raise RuntimeError(msg + str(props.copy.status_description or ""))
+
+        log_phase(
+            "storage",
+            "copy",
+            level=logging.DEBUG,
+            blob_path=dest_path,
+            container=dest_container,
+            size=props.size,
+        )
+        return int(props.size)
+
     def download_bytes(self, container: str, blob_path: str) -> bytes:
-        """Download a blob and return its raw bytes."""
+        """Download a blob and return its raw bytes.
+
+        The SDK reads straight into a single buffer; blobs above the
+        single-GET size are fetched as parallel ranged GETs.
+        """
         blob_path = _safe_blob_path(blob_path)
         blob = self._client.get_blob_client(container, blob_path)
-        return blob.download_blob().readall()
+        return blob.download_blob(max_concurrency=BLOB_DOWNLOAD_MAX_CONCURRENCY).readall()
 
     def download_json(self, container: str, blob_path: str) -> dict[str, Any]:
         """Download and deserialise a JSON blob as a dict."""
-        raw = json.loads(self.download_bytes(container, blob_path))
+        raw = orjson.loads(self.download_bytes(container, blob_path))
         if not isinstance(raw, dict):
             msg = f"Expected JSON object in {container}/{blob_path}, got {type(raw).__name__}"
             raise TypeError(msg)
@@ -114,7 +275,7 @@ class BlobStorageClient:
 
     def download_json_list(self, container: str, blob_path: str) -> list[dict[str, Any]]:
         """Download and deserialise a JSON blob as a list of dicts."""
-        raw = json.loads(self.download_bytes(container, blob_path))
+        raw = orjson.loads(self.download_bytes(container, blob_path))
         if not isinstance(raw, list):
             msg = f"Expected JSON array in {container}/{blob_path}, got {type(raw).__name__}"
             raise TypeError(msg)